@@ -12,13 +12,26 @@ class Settings(BaseSettings):
     # Connection Pool Settings
     MIN_CONNECTIONS: int = 1
     MAX_CONNECTIONS: int = 10
+    # Seconds a request waits for a free pooled connection before failing with 503
+    POOL_ACQUIRE_TIMEOUT: float = 5.0
+    # Per-connection LRU of server-side prepared statements, keyed by SQL text (0 disables,
+    # which is required behind PgBouncer in transaction pooling mode)
+    STATEMENT_CACHE_SIZE: int = 256
+    # Maximum named statements tracked for /crud/prepared/statements (least recently used evicted)
+    NAMED_STATEMENT_CACHE_SIZE: int = 1024
     
     # Application Settings
     DEBUG: bool = True
     
+    # Secret used to sign pagination cursors (random per process if unset)
+    CURSOR_SECRET: str = ""
+    
     # Database URL (computed field)
     DATABASE_URL: str = ""
     
+    # Read-replica URL for read-only endpoints (reads use the primary if unset)
+    DATABASE_RO_URL: str = ""
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,16 +1,21 @@
+import asyncio
 import asyncpg
 import logging
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.responses import dumps
 
 logger = logging.getLogger(__name__)
 
-# Global connection pool
+# Global connection pools
 _pool: Optional[asyncpg.Pool] = None
+_ro_pool: Optional[asyncpg.Pool] = None
 
 def convert_datetime_to_string(obj: Any) -> Any:
     """Convert datetime objects to ISO format strings recursively"""
@@ -25,6 +30,65 @@ def convert_datetime_to_string(obj: Any) -> Any:
     else:
         return obj
 
+def parse_affected_rows(tag: Optional[str]) -> int:
+    """Extract the affected row count from a command tag such as INSERT 0 1, UPDATE 3 or DELETE 0"""
+    _, _, count = (tag or "").rpartition(' ')
+    try:
+        return int(count)
+    except ValueError:
+        return 0
+
+@lru_cache(maxsize=512)
+def _insert_sql(schema_name: str, table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build INSERT SQL text for a column set; cached so steady-state writes skip formatting"""
+    placeholders = [f"${i+1}" for i in range(len(columns))]
+    return f"""
+            INSERT INTO {schema_name}.{table_name} ({', '.join(columns)})
+            VALUES ({', '.join(placeholders)})
+            RETURNING *
+        """
+
+@lru_cache(maxsize=512)
+def _update_sql(schema_name: str, table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build UPDATE-by-id SQL text for a column set; cached like _insert_sql"""
+    set_clause = ", ".join([f"{col} = ${i+2}" for i, col in enumerate(columns)])
+    return f"""
+            UPDATE {schema_name}.{table_name}
+            SET {set_clause}
+            WHERE id = $1
+            RETURNING *
+        """
+
+@lru_cache(maxsize=512)
+def _insert_many_sql(schema_name: str, table_name: str, columns: Tuple[str, ...], returning_id: bool) -> str:
+    """
+    Build a set-based INSERT for a column set, reading every row from one jsonb array
+
+    jsonb_populate_recordset casts each value to its column's type, so the rows bind
+    as a single parameter without looking up column types first.
+    """
+    column_list = ', '.join(columns)
+    return f"""
+            INSERT INTO {schema_name}.{table_name} ({column_list})
+            SELECT {column_list} FROM jsonb_populate_recordset(NULL::{schema_name}.{table_name}, $1::jsonb)
+            {'RETURNING id' if returning_id else ''}
+        """
+
+@lru_cache(maxsize=512)
+def _update_many_sql(schema_name: str, table_name: str, columns: Tuple[str, ...]) -> str:
+    """Build a set-based UPDATE-by-id for a column set from one jsonb array; cached like _insert_many_sql"""
+    set_clause = ", ".join([f"{col} = v.{col}" for col in columns])
+    return f"""
+            UPDATE {schema_name}.{table_name} AS t
+            SET {set_clause}
+            FROM jsonb_populate_recordset(NULL::{schema_name}.{table_name}, $1::jsonb) AS v
+            WHERE t.id = v.id
+            RETURNING t.id
+        """
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available within the acquire timeout"""
+
 @dataclass
 class PreparedStatement:
     """Represents a prepared statement with its SQL and parameters"""
@@ -36,7 +100,29 @@ class DatabaseManager:
     """Database manager with prepared statement support"""
     
     def __init__(self):
-        self.prepared_statements: Dict[str, PreparedStatement] = {}
+        # Bounded LRU registry of named statements (name -> SQL metadata)
+        self.prepared_statements: "OrderedDict[str, PreparedStatement]" = OrderedDict()
+        self.statement_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+    
+    def _register_statement(self, stmt: PreparedStatement):
+        """
+        Record a named statement in the registry, evicting the least recently used entry
+        once NAMED_STATEMENT_CACHE_SIZE is exceeded
+        
+        The registry only tracks names and SQL for introspection. The server-side
+        statements live in asyncpg's per-connection cache keyed by SQL text, which
+        deallocates them itself when they are evicted there.
+        """
+        if stmt.name in self.prepared_statements:
+            self.prepared_statements.move_to_end(stmt.name)
+            self.statement_cache_stats["hits"] += 1
+            return
+        
+        self.statement_cache_stats["misses"] += 1
+        self.prepared_statements[stmt.name] = stmt
+        while len(self.prepared_statements) > settings.NAMED_STATEMENT_CACHE_SIZE:
+            self.prepared_statements.popitem(last=False)
+            self.statement_cache_stats["evictions"] += 1
     
     async def get_pool(self) -> asyncpg.Pool:
         """Get or create the connection pool"""
@@ -49,6 +135,7 @@ class DatabaseManager:
                     min_size=settings.MIN_CONNECTIONS,
                     max_size=settings.MAX_CONNECTIONS,
                     command_timeout=30,
+                    statement_cache_size=settings.STATEMENT_CACHE_SIZE,
                     server_settings={
                         "application_name": "database_service"
                     }
@@ -60,25 +147,83 @@ class DatabaseManager:
         
         return _pool
     
-    @asynccontextmanager
-    async def get_connection(self):
-        """Get a database connection from the pool"""
-        pool = await self.get_pool()
+    async def get_ro_pool(self) -> asyncpg.Pool:
+        """Get or create the read-replica pool, falling back to the primary pool"""
+        global _ro_pool
         
-        async with pool.acquire() as connection:
+        if not settings.DATABASE_RO_URL:
+            return await self.get_pool()
+        
+        if _ro_pool is None:
             try:
-                yield connection
+                _ro_pool = await asyncpg.create_pool(
+                    settings.DATABASE_RO_URL,
+                    min_size=settings.MIN_CONNECTIONS,
+                    max_size=settings.MAX_CONNECTIONS,
+                    command_timeout=30,
+                    statement_cache_size=settings.STATEMENT_CACHE_SIZE,
+                    server_settings={
+                        "application_name": "database_service_ro"
+                    }
+                )
+                logger.info("Created read-only connection pool")
             except Exception as e:
-                logger.error(f"Database operation failed: {e}")
+                logger.error(f"Failed to create read-only connection pool: {e}")
                 raise
+        
+        return _ro_pool
+    
+    @asynccontextmanager
+    async def _acquire(self, pool: asyncpg.Pool, timeout: Optional[float]):
+        """Acquire a connection from pool, waiting at most timeout seconds (None waits indefinitely)"""
+        try:
+            connection = await pool.acquire(timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"No pooled connection available within {timeout}s")
+            raise PoolTimeoutError(f"No database connection available within {timeout}s")
+        
+        try:
+            yield connection
+        except Exception as e:
+            logger.error(f"Database operation failed: {e}")
+            raise
+        finally:
+            await pool.release(connection)
+    
+    @asynccontextmanager
+    async def get_connection(self, timeout: Optional[float] = None):
+        """
+        Get a database connection from the pool
+        
+        Raises:
+            PoolTimeoutError: If timeout is given and the pool stays exhausted for that long
+        """
+        pool = await self.get_pool()
+        
+        async with self._acquire(pool, timeout) as connection:
+            yield connection
+    
+    @asynccontextmanager
+    async def get_ro_connection(self, timeout: Optional[float] = None):
+        """Get a connection for read-only work from the read-replica pool"""
+        pool = await self.get_ro_pool()
+        
+        async with self._acquire(pool, timeout) as connection:
+            yield connection
     
     def prepare_select_query(self, schema_name: str, table_name: str, 
                            columns: Optional[List[str]] = None,
                            where_clause: Optional[str] = None,
                            order_by: Optional[str] = None,
                            limit: Optional[int] = None,
-                           offset: Optional[int] = None) -> PreparedStatement:
-        """Prepare a SELECT query with parameters"""
+                           offset: Optional[int] = None,
+                           where_parameters: Tuple[Any, ...] = ()) -> PreparedStatement:
+        """
+        Prepare a SELECT query with parameters
+        
+        where_parameters are bound to the $1..$N placeholders used in where_clause;
+        LIMIT and OFFSET placeholders are numbered after them.
+        """
         # Build column list
         if columns:
             column_list = ", ".join(columns)
@@ -87,8 +232,8 @@ class DatabaseManager:
         
         # Build the base query
         sql_parts = [f"SELECT {column_list} FROM {schema_name}.{table_name}"]
-        parameters = []
-        param_count = 0
+        parameters = list(where_parameters)
+        param_count = len(parameters)
         
         # Add WHERE clause if provided
         if where_clause:
@@ -127,36 +272,34 @@ class DatabaseManager:
     def prepare_insert_query(self, schema_name: str, table_name: str,
                            data: Dict[str, Any]) -> PreparedStatement:
         """Prepare an INSERT query with parameters"""
-        columns = list(data.keys())
-        placeholders = [f"${i+1}" for i in range(len(columns))]
-        values = list(data.values())
-        
-        sql = f"""
-            INSERT INTO {schema_name}.{table_name} ({', '.join(columns)})
-            VALUES ({', '.join(placeholders)})
-            RETURNING *
-        """
-        
-        return PreparedStatement(sql, tuple(values))
+        # Sorting the columns lets every key order of the same column set share one
+        # SQL text, and with it asyncpg's per-connection prepared statement
+        columns = tuple(sorted(data))
+        sql = _insert_sql(schema_name, table_name, columns)
+        return PreparedStatement(sql, tuple(data[col] for col in columns))
     
     def prepare_update_query(self, schema_name: str, table_name: str,
                            record_id: Union[int, str], data: Dict[str, Any]) -> PreparedStatement:
         """Prepare an UPDATE query with parameters"""
-        columns = list(data.keys())
-        set_clause = ", ".join([f"{col} = ${i+2}" for i, col in enumerate(columns)])
-        values = list(data.values())
-        
-        # Add record_id as the first parameter
-        all_values = [record_id] + values
-        
-        sql = f"""
-            UPDATE {schema_name}.{table_name}
-            SET {set_clause}
-            WHERE id = $1
-            RETURNING *
-        """
-        
-        return PreparedStatement(sql, tuple(all_values))
+        columns = tuple(sorted(data))
+        sql = _update_sql(schema_name, table_name, columns)
+        # record_id is the first parameter
+        return PreparedStatement(sql, (record_id, *(data[col] for col in columns)))
+    
+    def prepare_insert_many_query(self, schema_name: str, table_name: str,
+                                  rows: List[Dict[str, Any]], returning_id: bool = True) -> PreparedStatement:
+        """Prepare one INSERT for rows sharing a column set, returning their ids when returning_id is set"""
+        columns = tuple(sorted(rows[0]))
+        sql = _insert_many_sql(schema_name, table_name, columns, returning_id)
+        return PreparedStatement(sql, (dumps(rows).decode(),))
+    
+    def prepare_update_many_query(self, schema_name: str, table_name: str,
+                                  updates: Dict[Union[int, str], Dict[str, Any]]) -> PreparedStatement:
+        """Prepare one UPDATE for records (id -> data) sharing a column set, returning the ids it updated"""
+        columns = tuple(sorted(next(iter(updates.values()))))
+        sql = _update_many_sql(schema_name, table_name, columns)
+        rows = [{**data, 'id': record_id} for record_id, data in updates.items()]
+        return PreparedStatement(sql, (dumps(rows).decode(),))
     
     def prepare_delete_query(self, schema_name: str, table_name: str,
                            record_id: Union[int, str]) -> PreparedStatement:
@@ -179,16 +322,10 @@ class DatabaseManager:
         """Execute a prepared statement"""
         try:
             if stmt.name:
-                # Use named prepared statement
-                if stmt.name not in self.prepared_statements:
-                    await connection.prepare(stmt.name, stmt.sql)
-                    self.prepared_statements[stmt.name] = stmt
-                
-                stmt_obj = connection.get_prepared_statement(stmt.name)
-                result = await stmt_obj.fetch(*stmt.parameters)
-            else:
-                # Execute directly with parameters
-                result = await connection.fetch(stmt.sql, *stmt.parameters)
+                self._register_statement(stmt)
+            
+            # asyncpg prepares the SQL once per connection and reuses it from its statement cache
+            result = await connection.fetch(stmt.sql, *stmt.parameters)
             
             # Convert asyncpg Records to dicts and then convert datetime objects to strings
             if result:
@@ -199,20 +336,27 @@ class DatabaseManager:
             logger.error(f"Failed to execute prepared statement: {e}")
             raise
     
+    async def fetch_records(self, stmt: PreparedStatement, connection: asyncpg.Connection) -> List[asyncpg.Record]:
+        """
+        Execute a prepared statement and return the raw asyncpg Records without conversion
+        
+        The SQL text is prepared once per connection and then served from asyncpg's
+        statement LRU (STATEMENT_CACHE_SIZE), so repeated queries skip PARSE.
+        """
+        try:
+            return await connection.fetch(stmt.sql, *stmt.parameters)
+        except Exception as e:
+            logger.error(f"Failed to execute prepared statement: {e}")
+            raise
+    
     async def execute_prepared_val(self, stmt: PreparedStatement, connection: asyncpg.Connection) -> Any:
         """Execute a prepared statement and return a single value"""
         try:
             if stmt.name:
-                # Use named prepared statement
-                if stmt.name not in self.prepared_statements:
-                    await connection.prepare(stmt.name, stmt.sql)
-                    self.prepared_statements[stmt.name] = stmt
-                
-                stmt_obj = connection.get_prepared_statement(stmt.name)
-                return await stmt_obj.fetchval(*stmt.parameters)
-            else:
-                # Execute directly with parameters
-                return await connection.fetchval(stmt.sql, *stmt.parameters)
+                self._register_statement(stmt)
+            
+            # asyncpg prepares the SQL once per connection and reuses it from its statement cache
+            return await connection.fetchval(stmt.sql, *stmt.parameters)
         except Exception as e:
             logger.error(f"Failed to execute prepared statement: {e}")
             raise
@@ -221,16 +365,10 @@ class DatabaseManager:
         """Execute a prepared statement and return a single row"""
         try:
             if stmt.name:
-                # Use named prepared statement
-                if stmt.name not in self.prepared_statements:
-                    await connection.prepare(stmt.name, stmt.sql)
-                    self.prepared_statements[stmt.name] = stmt
-                
-                stmt_obj = connection.get_prepared_statement(stmt.name)
-                result = await stmt_obj.fetchrow(*stmt.parameters)
-            else:
-                # Execute directly with parameters
-                result = await connection.fetchrow(stmt.sql, *stmt.parameters)
+                self._register_statement(stmt)
+            
+            # asyncpg prepares the SQL once per connection and reuses it from its statement cache
+            result = await connection.fetchrow(stmt.sql, *stmt.parameters)
             
             # Convert asyncpg Record to dict and then convert datetime objects to strings
             if result:
@@ -286,13 +424,18 @@ async def test_connection() -> Dict[str, Any]:
         raise Exception(f"Database connection failed: {str(e)}")
 
 async def close_pool():
-    """Close the connection pool"""
-    global _pool
+    """Close the connection pools"""
+    global _pool, _ro_pool
     
     if _pool:
         await _pool.close()
         _pool = None
         logger.info("Connection pool closed")
+    
+    if _ro_pool:
+        await _ro_pool.close()
+        _ro_pool = None
+        logger.info("Read-only connection pool closed")
 
 async def get_pool_stats() -> Dict[str, Any]:
     """Get connection pool statistics"""
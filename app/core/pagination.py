@@ -0,0 +1,141 @@
+import base64
+import hashlib
+import hmac
+import logging
+import secrets
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.sql_security import sql_security
+
+logger = logging.getLogger(__name__)
+
+CURSOR_VERSION = 1
+
+# Without a configured secret cursors are signed with a per-process key, so they
+# stop validating after a restart and are not shared between worker processes.
+_secret = settings.CURSOR_SECRET.encode() if settings.CURSOR_SECRET else secrets.token_bytes(32)
+
+# Tagged encodings for key values that JSON cannot represent with their type intact
+_ENCODERS = (
+    (datetime, "dt", lambda v: v.isoformat()),
+    (date, "d", lambda v: v.isoformat()),
+    (time, "t", lambda v: v.isoformat()),
+    (Decimal, "dec", str),
+    (uuid.UUID, "uuid", str),
+)
+_DECODERS = {
+    "dt": datetime.fromisoformat,
+    "d": date.fromisoformat,
+    "t": time.fromisoformat,
+    "dec": Decimal,
+    "uuid": uuid.UUID,
+}
+
+@dataclass
+class Cursor:
+    """Decoded keyset pagination state"""
+    column: str
+    direction: str
+    keys: Tuple[Any, ...]
+    backward: bool = False
+
+def parse_order_by(order_by: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Parse an order_by value of the form "<column> [ASC|DESC]"
+
+    Returns:
+        (column, direction) or None if the value cannot drive keyset pagination
+    """
+    if not order_by:
+        return None
+    parts = order_by.split()
+    if len(parts) > 2:
+        return None
+    direction = parts[1].upper() if len(parts) == 2 else "ASC"
+    if direction not in ("ASC", "DESC"):
+        return None
+    try:
+        column = sql_security.sanitize_identifier(parts[0])
+    except HTTPException:
+        return None
+    return column, direction
+
+def _encode_value(value: Any) -> Any:
+    for value_type, tag, encode in _ENCODERS:
+        if isinstance(value, value_type):
+            return {"$": tag, "v": encode(value)}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"Unsupported cursor key type: {type(value).__name__}")
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _DECODERS[value["$"]](value["v"])
+    return value
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_secret, payload, hashlib.sha256).digest()[:16]
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def encode_cursor(column: str, direction: str, keys: Tuple[Any, ...],
+                  backward: bool = False) -> Optional[str]:
+    """
+    Serialize keyset state into an opaque, HMAC-signed cursor string
+
+    Returns None when a key value cannot be represented (e.g. NULL or an
+    unsupported type), in which case no further page can be addressed by cursor.
+    """
+    if any(key is None for key in keys):
+        return None
+    try:
+        payload = orjson.dumps({
+            "v": CURSOR_VERSION,
+            "o": [column, direction],
+            "k": [_encode_value(key) for key in keys],
+            "b": backward
+        })
+    except TypeError as e:
+        logger.debug(f"Cursor not available: {e}")
+        return None
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Verify and decode a cursor produced by encode_cursor
+
+    Raises:
+        HTTPException: If the cursor is malformed, tampered with or from another version
+    """
+    try:
+        payload_part, signature_part = cursor.split(".", 1)
+        payload = _b64decode(payload_part)
+        if not hmac.compare_digest(_sign(payload), _b64decode(signature_part)):
+            raise ValueError("signature mismatch")
+        state = orjson.loads(payload)
+        if state["v"] != CURSOR_VERSION:
+            raise ValueError("unsupported cursor version")
+        column, direction = state["o"]
+        return Cursor(
+            column=sql_security.sanitize_identifier(column),
+            direction="DESC" if direction == "DESC" else "ASC",
+            keys=tuple(_decode_value(key) for key in state["k"]),
+            backward=bool(state["b"])
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.warning(f"Rejected pagination cursor: {e}")
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
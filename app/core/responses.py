@@ -0,0 +1,29 @@
+import asyncpg
+import orjson
+from typing import Any
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback serializer for types orjson does not handle natively"""
+    if isinstance(obj, asyncpg.Record):
+        # Records are materialized into dicts only at serialization time
+        return dict(obj)
+    return jsonable_encoder(obj)
+
+def dumps(content: Any) -> bytes:
+    """Serialize content (which may contain asyncpg Records) to JSON bytes with orjson"""
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+class RecordJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson that accepts asyncpg Records directly
+
+    datetime, date, UUID and nested Records are serialized in C without first
+    converting each row into a Python dict; remaining types (e.g. Decimal) fall
+    back to FastAPI's jsonable_encoder.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,10 +1,28 @@
 import re
 import logging
+from functools import lru_cache
 from typing import List, Set, Optional
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+def count_placeholders(sql: str) -> int:
+    """
+    Count positional parameter placeholders ($1, $2, ...) in a SQL statement
+    
+    Equivalent to counting matches of r'\$\d+', but done with str.split, which
+    scans the text in C without driving the regex engine per character. Counts
+    are memoized per statement text, since clients resend the same query shapes;
+    statements without any '$' return before the cache so they never occupy it.
+    """
+    if '$' not in sql:
+        return 0
+    return _count_placeholders_cached(sql)
+
+@lru_cache(maxsize=1024)
+def _count_placeholders_cached(sql: str) -> int:
+    return sum(1 for part in sql.split('$')[1:] if part[:1].isdecimal())
+
 class SQLSecurity:
     """SQL Injection Protection and Validation"""
     
@@ -41,6 +59,15 @@ class SQLSecurity:
     
     def __init__(self):
         self.blocked_patterns = self._compile_blocked_patterns()
+        # Single-pass scanners: one alternation per rule set instead of one search per pattern
+        self._blocked_scanner = re.compile(
+            '|'.join(f'(?P<p{i}>{pattern.pattern})' for i, pattern in enumerate(self.blocked_patterns)),
+            re.IGNORECASE | re.MULTILINE | re.DOTALL
+        )
+        # Longest keywords first so e.g. 'UNION ALL' is reported rather than 'UNION'
+        self._keyword_scanner = re.compile(
+            '|'.join(re.escape(keyword) for keyword in sorted(self.DANGEROUS_KEYWORDS, key=len, reverse=True))
+        )
     
     def _compile_blocked_patterns(self) -> List[re.Pattern]:
         """Compile regex patterns for blocked SQL patterns"""
@@ -69,6 +96,18 @@ class SQLSecurity:
         ]
         return [re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL) for pattern in patterns]
     
+    def scan(self, sql: str) -> Optional[re.Pattern]:
+        """
+        Run all blocked patterns over the statement in one pass
+        
+        Returns:
+            The first blocked pattern that matched, or None if the statement is clean
+        """
+        match = self._blocked_scanner.search(sql)
+        if match is None:
+            return None
+        return self.blocked_patterns[int(match.lastgroup[1:])]
+    
     def validate_sql_statement(self, sql: str, operation_type: str = "read") -> bool:
         """
         Validate SQL statement for injection attempts
@@ -90,25 +129,25 @@ class SQLSecurity:
         sql_upper = sql.upper().strip()
         
         # Check for dangerous keywords (with exceptions for write operations)
-        for keyword in self.DANGEROUS_KEYWORDS:
-            if keyword in sql_upper:
-                # Allow CREATE TEMP TABLE for write operations
-                if keyword == 'CREATE' and operation_type == "write" and 'CREATE TEMP TABLE' in sql_upper:
-                    continue
-                logger.warning(f"SQL injection attempt detected: dangerous keyword '{keyword}'")
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"SQL injection attempt detected: dangerous keyword '{keyword}'"
-                )
+        for match in self._keyword_scanner.finditer(sql_upper):
+            keyword = match.group()
+            # Allow CREATE TEMP TABLE for write operations
+            if keyword == 'CREATE' and operation_type == "write" and 'CREATE TEMP TABLE' in sql_upper:
+                continue
+            logger.warning(f"SQL injection attempt detected: dangerous keyword '{keyword}'")
+            raise HTTPException(
+                status_code=400, 
+                detail=f"SQL injection attempt detected: dangerous keyword '{keyword}'"
+            )
         
         # Check for blocked patterns
-        for pattern in self.blocked_patterns:
-            if pattern.search(sql):
-                logger.warning(f"SQL injection attempt detected: blocked pattern '{pattern.pattern}'")
-                raise HTTPException(
-                    status_code=400,
-                    detail="SQL injection attempt detected: blocked pattern"
-                )
+        pattern = self.scan(sql)
+        if pattern is not None:
+            logger.warning(f"SQL injection attempt detected: blocked pattern '{pattern.pattern}'")
+            raise HTTPException(
+                status_code=400,
+                detail="SQL injection attempt detected: blocked pattern"
+            )
         
         # Validate based on operation type
         if operation_type == "read":
@@ -206,4 +245,14 @@ class SQLSecurity:
         return self.sanitize_identifier(schema_name)
 
 # Global instance
-sql_security = SQLSecurity() 
\ No newline at end of file
+sql_security = SQLSecurity()
+
+@lru_cache(maxsize=4096)
+def validate_sql_cached(sql: str, operation_type: str = "read") -> bool:
+    """
+    Memoized sql_security.validate_sql_statement for repeated statement texts.
+    
+    Only successful validations are cached: a rejected statement raises
+    HTTPException, which lru_cache does not store, so it is re-checked each time.
+    """
+    return sql_security.validate_sql_statement(sql, operation_type)
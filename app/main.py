@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 import logging
 
 from app.core.database import test_connection
+from app.core.request_body import add_body_schemas
 from app.routers import admin_router, raw_router, crud_router, prepared_router
 
 # Configure logging
@@ -110,4 +111,14 @@ async def health_check():
 app.include_router(admin_router)
 app.include_router(raw_router)
 app.include_router(prepared_router)  # More specific /crud/prepared routes first
-app.include_router(crud_router)      # General /crud routes last 
\ No newline at end of file
+app.include_router(crud_router)      # General /crud routes last 
+
+_default_openapi = app.openapi
+
+def openapi():
+    """OpenAPI schema including the request body models of routes that use json_body"""
+    if app.openapi_schema is None:
+        add_body_schemas(_default_openapi())
+    return app.openapi_schema
+
+app.openapi = openapi
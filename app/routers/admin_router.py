@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException
 import logging
 from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.core.database import get_db_connection, test_connection
 from app.core.config import settings
@@ -16,15 +16,14 @@ class HealthResponse(BaseModel):
     pgbouncer_host: str
     pgbouncer_port: int
     
-    class Config:
-        json_json_schema_extra = {
-            "example": {
-                "status": "healthy",
-                "database": "connected",
-                "pgbouncer_host": "localhost",
-                "pgbouncer_port": 5432
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "status": "healthy",
+            "database": "connected",
+            "pgbouncer_host": "localhost",
+            "pgbouncer_port": 5432
         }
+    })
 
 class ConnectionTestResponse(BaseModel):
     """Database connection test response model"""
@@ -32,22 +31,21 @@ class ConnectionTestResponse(BaseModel):
     message: str
     details: Dict[str, Any]
     
-    class Config:
-        json_json_schema_extra = {
-            "example": {
-                "status": "success",
-                "message": "Database connection successful",
-                "details": {
-                    "status": "connected",
-                    "version": "PostgreSQL 13.4 on x86_64-pc-linux-gnu",
-                    "database": "testdb",
-                    "user": "postgres",
-                    "host": "localhost",
-                    "port": 5432,
-                    "write_test": "passed"
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "status": "success",
+            "message": "Database connection successful",
+            "details": {
+                "status": "connected",
+                "version": "PostgreSQL 13.4 on x86_64-pc-linux-gnu",
+                "database": "testdb",
+                "user": "postgres",
+                "host": "localhost",
+                "port": 5432,
+                "write_test": "passed"
             }
         }
+    })
 
 class DatabaseInfoResponse(BaseModel):
     """Database information response model"""
@@ -57,16 +55,15 @@ class DatabaseInfoResponse(BaseModel):
     host: str
     port: int
     
-    class Config:
-        json_json_schema_extra = {
-            "example": {
-                "version": "PostgreSQL 13.4 on x86_64-pc-linux-gnu",
-                "database": "testdb",
-                "user": "postgres",
-                "host": "localhost",
-                "port": 5432
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "version": "PostgreSQL 13.4 on x86_64-pc-linux-gnu",
+            "database": "testdb",
+            "user": "postgres",
+            "host": "localhost",
+            "port": 5432
         }
+    })
 
 class DatabaseInfo(BaseModel):
     """Database information model"""
@@ -79,43 +76,41 @@ class DatabaseInfo(BaseModel):
     size: str
     comment: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "database_name": "testdb",
-                "owner": "postgres",
-                "encoding": "UTF8",
-                "collation": "en_US.utf8",
-                "ctype": "en_US.utf8",
-                "access_privileges": "postgres=CTc/postgres",
-                "size": "8.5 MB",
-                "comment": "Test database"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "database_name": "testdb",
+            "owner": "postgres",
+            "encoding": "UTF8",
+            "collation": "en_US.utf8",
+            "ctype": "en_US.utf8",
+            "access_privileges": "postgres=CTc/postgres",
+            "size": "8.5 MB",
+            "comment": "Test database"
         }
+    })
 
 class DatabasesResponse(BaseModel):
     """Databases list response model"""
     databases: list[DatabaseInfo]
     count: int
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "databases": [
-                    {
-                        "database_name": "testdb",
-                        "owner": "postgres",
-                        "encoding": "UTF8",
-                        "collation": "en_US.utf8",
-                        "ctype": "en_US.utf8",
-                        "access_privileges": "postgres=CTc/postgres",
-                        "size": "8.5 MB",
-                        "comment": "Test database"
-                    }
-                ],
-                "count": 1
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "databases": [
+                {
+                    "database_name": "testdb",
+                    "owner": "postgres",
+                    "encoding": "UTF8",
+                    "collation": "en_US.utf8",
+                    "ctype": "en_US.utf8",
+                    "access_privileges": "postgres=CTc/postgres",
+                    "size": "8.5 MB",
+                    "comment": "Test database"
+                }
+            ],
+            "count": 1
         }
+    })
 
 class SchemaInfo(BaseModel):
     """Schema information model"""
@@ -124,35 +119,33 @@ class SchemaInfo(BaseModel):
     access_privileges: Optional[str] = None
     comment: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "schema_name": "public",
-                "owner": "postgres",
-                "access_privileges": "postgres=UC/postgres",
-                "comment": "Standard public schema"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "schema_name": "public",
+            "owner": "postgres",
+            "access_privileges": "postgres=UC/postgres",
+            "comment": "Standard public schema"
         }
+    })
 
 class SchemasResponse(BaseModel):
     """Schemas list response model"""
     schemas: list[SchemaInfo]
     count: int
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "schemas": [
-                    {
-                        "schema_name": "public",
-                        "owner": "postgres",
-                        "access_privileges": "postgres=UC/postgres",
-                        "comment": "Standard public schema"
-                    }
-                ],
-                "count": 1
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "schemas": [
+                {
+                    "schema_name": "public",
+                    "owner": "postgres",
+                    "access_privileges": "postgres=UC/postgres",
+                    "comment": "Standard public schema"
+                }
+            ],
+            "count": 1
         }
+    })
 
 class TableInfo(BaseModel):
     """Table information model"""
@@ -164,41 +157,39 @@ class TableInfo(BaseModel):
     estimated_rows: int
     comment: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "schema_name": "public",
-                "table_name": "users",
-                "table_type": "BASE TABLE",
-                "owner": "postgres",
-                "size": "16 kB",
-                "estimated_rows": 100,
-                "comment": "User accounts table"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "schema_name": "public",
+            "table_name": "users",
+            "table_type": "BASE TABLE",
+            "owner": "postgres",
+            "size": "16 kB",
+            "estimated_rows": 100,
+            "comment": "User accounts table"
         }
+    })
 
 class TablesResponse(BaseModel):
     """Tables list response model"""
     tables: list[TableInfo]
     count: int
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "tables": [
-                    {
-                        "schema_name": "public",
-                        "table_name": "users",
-                        "table_type": "BASE TABLE",
-                        "owner": "postgres",
-                        "size": "16 kB",
-                        "estimated_rows": 100,
-                        "comment": "User accounts table"
-                    }
-                ],
-                "count": 1
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "tables": [
+                {
+                    "schema_name": "public",
+                    "table_name": "users",
+                    "table_type": "BASE TABLE",
+                    "owner": "postgres",
+                    "size": "16 kB",
+                    "estimated_rows": 100,
+                    "comment": "User accounts table"
+                }
+            ],
+            "count": 1
         }
+    })
 
 class TablesBySchemaResponse(BaseModel):
     """Tables by schema response model"""
@@ -206,24 +197,23 @@ class TablesBySchemaResponse(BaseModel):
     tables: list[TableInfo]
     count: int
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "schema_name": "public",
-                "tables": [
-                    {
-                        "schema_name": "public",
-                        "table_name": "users",
-                        "table_type": "BASE TABLE",
-                        "owner": "postgres",
-                        "size": "16 kB",
-                        "estimated_rows": 100,
-                        "comment": "User accounts table"
-                    }
-                ],
-                "count": 1
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "schema_name": "public",
+            "tables": [
+                {
+                    "schema_name": "public",
+                    "table_name": "users",
+                    "table_type": "BASE TABLE",
+                    "owner": "postgres",
+                    "size": "16 kB",
+                    "estimated_rows": 100,
+                    "comment": "User accounts table"
+                }
+            ],
+            "count": 1
         }
+    })
 
 class AdminRouter:
     """Admin router for database service management endpoints"""
@@ -1,44 +1,70 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 import logging
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, field_validator, model_validator
+from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 from datetime import datetime
 
-from app.core.database import db_manager
+from app.core.database import db_manager, PreparedStatement
+from app.core.pagination import decode_cursor, encode_cursor, parse_order_by
+from app.core.request_body import body_openapi, json_body
+from app.core.responses import RecordJSONResponse
 from app.core.sql_security import sql_security
 
 logger = logging.getLogger(__name__)
 
+def _coerce_id(record_id: str) -> Union[int, str]:
+    """Return record_id as an int when int() accepts it, otherwise unchanged"""
+    try:
+        return int(record_id)
+    except ValueError:
+        return record_id
+
+_HAS_ID_COLUMN_SQL = (
+    "SELECT EXISTS (SELECT 1 FROM pg_attribute "
+    "WHERE attrelid = to_regclass($1) AND attname = 'id' AND attnum > 0 AND NOT attisdropped)"
+)
+
+# schema.table -> whether it has an id column; table shapes almost never change, so
+# paged reads look this up once per table instead of once per request
+_id_columns: Dict[str, bool] = {}
+
+async def _has_id_column(conn, schema_name: str, table_name: str) -> bool:
+    """Whether the table has an id column to break ties in keyset pagination"""
+    target = f"{schema_name}.{table_name}"
+    has_id = _id_columns.get(target)
+    if has_id is None:
+        stmt = PreparedStatement(_HAS_ID_COLUMN_SQL, (target,))
+        has_id = _id_columns[target] = bool(await db_manager.execute_prepared_val(stmt, conn))
+    return has_id
+
 # Pydantic models for CRUD operations
 class RecordCreate(BaseModel):
     """Model for creating a new record"""
     data: Dict[str, Any]
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "data": {
-                    "name": "John Doe",
-                    "email": "john@example.com",
-                    "age": 30,
-                    "status": "active"
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "data": {
+                "name": "John Doe",
+                "email": "john@example.com",
+                "age": 30,
+                "status": "active"
             }
         }
+    })
 
 class RecordUpdate(BaseModel):
     """Model for updating an existing record"""
     data: Dict[str, Any]
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "data": {
-                    "age": 31,
-                    "status": "updated"
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "data": {
+                "age": 31,
+                "status": "updated"
             }
         }
+    })
 
 class RecordResponse(BaseModel):
     """Model for record response"""
@@ -47,62 +73,35 @@ class RecordResponse(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "id": 123,
+            "data": {
                 "id": 123,
-                "data": {
-                    "id": 123,
-                    "name": "John Doe",
-                    "email": "john@example.com",
-                    "age": 30,
-                    "status": "active",
-                    "created_at": "2024-01-15T10:30:00Z",
-                    "updated_at": "2024-01-15T10:30:00Z"
-                },
+                "name": "John Doe",
+                "email": "john@example.com",
+                "age": 30,
+                "status": "active",
                 "created_at": "2024-01-15T10:30:00Z",
                 "updated_at": "2024-01-15T10:30:00Z"
-            }
+            },
+            "created_at": "2024-01-15T10:30:00Z",
+            "updated_at": "2024-01-15T10:30:00Z"
         }
+    })
 
 class RecordsResponse(BaseModel):
     """Model for multiple records response"""
     records: List[RecordResponse]
     count: int
     total_count: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "records": [
-                    {
-                        "id": 123,
-                        "data": {
-                            "id": 123,
-                            "name": "John Doe",
-                            "email": "john@example.com",
-                            "age": 30,
-                            "status": "active"
-                        },
-                        "created_at": "2024-01-15T10:30:00Z",
-                        "updated_at": "2024-01-15T10:30:00Z"
-                    }
-                ],
-                "count": 1,
-                "total_count": 100
-            }
-        }
-
-class DeleteResponse(BaseModel):
-    """Model for delete operation response"""
-    message: str
-    deleted_record: RecordResponse
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "Record deleted successfully",
-                "deleted_record": {
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "records": [
+                {
                     "id": 123,
                     "data": {
                         "id": 123,
@@ -114,8 +113,36 @@ class DeleteResponse(BaseModel):
                     "created_at": "2024-01-15T10:30:00Z",
                     "updated_at": "2024-01-15T10:30:00Z"
                 }
+            ],
+            "count": 1,
+            "total_count": 100,
+            "next_cursor": "eyJ2IjoxLCJvIjpbImlkIiwiQVNDIl0sImsiOlsxMjNdLCJiIjpmYWxzZX0.2Wl3f0m1sYVbq4dXoO6mRw",
+            "prev_cursor": None
+        }
+    })
+
+class DeleteResponse(BaseModel):
+    """Model for delete operation response"""
+    message: str
+    deleted_record: RecordResponse
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "message": "Record deleted successfully",
+            "deleted_record": {
+                "id": 123,
+                "data": {
+                    "id": 123,
+                    "name": "John Doe",
+                    "email": "john@example.com",
+                    "age": 30,
+                    "status": "active"
+                },
+                "created_at": "2024-01-15T10:30:00Z",
+                "updated_at": "2024-01-15T10:30:00Z"
             }
         }
+    })
 
 class UpsertResponse(BaseModel):
     """Model for upsert operation response"""
@@ -123,43 +150,417 @@ class UpsertResponse(BaseModel):
     operation: str
     record: RecordResponse
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "Record created successfully",
-                "operation": "created",
-                "record": {
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "message": "Record created successfully",
+            "operation": "created",
+            "record": {
+                "id": 123,
+                "data": {
                     "id": 123,
-                    "data": {
-                        "id": 123,
-                        "name": "John Doe",
-                        "email": "john@example.com",
-                        "age": 30,
-                        "status": "active"
-                    },
-                    "created_at": "2024-01-15T10:30:00Z",
-                    "updated_at": "2024-01-15T10:30:00Z"
-                }
+                    "name": "John Doe",
+                    "email": "john@example.com",
+                    "age": 30,
+                    "status": "active"
+                },
+                "created_at": "2024-01-15T10:30:00Z",
+                "updated_at": "2024-01-15T10:30:00Z"
             }
         }
+    })
+
+class RecordBatchUpdate(BaseModel):
+    """Model for one record in a batch update"""
+    id: Union[int, str]
+    data: Dict[str, Any]
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "id": 123,
+            "data": {
+                "status": "inactive"
+            }
+        }
+    })
+
+class BatchResponse(BaseModel):
+    """Model for batch write operation response"""
+    message: str
+    operation: str
+    count: int
+    ids: Optional[List[Any]] = None
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "message": "3 records created successfully",
+            "operation": "created",
+            "count": 3,
+            "ids": [124, 125, 126]
+        }
+    })
+
+# Operations served from the read-replica pool
+_READ_OPS = frozenset({"read_many", "read_one"})
+
+# Operation name -> (log message template, HTTP error detail)
+_CRUD_ERRORS = {
+    "read_many": ("Failed to read records from {target}", "Failed to read records"),
+    "read_one": ("Failed to read record {record_id} from {target}", "Failed to read record"),
+    "create": ("Failed to create record in {target}", "Failed to create record"),
+    "update": ("Failed to update record {record_id} in {target}", "Failed to update record"),
+    "delete": ("Failed to delete record {record_id} from {target}", "Failed to delete record"),
+    "upsert": ("Failed to upsert record {record_id} in {target}", "Failed to upsert record"),
+    "create_batch": ("Failed to create records in {target}", "Failed to create records"),
+    "update_batch": ("Failed to update records in {target}", "Failed to update records"),
+}
+
+def _record_response(record_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    RecordResponse-shaped body for a row (dict or asyncpg Record)
+    
+    Bodies are rendered by RecordJSONResponse, the same orjson path as the list
+    endpoint, so every CRUD response formats datetimes the same way.
+    """
+    return {
+        "id": record_data.get('id'),  # Assuming 'id' is the primary key
+        "data": record_data,
+        "created_at": record_data.get('created_at'),
+        "updated_at": record_data.get('updated_at')
+    }
 
 class CrudRouter:
     """CRUD router for database operations"""
     
     def __init__(self):
         self.router = APIRouter(prefix="/crud", tags=["CRUD Operations"])
+        self._operations = {
+            "read_many": self._read_many,
+            "read_one": self._read_one,
+            "create": self._create,
+            "update": self._update,
+            "delete": self._delete,
+            "upsert": self._upsert,
+            "create_batch": self._create_batch,
+            "update_batch": self._update_batch,
+        }
         self._setup_routes()
     
+    async def _exec_crud(self, op: str, schema_name: str, table_name: str, **kwargs):
+        """
+        Run a CRUD operation with the shared prologue and error handling
+        
+        Validates the schema and table names, acquires a connection (from the read-replica
+        pool for read operations), checks that the table exists and then dispatches to the
+        operation handler registered for `op`.
+        Unexpected errors are logged and converted to HTTP 500 responses.
+        """
+        try:
+            # Validate schema and table names
+            schema_name = sql_security.validate_schema_name(schema_name)
+            table_name = sql_security.validate_table_name(table_name)
+            
+            connection = db_manager.get_ro_connection() if op in _READ_OPS else db_manager.get_connection()
+            async with connection as conn:
+                # Validate table exists using prepared statement
+                table_exists_stmt = db_manager.prepare_table_exists_query(schema_name, table_name)
+                table_exists = await db_manager.execute_prepared_val(table_exists_stmt, conn)
+                
+                if not table_exists:
+                    raise HTTPException(status_code=404, detail=f"Table {schema_name}.{table_name} not found")
+                
+                return await self._operations[op](conn, schema_name, table_name, **kwargs)
+        except HTTPException:
+            raise
+        except Exception as e:
+            log_message, detail = _CRUD_ERRORS[op]
+            target = f"{schema_name}.{table_name}"
+            logger.error(f"{log_message.format(record_id=kwargs.get('record_id'), target=target)}: {e}")
+            raise HTTPException(status_code=500, detail=f"{detail}: {str(e)}")
+    
+    async def _read_many(self, conn, schema_name: str, table_name: str,
+                         limit: int, offset: int, order_by: Optional[str],
+                         cursor: Optional[str] = None) -> RecordJSONResponse:
+        """
+        Read a page of records and the table's total row count
+        
+        When order_by names a single column (or a cursor is supplied) and the table
+        has an `id` column, the page is read with keyset pagination, using `id` as
+        the tie-breaker, and opaque next/prev cursors are returned alongside the
+        records. Tables without `id` are ordered and paged with plain ORDER BY/OFFSET.
+        """
+        where_clause = None
+        where_parameters = ()
+        backward = False
+        
+        if cursor:
+            # The cursor carries its own ordering; offset does not apply to keyset pages
+            state = decode_cursor(cursor)
+            order = (state.column, state.direction)
+            backward = state.backward
+            offset = None
+        else:
+            order = parse_order_by(order_by)
+        
+        if order and not await _has_id_column(conn, schema_name, table_name):
+            if cursor:
+                raise HTTPException(status_code=400, detail="Cursor pagination requires an id column")
+            # No tie-breaker to build cursors from; order_by is applied as given
+            order_by = "{} {}".format(*order)
+            order = None
+        
+        if order:
+            column, direction = order
+            # Walking backwards flips the scan so LIMIT picks the rows just before the cursor
+            ascending = (direction == "ASC") != backward
+            scan = "ASC" if ascending else "DESC"
+            order_by = f"id {scan}" if column == "id" else f"{column} {scan}, id {scan}"
+            
+            if cursor:
+                comparison = ">" if ascending else "<"
+                if column == "id":
+                    where_clause = f"id {comparison} $1"
+                else:
+                    where_clause = f"({column}, id) {comparison} ($1, $2)"
+                where_parameters = state.keys
+        
+        # Prepare SELECT query with parameters, fetching one extra row to detect a further page
+        select_stmt = db_manager.prepare_select_query(
+            schema_name=schema_name,
+            table_name=table_name,
+            where_clause=where_clause,
+            order_by=order_by,
+            limit=limit + 1 if order else limit,
+            offset=offset,
+            where_parameters=where_parameters
+        )
+        
+        # Prepare COUNT query
+        count_stmt = db_manager.prepare_count_query(schema_name, table_name)
+        
+        # Execute queries using prepared statements
+        total_count = await db_manager.execute_prepared_val(count_stmt, conn)
+        rows = await db_manager.fetch_records(select_stmt, conn)
+        
+        next_cursor = None
+        prev_cursor = None
+        if order:
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            if backward:
+                rows.reverse()
+            
+            def row_cursor(row, reverse: bool) -> Optional[str]:
+                keys = (row.get('id'),) if column == "id" else (row.get(column), row.get('id'))
+                return encode_cursor(column, direction, keys, backward=reverse)
+            
+            if rows and backward:
+                # We arrived from the following page, so it always exists
+                next_cursor = row_cursor(rows[-1], reverse=False)
+                if has_more:
+                    prev_cursor = row_cursor(rows[0], reverse=True)
+            elif rows:
+                if has_more:
+                    next_cursor = row_cursor(rows[-1], reverse=False)
+                if cursor or offset:
+                    prev_cursor = row_cursor(rows[0], reverse=True)
+        
+        # Rows stay asyncpg Records until orjson serializes them
+        return RecordJSONResponse({
+            "records": [
+                {
+                    "id": row.get('id'),
+                    "data": row,
+                    "created_at": row.get('created_at'),
+                    "updated_at": row.get('updated_at')
+                }
+                for row in rows
+            ],
+            "count": len(rows),
+            "total_count": total_count,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor
+        })
+    
+    async def _read_one(self, conn, schema_name: str, table_name: str, record_id: str) -> RecordJSONResponse:
+        """Read a single record by ID"""
+        # Prepare SELECT query with parameters
+        select_stmt = db_manager.prepare_select_query(
+            schema_name=schema_name,
+            table_name=table_name,
+            where_clause="id = $1"
+        )
+        select_stmt.parameters = (_coerce_id(record_id),)
+        
+        # Execute query using prepared statement; the Record stays as-is until orjson serializes it
+        rows = await db_manager.fetch_records(select_stmt, conn)
+        
+        if not rows:
+            raise HTTPException(status_code=404, detail=f"Record with ID {record_id} not found")
+        
+        return RecordJSONResponse(_record_response(rows[0]))
+    
+    async def _create(self, conn, schema_name: str, table_name: str, data: Dict[str, Any]) -> RecordJSONResponse:
+        """Insert a new record"""
+        # Prepare INSERT query with parameters
+        insert_stmt = db_manager.prepare_insert_query(schema_name, table_name, data)
+        
+        # Execute insert using prepared statement
+        row = await db_manager.execute_prepared_row(insert_stmt, conn)
+        
+        if not row:
+            raise HTTPException(status_code=500, detail="Failed to create record")
+        
+        return RecordJSONResponse(_record_response(row))
+    
+    async def _update(self, conn, schema_name: str, table_name: str,
+                      record_id: str, data: Dict[str, Any]) -> RecordJSONResponse:
+        """Update an existing record"""
+        record_id_final = _coerce_id(record_id)
+        
+        # Check if record exists using prepared statement
+        exists_stmt = db_manager.prepare_exists_query(schema_name, table_name, record_id_final)
+        exists = await db_manager.execute_prepared_val(exists_stmt, conn)
+        
+        if not exists:
+            raise HTTPException(status_code=404, detail=f"Record with ID {record_id} not found")
+        
+        # Prepare UPDATE query with parameters
+        update_stmt = db_manager.prepare_update_query(schema_name, table_name, record_id_final, data)
+        
+        # Execute update using prepared statement
+        row = await db_manager.execute_prepared_row(update_stmt, conn)
+        
+        if not row:
+            raise HTTPException(status_code=500, detail="Failed to update record")
+        
+        return RecordJSONResponse(_record_response(row))
+    
+    async def _delete(self, conn, schema_name: str, table_name: str, record_id: str) -> RecordJSONResponse:
+        """Delete a record and return it"""
+        record_id_final = _coerce_id(record_id)
+        
+        # Check if record exists using prepared statement
+        exists_stmt = db_manager.prepare_exists_query(schema_name, table_name, record_id_final)
+        exists = await db_manager.execute_prepared_val(exists_stmt, conn)
+        
+        if not exists:
+            raise HTTPException(status_code=404, detail=f"Record with ID {record_id} not found")
+        
+        # Prepare DELETE query with parameters
+        delete_stmt = db_manager.prepare_delete_query(schema_name, table_name, record_id_final)
+        
+        # Execute delete using prepared statement
+        row = await db_manager.execute_prepared_row(delete_stmt, conn)
+        
+        if not row:
+            raise HTTPException(status_code=500, detail="Failed to delete record")
+        
+        return RecordJSONResponse({
+            "message": "Record deleted successfully",
+            "deleted_record": _record_response(row)
+        })
+    
+    async def _upsert(self, conn, schema_name: str, table_name: str,
+                      record_id: str, data: Dict[str, Any]) -> RecordJSONResponse:
+        """Update a record if it exists, otherwise insert it with the given ID"""
+        record_id_final = _coerce_id(record_id)
+        
+        # Check if record exists using prepared statement
+        exists_stmt = db_manager.prepare_exists_query(schema_name, table_name, record_id_final)
+        exists = await db_manager.execute_prepared_val(exists_stmt, conn)
+        
+        if exists:
+            # Update existing record using prepared statement
+            update_stmt = db_manager.prepare_update_query(schema_name, table_name, record_id_final, data)
+            row = await db_manager.execute_prepared_row(update_stmt, conn)
+            operation = "updated"
+        else:
+            # Insert new record with the specified ID
+            data_with_id = {**data, 'id': record_id_final}
+            insert_stmt = db_manager.prepare_insert_query(schema_name, table_name, data_with_id)
+            row = await db_manager.execute_prepared_row(insert_stmt, conn)
+            operation = "created"
+        
+        if not row:
+            raise HTTPException(status_code=500, detail=f"Failed to {operation} record")
+        
+        return RecordJSONResponse({
+            "message": f"Record {operation} successfully",
+            "operation": operation,
+            "record": _record_response(row)
+        })
+    
+    async def _create_batch(self, conn, schema_name: str, table_name: str,
+                            records: List[Dict[str, Any]]) -> BatchResponse:
+        """Insert many records in one transaction, one set-based INSERT per column set"""
+        if not records:
+            raise HTTPException(status_code=400, detail="No records provided")
+        
+        # Records sharing a column set share one INSERT; indices put the ids back in request order
+        groups: Dict[tuple, List[int]] = {}
+        for index, data in enumerate(records):
+            groups.setdefault(tuple(sorted(data)), []).append(index)
+        
+        returning_id = await _has_id_column(conn, schema_name, table_name)
+        ids: List[Any] = [None] * len(records)
+        async with conn.transaction():
+            for indices in groups.values():
+                stmt = db_manager.prepare_insert_many_query(
+                    schema_name, table_name, [records[i] for i in indices], returning_id
+                )
+                rows = await db_manager.fetch_records(stmt, conn)
+                for index, row in zip(indices, rows):
+                    ids[index] = row['id']
+        
+        return BatchResponse(
+            message=f"{len(records)} records created successfully",
+            operation="created",
+            count=len(records),
+            ids=ids if returning_id else None
+        )
+    
+    async def _update_batch(self, conn, schema_name: str, table_name: str,
+                            records: List[RecordBatchUpdate]) -> BatchResponse:
+        """Update many records in one transaction, one set-based UPDATE per column set"""
+        if not records:
+            raise HTTPException(status_code=400, detail="No records provided")
+        
+        # column set -> {id: data}; a later entry for the same id replaces an earlier one
+        groups: Dict[tuple, Dict[Union[int, str], Dict[str, Any]]] = {}
+        record_ids = []
+        for record in records:
+            record_id = _coerce_id(record.id) if isinstance(record.id, str) else record.id
+            record_ids.append(record_id)
+            groups.setdefault(tuple(sorted(record.data)), {})[record_id] = record.data
+        record_ids = list(dict.fromkeys(record_ids))
+        
+        async with conn.transaction():
+            updated = set()
+            for updates in groups.values():
+                stmt = db_manager.prepare_update_many_query(schema_name, table_name, updates)
+                updated.update(row['id'] for row in await db_manager.fetch_records(stmt, conn))
+            # Any id that matched no row rolls back the whole batch, mirroring the single-record 404
+            if len(updated) != len(record_ids):
+                raise HTTPException(status_code=404, detail=f"{len(record_ids) - len(updated)} of the records to update were not found")
+        
+        return BatchResponse(
+            message=f"{len(records)} records updated successfully",
+            operation="updated",
+            count=len(records),
+            ids=record_ids
+        )
+    
     def _setup_routes(self):
         """Setup all CRUD routes"""
         
-        @self.router.get("/{schema_name}/{table_name}", response_model=RecordsResponse, summary="Read Records", description="Retrieve records from a table with pagination and optional ordering")
+        @self.router.get("/{schema_name}/{table_name}", responses={200: {"model": RecordsResponse}}, summary="Read Records", description="Retrieve records from a table with pagination and optional ordering")
         async def read_records(
             schema_name: str, 
             table_name: str, 
             limit: int = 100, 
             offset: int = 0,
-            order_by: Optional[str] = None
+            order_by: Optional[str] = None,
+            cursor: Optional[str] = None
         ):
             """
             Read records from a table - Retrieve records with pagination and optional ordering
@@ -173,11 +574,18 @@ class CrudRouter:
             - **limit**: Maximum number of records to return (default: 100, max: 1000)
             - **offset**: Number of records to skip for pagination (default: 0)
             - **order_by**: Column name to order results by (e.g., "created_at DESC")
+            - **cursor**: Opaque cursor from a previous response's next_cursor/prev_cursor
             
             Returns:
             - **records**: Array of record objects
             - **count**: Number of records returned in this response
             - **total_count**: Total number of records in the table
+            - **next_cursor**: Cursor for the following page, if any
+            - **prev_cursor**: Cursor for the preceding page, if any
+            
+            Cursors are returned when order_by is a single column with an optional
+            ASC/DESC (rows are then tie-broken on `id`). A cursor encodes its own
+            ordering, so order_by and offset are ignored when one is supplied.
             
             Each record contains:
             - **id**: Primary key value
@@ -188,61 +596,13 @@ class CrudRouter:
             Example:
             ```
             GET /crud/public/users?limit=10&offset=0&order_by=created_at DESC
+            GET /crud/public/users?limit=10&cursor=<next_cursor>
             ```
             """
-            try:
-                # Validate schema and table names
-                schema_name = sql_security.validate_schema_name(schema_name)
-                table_name = sql_security.validate_table_name(table_name)
-                
-                async with db_manager.get_connection() as conn:
-                    # Validate table exists using prepared statement
-                    table_exists_stmt = db_manager.prepare_table_exists_query(schema_name, table_name)
-                    table_exists = await db_manager.execute_prepared_val(table_exists_stmt, conn)
-                    
-                    if not table_exists:
-                        raise HTTPException(status_code=404, detail=f"Table {schema_name}.{table_name} not found")
-                    
-                    # Prepare SELECT query with parameters
-                    select_stmt = db_manager.prepare_select_query(
-                        schema_name=schema_name,
-                        table_name=table_name,
-                        order_by=order_by,
-                        limit=limit,
-                        offset=offset
-                    )
-                    
-                    # Prepare COUNT query
-                    count_stmt = db_manager.prepare_count_query(schema_name, table_name)
-                    
-                    # Execute queries using prepared statements
-                    total_count = await db_manager.execute_prepared_val(count_stmt, conn)
-                    rows = await db_manager.execute_prepared(select_stmt, conn)
-                    
-                    records = []
-                    for row in rows:
-                        # The database manager now returns a dict with converted datetime strings
-                        record_data = row
-                        
-                        records.append(RecordResponse(
-                            id=record_data.get('id'),  # Assuming 'id' is the primary key
-                            data=record_data,
-                            created_at=record_data.get('created_at'),
-                            updated_at=record_data.get('updated_at')
-                        ))
-                    
-                    return RecordsResponse(
-                        records=records,
-                        count=len(records),
-                        total_count=total_count
-                    )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to read records from {schema_name}.{table_name}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to read records: {str(e)}")
+            return await self._exec_crud("read_many", schema_name, table_name, limit=limit, offset=offset,
+                                         order_by=order_by, cursor=cursor)
 
-        @self.router.get("/{schema_name}/{table_name}/{record_id}", response_model=RecordResponse, summary="Read Single Record", description="Retrieve a specific record from a table by ID")
+        @self.router.get("/{schema_name}/{table_name}/{record_id}", responses={200: {"model": RecordResponse}}, summary="Read Single Record", description="Retrieve a specific record from a table by ID")
         async def read_record(schema_name: str, table_name: str, record_id: str):
             """
             Read a single record by ID - Retrieve a specific record from a table
@@ -267,58 +627,42 @@ class CrudRouter:
             GET /crud/public/users/123
             ```
             """
-            try:
-                # Validate schema and table names
-                schema_name = sql_security.validate_schema_name(schema_name)
-                table_name = sql_security.validate_table_name(table_name)
-                
-                async with db_manager.get_connection() as conn:
-                    # Validate table exists using prepared statement
-                    table_exists_stmt = db_manager.prepare_table_exists_query(schema_name, table_name)
-                    table_exists = await db_manager.execute_prepared_val(table_exists_stmt, conn)
-                    
-                    if not table_exists:
-                        raise HTTPException(status_code=404, detail=f"Table {schema_name}.{table_name} not found")
-                    
-                    # Try to convert record_id to integer if possible, otherwise use as string
-                    try:
-                        record_id_int = int(record_id)
-                        record_id_final = record_id_int
-                    except ValueError:
-                        # If not an integer, use as string
-                        record_id_final = record_id
-                    
-                    # Prepare SELECT query with parameters
-                    select_stmt = db_manager.prepare_select_query(
-                        schema_name=schema_name,
-                        table_name=table_name,
-                        where_clause="id = $1"
-                    )
-                    select_stmt.parameters = (record_id_final,)
-                    
-                    # Execute query using prepared statement
-                    row = await db_manager.execute_prepared_row(select_stmt, conn)
-                    
-                    if not row:
-                        raise HTTPException(status_code=404, detail=f"Record with ID {record_id} not found")
-                    
-                    # The database manager now returns a dict with converted datetime strings
-                    record_data = row
-                    
-                    return RecordResponse(
-                        id=record_data.get('id'),
-                        data=record_data,
-                        created_at=record_data.get('created_at'),
-                        updated_at=record_data.get('updated_at')
-                    )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to read record {record_id} from {schema_name}.{table_name}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to read record: {str(e)}")
+            return await self._exec_crud("read_one", schema_name, table_name, record_id=record_id)
 
-        @self.router.post("/{schema_name}/{table_name}", response_model=RecordResponse, summary="Create Record", description="Insert a new record into a table")
-        async def create_record(schema_name: str, table_name: str, record: RecordCreate):
+        # Registered before the single-record POST, whose {table_name} would also match "<table>:batch"
+        @self.router.post("/{schema_name}/{table_name}:batch", responses={200: {"model": BatchResponse}}, summary="Create Records in Batch", description="Insert many records into a table in a single transaction", openapi_extra=body_openapi(RecordCreate, array=True))
+        async def create_records_batch(schema_name: str, table_name: str, records: List[RecordCreate] = Depends(json_body(List[RecordCreate]))):
+            """
+            Create records in batch - Insert many records in one request and one transaction
+            
+            Records with the same set of fields are sent as one jsonb array to a single
+            set-based INSERT, so N records cost one HTTP request and one round trip per
+            distinct field set instead of N of each. Either all records are inserted or none.
+            
+            Parameters:
+            - **schema_name**: Name of the database schema
+            - **table_name**: Name of the table to insert into
+            - **records**: Array of records to insert
+            
+            Returns:
+            - **message**: Operation result message
+            - **operation**: "created"
+            - **count**: Number of records inserted
+            - **ids**: IDs of the inserted records in request order (null if the table has no `id` column)
+            
+            Example:
+            ```json
+            [
+                {"data": {"name": "John Doe", "status": "active"}},
+                {"data": {"name": "Jane Smith", "status": "active"}}
+            ]
+            ```
+            """
+            return await self._exec_crud("create_batch", schema_name, table_name,
+                                         records=[record.data for record in records])
+
+        @self.router.post("/{schema_name}/{table_name}", responses={200: {"model": RecordResponse}}, summary="Create Record", description="Insert a new record into a table", openapi_extra=body_openapi(RecordCreate))
+        async def create_record(schema_name: str, table_name: str, record: RecordCreate = Depends(json_body(RecordCreate))):
             """
             Create a new record - Insert a new record into a table
             
@@ -353,45 +697,39 @@ class CrudRouter:
             }
             ```
             """
-            try:
-                # Validate schema and table names
-                schema_name = sql_security.validate_schema_name(schema_name)
-                table_name = sql_security.validate_table_name(table_name)
-                
-                async with db_manager.get_connection() as conn:
-                    # Validate table exists using prepared statement
-                    table_exists_stmt = db_manager.prepare_table_exists_query(schema_name, table_name)
-                    table_exists = await db_manager.execute_prepared_val(table_exists_stmt, conn)
-                    
-                    if not table_exists:
-                        raise HTTPException(status_code=404, detail=f"Table {schema_name}.{table_name} not found")
-                    
-                    # Prepare INSERT query with parameters
-                    insert_stmt = db_manager.prepare_insert_query(schema_name, table_name, record.data)
-                    
-                    # Execute insert using prepared statement
-                    row = await db_manager.execute_prepared_row(insert_stmt, conn)
-                    
-                    if not row:
-                        raise HTTPException(status_code=500, detail="Failed to create record")
-                    
-                    # The database manager now returns a dict with converted datetime strings
-                    record_data = row
-                    
-                    return RecordResponse(
-                        id=record_data.get('id'),
-                        data=record_data,
-                        created_at=record_data.get('created_at'),
-                        updated_at=record_data.get('updated_at')
-                    )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to create record in {schema_name}.{table_name}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to create record: {str(e)}")
+            return await self._exec_crud("create", schema_name, table_name, data=record.data)
 
-        @self.router.put("/{schema_name}/{table_name}/{record_id}", response_model=RecordResponse, summary="Update Record", description="Modify an existing record in a table")
-        async def update_record(schema_name: str, table_name: str, record_id: str, record: RecordUpdate):
+        @self.router.put("/{schema_name}/{table_name}:batch", responses={200: {"model": BatchResponse}}, summary="Update Records in Batch", description="Modify many existing records in a table in a single transaction", openapi_extra=body_openapi(RecordBatchUpdate, array=True))
+        async def update_records_batch(schema_name: str, table_name: str, records: List[RecordBatchUpdate] = Depends(json_body(List[RecordBatchUpdate]))):
+            """
+            Update records in batch - Modify many records in one request and one transaction
+            
+            Records with the same set of fields are applied by a single set-based UPDATE ... FROM.
+            If any of the IDs does not exist nothing is updated and 404 is returned.
+            
+            Parameters:
+            - **schema_name**: Name of the database schema
+            - **table_name**: Name of the table to update
+            - **records**: Array of objects with the record `id` and the `data` fields to update
+            
+            Returns:
+            - **message**: Operation result message
+            - **operation**: "updated"
+            - **count**: Number of records updated
+            - **ids**: Distinct IDs of the updated records in request order
+            
+            Example:
+            ```json
+            [
+                {"id": 123, "data": {"status": "inactive"}},
+                {"id": 124, "data": {"status": "inactive"}}
+            ]
+            ```
+            """
+            return await self._exec_crud("update_batch", schema_name, table_name, records=records)
+
+        @self.router.put("/{schema_name}/{table_name}/{record_id}", responses={200: {"model": RecordResponse}}, summary="Update Record", description="Modify an existing record in a table", openapi_extra=body_openapi(RecordUpdate))
+        async def update_record(schema_name: str, table_name: str, record_id: str, record: RecordUpdate = Depends(json_body(RecordUpdate))):
             """
             Update an existing record - Modify a record in a table
             
@@ -424,59 +762,9 @@ class CrudRouter:
             }
             ```
             """
-            try:
-                # Validate schema and table names
-                schema_name = sql_security.validate_schema_name(schema_name)
-                table_name = sql_security.validate_table_name(table_name)
-                
-                async with db_manager.get_connection() as conn:
-                    # Validate table exists using prepared statement
-                    table_exists_stmt = db_manager.prepare_table_exists_query(schema_name, table_name)
-                    table_exists = await db_manager.execute_prepared_val(table_exists_stmt, conn)
-                    
-                    if not table_exists:
-                        raise HTTPException(status_code=404, detail=f"Table {schema_name}.{table_name} not found")
-                    
-                    # Try to convert record_id to integer if possible, otherwise use as string
-                    try:
-                        record_id_int = int(record_id)
-                        record_id_final = record_id_int
-                    except ValueError:
-                        # If not an integer, use as string
-                        record_id_final = record_id
-                    
-                    # Check if record exists using prepared statement
-                    exists_stmt = db_manager.prepare_exists_query(schema_name, table_name, record_id_final)
-                    exists = await db_manager.execute_prepared_val(exists_stmt, conn)
-                    
-                    if not exists:
-                        raise HTTPException(status_code=404, detail=f"Record with ID {record_id} not found")
-                    
-                    # Prepare UPDATE query with parameters
-                    update_stmt = db_manager.prepare_update_query(schema_name, table_name, record_id_final, record.data)
-                    
-                    # Execute update using prepared statement
-                    row = await db_manager.execute_prepared_row(update_stmt, conn)
-                    
-                    if not row:
-                        raise HTTPException(status_code=500, detail="Failed to update record")
-                    
-                    # The database manager now returns a dict with converted datetime strings
-                    record_data = row
-                    
-                    return RecordResponse(
-                        id=record_data.get('id'),
-                        data=record_data,
-                        created_at=record_data.get('created_at'),
-                        updated_at=record_data.get('updated_at')
-                    )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to update record {record_id} in {schema_name}.{table_name}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to update record: {str(e)}")
+            return await self._exec_crud("update", schema_name, table_name, record_id=record_id, data=record.data)
 
-        @self.router.delete("/{schema_name}/{table_name}/{record_id}", response_model=DeleteResponse, summary="Delete Record", description="Remove a record from a table")
+        @self.router.delete("/{schema_name}/{table_name}/{record_id}", responses={200: {"model": DeleteResponse}}, summary="Delete Record", description="Remove a record from a table")
         async def delete_record(schema_name: str, table_name: str, record_id: str):
             """
             Delete a record - Remove a record from a table
@@ -498,63 +786,10 @@ class CrudRouter:
             DELETE /crud/public/users/123
             ```
             """
-            try:
-                # Validate schema and table names
-                schema_name = sql_security.validate_schema_name(schema_name)
-                table_name = sql_security.validate_table_name(table_name)
-                
-                async with db_manager.get_connection() as conn:
-                    # Validate table exists using prepared statement
-                    table_exists_stmt = db_manager.prepare_table_exists_query(schema_name, table_name)
-                    table_exists = await db_manager.execute_prepared_val(table_exists_stmt, conn)
-                    
-                    if not table_exists:
-                        raise HTTPException(status_code=404, detail=f"Table {schema_name}.{table_name} not found")
-                    
-                    # Try to convert record_id to integer if possible, otherwise use as string
-                    try:
-                        record_id_int = int(record_id)
-                        record_id_final = record_id_int
-                    except ValueError:
-                        # If not an integer, use as string
-                        record_id_final = record_id
-                    
-                    # Check if record exists using prepared statement
-                    exists_stmt = db_manager.prepare_exists_query(schema_name, table_name, record_id_final)
-                    exists = await db_manager.execute_prepared_val(exists_stmt, conn)
-                    
-                    if not exists:
-                        raise HTTPException(status_code=404, detail=f"Record with ID {record_id} not found")
-                    
-                    # Prepare DELETE query with parameters
-                    delete_stmt = db_manager.prepare_delete_query(schema_name, table_name, record_id_final)
-                    
-                    # Execute delete using prepared statement
-                    row = await db_manager.execute_prepared_row(delete_stmt, conn)
-                    
-                    if not row:
-                        raise HTTPException(status_code=500, detail="Failed to delete record")
-                    
-                    # The database manager now returns a dict with converted datetime strings
-                    record_data = row
-                    
-                    return {
-                        "message": "Record deleted successfully",
-                        "deleted_record": RecordResponse(
-                            id=record_data.get('id'),
-                            data=record_data,
-                            created_at=record_data.get('created_at'),
-                            updated_at=record_data.get('updated_at')
-                        )
-                    }
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to delete record {record_id} from {schema_name}.{table_name}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to delete record: {str(e)}")
+            return await self._exec_crud("delete", schema_name, table_name, record_id=record_id)
 
-        @self.router.patch("/{schema_name}/{table_name}/{record_id}", response_model=UpsertResponse, summary="Upsert Record", description="Insert if not exists, update if exists")
-        async def upsert_record(schema_name: str, table_name: str, record_id: str, record: RecordUpdate):
+        @self.router.patch("/{schema_name}/{table_name}/{record_id}", responses={200: {"model": UpsertResponse}}, summary="Upsert Record", description="Insert if not exists, update if exists", openapi_extra=body_openapi(RecordUpdate))
+        async def upsert_record(schema_name: str, table_name: str, record_id: str, record: RecordUpdate = Depends(json_body(RecordUpdate))):
             """
             Upsert a record - Insert if not exists, update if exists
             
@@ -588,65 +823,7 @@ class CrudRouter:
             }
             ```
             """
-            try:
-                # Validate schema and table names
-                schema_name = sql_security.validate_schema_name(schema_name)
-                table_name = sql_security.validate_table_name(table_name)
-                
-                async with db_manager.get_connection() as conn:
-                    # Validate table exists using prepared statement
-                    table_exists_stmt = db_manager.prepare_table_exists_query(schema_name, table_name)
-                    table_exists = await db_manager.execute_prepared_val(table_exists_stmt, conn)
-                    
-                    if not table_exists:
-                        raise HTTPException(status_code=404, detail=f"Table {schema_name}.{table_name} not found")
-                    
-                    # Try to convert record_id to integer if possible, otherwise use as string
-                    try:
-                        record_id_int = int(record_id)
-                        record_id_final = record_id_int
-                    except ValueError:
-                        # If not an integer, use as string
-                        record_id_final = record_id
-                    
-                    # Check if record exists using prepared statement
-                    exists_stmt = db_manager.prepare_exists_query(schema_name, table_name, record_id_final)
-                    exists = await db_manager.execute_prepared_val(exists_stmt, conn)
-                    
-                    if exists:
-                        # Update existing record using prepared statement
-                        update_stmt = db_manager.prepare_update_query(schema_name, table_name, record_id_final, record.data)
-                        row = await db_manager.execute_prepared_row(update_stmt, conn)
-                        operation = "updated"
-                    else:
-                        # Insert new record with the specified ID
-                        data_with_id = record.data.copy()
-                        data_with_id['id'] = record_id_final
-                        insert_stmt = db_manager.prepare_insert_query(schema_name, table_name, data_with_id)
-                        row = await db_manager.execute_prepared_row(insert_stmt, conn)
-                        operation = "created"
-                    
-                    if not row:
-                        raise HTTPException(status_code=500, detail=f"Failed to {operation} record")
-                    
-                    # The database manager now returns a dict with converted datetime strings
-                    record_data = row
-                    
-                    return {
-                        "message": f"Record {operation} successfully",
-                        "operation": operation,
-                        "record": RecordResponse(
-                            id=record_data.get('id'),
-                            data=record_data,
-                            created_at=record_data.get('created_at'),
-                            updated_at=record_data.get('updated_at')
-                        )
-                    }
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to upsert record {record_id} in {schema_name}.{table_name}: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to upsert record: {str(e)}")
+            return await self._exec_crud("upsert", schema_name, table_name, record_id=record_id, data=record.data)
 
 # Create router instance
 crud_router = CrudRouter().router
@@ -1,111 +1,165 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel
+import sys
+from typing import Annotated, Optional, List, Dict, Any, Literal, Union
+from pydantic import AfterValidator, BaseModel, ConfigDict, ValidationError
 import re
 
-from app.core.database import db_manager, PreparedStatement
-from app.core.sql_security import sql_security
+from app.core.config import settings
+from app.core.database import db_manager, PreparedStatement, PoolTimeoutError, parse_affected_rows
+from app.core.request_body import body_openapi, json_body
+from app.core.responses import RecordJSONResponse, dumps
+from app.core.sql_security import count_placeholders, validate_sql_cached
 
 logger = logging.getLogger(__name__)
 
-def convert_parameters_to_tuple(parameters: Optional[Dict[str, Any]]) -> tuple:
+# Hot-path callables bound once at import instead of resolved through attributes per request
+_get_db_connection = db_manager.get_connection
+_fetch_records = db_manager.fetch_records
+_validate_cached = validate_sql_cached
+
+def _get_connection():
+    """Pooled connection with a bounded wait; see _pool_busy for the 503 conversion"""
+    return _get_db_connection(timeout=settings.POOL_ACQUIRE_TIMEOUT)
+
+def _pool_busy(e: PoolTimeoutError) -> HTTPException:
+    """HTTP 503 for requests that could not get a pooled connection in time"""
+    return HTTPException(status_code=503, detail=f"Database busy: {str(e)}")
+
+def convert_parameters_to_tuple(parameters: Optional[Union[List[Any], Dict[str, Any]]]) -> tuple:
     """
-    Convert parameters dictionary to tuple in correct numeric order.
+    Convert request parameters to a tuple bound to $1, $2, ... in order.
+    
+    A list is already positional and is used as-is. The legacy dictionary form
+    must be keyed exactly "1".."N"; each key is looked up by position, so a
+    client's key order can never change which value binds to which placeholder.
     
-    This ensures that parameters with keys "1", "2", "3" are bound to
-    $1, $2, $3 in the correct order, preventing SQL injection from
-    parameter ordering issues.
+    Raises:
+        HTTPException: If a dictionary is not keyed "1".."N"
     """
     if not parameters:
         return ()
     
-    # Sort parameter keys numerically to ensure correct order
-    sorted_keys = sorted(parameters.keys(), key=lambda x: int(x) if x.isdigit() else float('inf'))
-    return tuple(parameters[key] for key in sorted_keys)
+    if isinstance(parameters, list):
+        return tuple(parameters)
+    
+    try:
+        return tuple(parameters[str(i)] for i in range(1, len(parameters) + 1))
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f'Parameter keys must be "1" to "{len(parameters)}" matching $1..${len(parameters)}'
+        )
+
+_RETURNING_RE = re.compile(r'\bRETURNING\b', re.IGNORECASE)
+
+def _validation_cache_stats() -> Dict[str, int]:
+    """Counters of the shared validation cache (raw and prepared routers); misses approximate unique statements validated"""
+    info = _validate_cached.cache_info()
+    return {"max_size": info.maxsize, "size": info.currsize, "hits": info.hits, "misses": info.misses}
+
+# Statement text is interned so repeats of the same SQL share one string object, making
+# validation-cache and asyncpg statement-cache lookups pointer comparisons
+InternedSQL = Annotated[str, AfterValidator(sys.intern)]
 
 # Pydantic models for prepared SQL operations
 class PreparedSQLRequest(BaseModel):
     """Model for prepared SQL requests"""
-    sql: str
-    parameters: Optional[Dict[str, Any]] = None
+    sql: InternedSQL
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
     operation_type: str = "read"  # "read" or "write"
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "SELECT * FROM users WHERE department = $1 AND active = $2",
-                "parameters": {
-                    "1": "engineering",
-                    "2": True
-                },
-                "operation_type": "read"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "sql": "SELECT * FROM users WHERE department = $1 AND active = $2",
+            "parameters": ["engineering", True],
+            "operation_type": "read"
         }
+    })
 
 class PreparedSelectRequest(BaseModel):
     """Model for prepared SELECT requests"""
-    sql: str
-    parameters: Optional[Dict[str, Any]] = None
+    sql: InternedSQL
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "SELECT * FROM users WHERE age > $1 AND status = $2 ORDER BY created_at DESC",
-                "parameters": {
-                    "1": 18,
-                    "2": "active"
-                }
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "sql": "SELECT * FROM users WHERE age > $1 AND status = $2 ORDER BY created_at DESC",
+            "parameters": [18, "active"]
         }
+    })
 
 class PreparedInsertRequest(BaseModel):
     """Model for prepared INSERT requests"""
-    sql: str
-    parameters: Optional[Dict[str, Any]] = None
+    sql: InternedSQL
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "INSERT INTO users (name, email, department) VALUES ($1, $2, $3) RETURNING *",
-                "parameters": {
-                    "1": "Jane Smith",
-                    "2": "jane@example.com",
-                    "3": "marketing"
-                }
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "sql": "INSERT INTO users (name, email, department) VALUES ($1, $2, $3) RETURNING *",
+            "parameters": ["Jane Smith", "jane@example.com", "marketing"]
         }
+    })
 
 class PreparedUpdateRequest(BaseModel):
     """Model for prepared UPDATE requests"""
-    sql: str
-    parameters: Optional[Dict[str, Any]] = None
+    sql: InternedSQL
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "UPDATE users SET status = $1, updated_at = NOW() WHERE id = $2 RETURNING *",
-                "parameters": {
-                    "1": "inactive",
-                    "2": 123
-                }
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "sql": "UPDATE users SET status = $1, updated_at = NOW() WHERE id = $2 RETURNING *",
+            "parameters": ["inactive", 123]
         }
+    })
 
 class PreparedDeleteRequest(BaseModel):
     """Model for prepared DELETE requests"""
-    sql: str
-    parameters: Optional[Dict[str, Any]] = None
+    sql: InternedSQL
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "DELETE FROM users WHERE id = $1 RETURNING *",
-                "parameters": {
-                    "1": 123
-                }
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "sql": "DELETE FROM users WHERE id = $1 RETURNING *",
+            "parameters": [123]
         }
+    })
+
+class PreparedExecuteManyRequest(BaseModel):
+    """Model for prepared batch write requests"""
+    sql: InternedSQL
+    parameter_sets: List[List[Any]]
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "sql": "INSERT INTO users (name, email, department) VALUES ($1, $2, $3)",
+            "parameter_sets": [
+                ["Jane Smith", "jane@example.com", "marketing"],
+                ["John Doe", "john@example.com", "engineering"]
+            ]
+        }
+    })
+
+class PreparedPipelineStatement(BaseModel):
+    """Model for one statement of a prepared pipeline"""
+    sql: InternedSQL
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
+    operation_type: str = "write"  # only "write" is accepted
+
+class PreparedPipelineRequest(BaseModel):
+    """Model for prepared pipeline requests"""
+    statements: List[PreparedPipelineStatement]
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "statements": [
+                {"sql": "INSERT INTO users (name, email) VALUES ($1, $2)", "parameters": ["Jane Smith", "jane@example.com"]},
+                {"sql": "UPDATE users SET department = $1 WHERE email = $2", "parameters": ["marketing", "jane@example.com"]},
+                {"sql": "DELETE FROM users WHERE status = $1", "parameters": ["inactive"]}
+            ]
+        }
+    })
 
 class PreparedSQLResponse(BaseModel):
     """Model for prepared SQL responses"""
@@ -115,26 +169,41 @@ class PreparedSQLResponse(BaseModel):
     row_count: Optional[int] = None
     affected_rows: Optional[int] = None
     sql: str
-    parameters: Optional[Dict[str, Any]] = None
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Prepared SQL query executed successfully. Rows returned: 2",
-                "data": [
-                    {"id": 1, "name": "John Doe", "department": "engineering", "active": True},
-                    {"id": 2, "name": "Jane Smith", "department": "engineering", "active": True}
-                ],
-                "row_count": 2,
-                "affected_rows": None,
-                "sql": "SELECT * FROM users WHERE department = $1 AND active = $2",
-                "parameters": {
-                    "1": "engineering",
-                    "2": True
-                }
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "success": True,
+            "message": "Prepared SQL query executed successfully. Rows returned: 2",
+            "data": [
+                {"id": 1, "name": "John Doe", "department": "engineering", "active": True},
+                {"id": 2, "name": "Jane Smith", "department": "engineering", "active": True}
+            ],
+            "row_count": 2,
+            "affected_rows": None,
+            "sql": "SELECT * FROM users WHERE department = $1 AND active = $2",
+            "parameters": ["engineering", True]
         }
+    })
+
+def _sql_response(message: str, sql: str, parameters: Optional[Union[List[Any], Dict[str, Any]]],
+                  data: Optional[List[Any]] = None, row_count: Optional[int] = None,
+                  affected_rows: Optional[int] = None) -> RecordJSONResponse:
+    """
+    Render a PreparedSQLResponse-shaped body directly, without building and revalidating the model
+    
+    data may hold asyncpg Records, which RecordJSONResponse serializes without an
+    intermediate per-row dict and datetime-to-string pass.
+    """
+    return RecordJSONResponse({
+        "success": True,
+        "message": message,
+        "data": data,
+        "row_count": row_count,
+        "affected_rows": affected_rows,
+        "sql": sql,
+        "parameters": parameters
+    })
 
 class PreparedStatementInfo(BaseModel):
     """Model for prepared statement information"""
@@ -143,74 +212,207 @@ class PreparedStatementInfo(BaseModel):
     parameter_count: int
     created_at: str
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "user_query_1",
-                "sql": "SELECT * FROM users WHERE id = $1",
-                "parameter_count": 1,
-                "created_at": "2024-01-15T10:30:00Z"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "name": "user_query_1",
+            "sql": "SELECT * FROM users WHERE id = $1",
+            "parameter_count": 1,
+            "created_at": "2024-01-15T10:30:00Z"
+        }
+    })
+
+class PipelineResult(BaseModel):
+    """Model for the outcome of one pipeline statement"""
+    affected_rows: int
+
+class PreparedPipelineResponse(BaseModel):
+    """Model for prepared pipeline responses"""
+    success: bool
+    message: str
+    results: List[PipelineResult]
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "success": True,
+            "message": "Prepared SQL pipeline executed successfully. Statements executed: 3",
+            "results": [{"affected_rows": 1}, {"affected_rows": 1}, {"affected_rows": 4}]
         }
+    })
 
 class StatementsResponse(BaseModel):
     """Model for prepared statements list response"""
     statements: List[PreparedStatementInfo]
     count: int
     message: str
+    cache_stats: Optional[Dict[str, int]] = None
+    validation_cache_stats: Optional[Dict[str, int]] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "statements": [
-                    {
-                        "name": "user_query_1",
-                        "sql": "SELECT * FROM users WHERE id = $1",
-                        "parameter_count": 1,
-                        "created_at": "2024-01-15T10:30:00Z"
-                    }
-                ],
-                "count": 1,
-                "message": "Found 1 cached prepared statements"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "statements": [
+                {
+                    "name": "user_query_1",
+                    "sql": "SELECT * FROM users WHERE id = $1",
+                    "parameter_count": 1,
+                    "created_at": "2024-01-15T10:30:00Z"
+                }
+            ],
+            "count": 1,
+            "message": "Found 1 cached prepared statements",
+            "cache_stats": {"max_size": 1024, "hits": 10, "misses": 1, "evictions": 0},
+            "validation_cache_stats": {"max_size": 4096, "size": 12, "hits": 480, "misses": 12}
         }
+    })
 
 class ValidationResponse(BaseModel):
     """Model for SQL validation response"""
     valid: bool
     message: str
     sql: str
-    parameters: Optional[Dict[str, Any]] = None
+    parameters: Optional[Union[List[Any], Dict[str, Any]]] = None
     placeholder_count: Optional[int] = None
     parameter_count: Optional[int] = None
     operation_type: Optional[str] = None
     error: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "valid": True,
-                "message": "Prepared SQL statement is valid",
-                "sql": "SELECT * FROM users WHERE id = $1",
-                "parameters": {"1": 123},
-                "placeholder_count": 1,
-                "parameter_count": 1,
-                "operation_type": "read"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "valid": True,
+            "message": "Prepared SQL statement is valid",
+            "sql": "SELECT * FROM users WHERE id = $1",
+            "parameters": [123],
+            "placeholder_count": 1,
+            "parameter_count": 1,
+            "operation_type": "read"
         }
+    })
+
+def _validation_response(valid: bool, message: str, sql: str,
+                         parameters: Optional[Union[List[Any], Dict[str, Any]]],
+                         placeholder_count: Optional[int] = None, parameter_count: Optional[int] = None,
+                         operation_type: Optional[str] = None, error: Optional[str] = None) -> RecordJSONResponse:
+    """Render a ValidationResponse-shaped body directly, with every field present as the model would emit it"""
+    return RecordJSONResponse({
+        "valid": valid,
+        "message": message,
+        "sql": sql,
+        "parameters": parameters,
+        "placeholder_count": placeholder_count,
+        "parameter_count": parameter_count,
+        "operation_type": operation_type,
+        "error": error
+    })
+
+# Largest number of requests accepted by /batch
+_MAX_BATCH_SIZE = 100
+# Pooled connections one /batch call may hold at once, so a batch never starves other clients
+_BATCH_CONCURRENCY = max(1, settings.MAX_CONNECTIONS // 4)
+
+class PreparedBatchItem(BaseModel):
+    """Model for one request of a prepared batch"""
+    endpoint: Literal["validate", "select", "execute"]
+    body: Dict[str, Any]
+
+class PreparedBatchRequest(BaseModel):
+    """Model for prepared batch requests"""
+    requests: List[PreparedBatchItem]
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "requests": [
+                {"endpoint": "validate", "body": {"sql": "SELECT * FROM users WHERE id = $1", "parameters": [123]}},
+                {"endpoint": "select", "body": {"sql": "SELECT COUNT(*) AS total FROM users"}},
+                {"endpoint": "execute", "body": {"sql": "SELECT name FROM users WHERE id = $1", "parameters": [123]}}
+            ]
+        }
+    })
+
+class PreparedBatchItemResult(BaseModel):
+    """Model for the outcome of one batch request"""
+    status_code: int
+    body: Dict[str, Any]
+
+class PreparedBatchResponse(BaseModel):
+    """Model for prepared batch responses"""
+    results: List[PreparedBatchItemResult]
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "results": [
+                {"status_code": 200, "body": {"valid": True, "message": "Prepared SQL statement is valid"}},
+                {"status_code": 200, "body": {"success": True, "data": [{"total": 42}], "row_count": 1}},
+                {"status_code": 400, "body": {"detail": "Read operations must start with SELECT"}}
+            ]
+        }
+    })
 
 class PreparedRouter:
     """Prepared SQL router for advanced prepared statement operations"""
     
     def __init__(self):
-        self.router = APIRouter(prefix="/crud/prepared", tags=["Prepared SQL Operations"])
+        # orjson-backed default response class for every route
+        self.router = APIRouter(prefix="/crud/prepared", tags=["Prepared SQL Operations"],
+                                default_response_class=RecordJSONResponse)
         self._setup_routes()
     
+    async def _run_write(self, label: str, sql: str,
+                         request_parameters: Optional[Union[List[Any], Dict[str, Any]]]) -> RecordJSONResponse:
+        """Execute a validated write statement and build its response"""
+        # Convert parameters to tuple in correct numeric order
+        parameters = convert_parameters_to_tuple(request_parameters)
+        
+        async with _get_connection() as conn:
+            if _RETURNING_RE.search(sql):
+                # The returned Record is serialized as-is by the response
+                row = await conn.fetchrow(sql, *parameters)
+                data = [row] if row else []
+                affected_rows = 1 if row else 0
+                
+                return _sql_response(
+                    message=f"Prepared {label} query executed successfully. Affected rows: {affected_rows}",
+                    data=data,
+                    row_count=len(data),
+                    affected_rows=affected_rows,
+                    sql=sql,
+                    parameters=request_parameters
+                )
+            
+            # Use execute for queries that don't return data
+            result = await conn.execute(sql, *parameters)
+            affected_rows = parse_affected_rows(result)
+            
+            return _sql_response(
+                message=f"Prepared {label} query executed successfully. Affected rows: {affected_rows}",
+                affected_rows=affected_rows,
+                sql=sql,
+                parameters=request_parameters
+            )
+    
+    async def _exec_write(self, op: str, request) -> RecordJSONResponse:
+        """
+        Shared body of the /insert, /update and /delete endpoints
+        
+        Validates the SQL as a write, executes it and converts unexpected errors
+        into HTTP 500 responses labelled with `op` (e.g. "INSERT").
+        """
+        try:
+            # Validate SQL using sql_security (cached per statement text)
+            _validate_cached(request.sql, "write")
+            logger.info("Executing prepared %s: %s", op, request.sql)
+            return await self._run_write(op, request.sql, request.parameters)
+        except HTTPException:
+            raise
+        except PoolTimeoutError as e:
+            raise _pool_busy(e)
+        except Exception as e:
+            logger.error(f"Failed to execute prepared {op}: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to execute prepared {op}: {str(e)}")
+    
     def _setup_routes(self):
         """Setup all prepared SQL routes"""
         
-        @self.router.post("/execute", response_model=PreparedSQLResponse, summary="Execute Prepared SQL", description="Execute a prepared SQL statement with parameters")
-        async def execute_prepared_sql(request: PreparedSQLRequest):
+        @self.router.post("/execute", responses={200: {"model": PreparedSQLResponse}}, summary="Execute Prepared SQL", description="Execute a prepared SQL statement with parameters", openapi_extra=body_openapi(PreparedSQLRequest))
+        async def execute_prepared_sql(request: PreparedSQLRequest = Depends(json_body(PreparedSQLRequest))):
             """
             Execute a prepared SQL statement with parameters
             
@@ -220,7 +422,8 @@ class PreparedRouter:
             
             Parameters:
             - **sql**: The SQL query to execute
-            - **parameters**: Optional dictionary of parameters to bind (using $1, $2, etc. placeholders)
+            - **parameters**: Optional list of parameters bound to the $1, $2, etc. placeholders in order
+              (a dictionary keyed "1", "2", ... is still accepted)
             - **operation_type**: Type of operation ("read" or "write")
             
             Returns:
@@ -236,90 +439,163 @@ class PreparedRouter:
             ```json
             {
                 "sql": "SELECT * FROM users WHERE department = $1 AND active = $2",
-                "parameters": {
-                    "1": "engineering",
-                    "2": true
-                },
+                "parameters": ["engineering", true],
                 "operation_type": "read"
             }
             ```
             """
             try:
-                # Validate SQL using sql_security
-                sql_security.validate_sql_statement(request.sql, request.operation_type)
-                logger.info(f"Executing prepared SQL: {request.sql}")
+                # Validate SQL using sql_security (cached per statement text)
+                _validate_cached(request.sql, request.operation_type)
+                logger.info("Executing prepared SQL: %s", request.sql)
 
-                async with db_manager.get_connection() as conn:
-                    # Convert parameters to tuple in correct numeric order
-                    parameters = convert_parameters_to_tuple(request.parameters)
-                    
-                    # Create prepared statement
-                    stmt = PreparedStatement(request.sql, parameters)
+                if request.operation_type != "read":
+                    return await self._run_write("SQL write", request.sql, request.parameters)
+                
+                # Convert parameters to tuple in correct numeric order
+                parameters = convert_parameters_to_tuple(request.parameters)
+                
+                async with _get_connection() as conn:
+                    # Execute read operation; Records are serialized directly by the response
+                    data = await _fetch_records(PreparedStatement(request.sql, parameters), conn)
                     
-                    if request.operation_type == "read":
-                        # Execute read operation
-                        rows = await db_manager.execute_prepared(stmt, conn)
-                        data = [dict(row) for row in rows]
-                        
-                        return PreparedSQLResponse(
-                            success=True,
-                            message=f"Prepared SQL query executed successfully. Rows returned: {len(data)}",
-                            data=data,
-                            row_count=len(data),
-                            sql=request.sql,
-                            parameters=request.parameters
-                        )
-                    else:
-                        # Execute write operation using proper parameterized query
-                        # Check if query has RETURNING clause to determine if we should fetch rows
-                        has_returning = bool(re.search(r'\bRETURNING\b', request.sql, re.IGNORECASE))
-                        if has_returning:
-                            # Use execute_prepared_row for queries that return data
-                            row = await db_manager.execute_prepared_row(stmt, conn)
-                            data = [row] if row else []
-                            affected_rows = 1 if row else 0
-                            
-                            return PreparedSQLResponse(
-                                success=True,
-                                message=f"Prepared SQL write query executed successfully. Affected rows: {affected_rows}",
-                                data=data,
-                                row_count=len(data),
-                                affected_rows=affected_rows,
-                                sql=request.sql,
-                                parameters=request.parameters
-                            )
-                        else:
-                            # Use execute for queries that don't return data
-                            result = await conn.execute(stmt.sql, *stmt.parameters)
-                        
-                            # Parse the result to extract the number of affected rows
-                            affected_rows = 0
-                            if result:
-                                try:
-                                    # Result format is like "UPDATE 1" or "INSERT 0 1"
-                                    parts = result.split()
-                                    if len(parts) >= 2:
-                                        affected_rows = int(parts[-1])  # Last part is usually the count
-                                    else:
-                                        affected_rows = int(result)
-                                except (ValueError, IndexError):
-                                    affected_rows = 0
-                            
-                            return PreparedSQLResponse(
-                                success=True,
-                                message=f"Prepared SQL write query executed successfully. Affected rows: {affected_rows}",
-                                affected_rows=affected_rows,
-                                sql=request.sql,
-                                parameters=request.parameters
-                            )
+                    return _sql_response(
+                        message=f"Prepared SQL query executed successfully. Rows returned: {len(data)}",
+                        data=data,
+                        row_count=len(data),
+                        sql=request.sql,
+                        parameters=request.parameters
+                    )
             except HTTPException:
                 raise
+            except PoolTimeoutError as e:
+                raise _pool_busy(e)
             except Exception as e:
                 logger.error(f"Failed to execute prepared SQL: {e}")
                 raise HTTPException(status_code=500, detail=f"Failed to execute prepared SQL: {str(e)}")
 
-        @self.router.post("/select", response_model=PreparedSQLResponse, summary="Execute Prepared SELECT", description="Execute a prepared SELECT statement with parameters")
-        async def execute_prepared_select(request: PreparedSelectRequest):
+        @self.router.post("/executemany", responses={200: {"model": PreparedSQLResponse}}, summary="Execute Prepared SQL in Batch", description="Execute a prepared write statement once per parameter set", openapi_extra=body_openapi(PreparedExecuteManyRequest))
+        async def execute_prepared_many(request: PreparedExecuteManyRequest = Depends(json_body(PreparedExecuteManyRequest))):
+            """
+            Execute a prepared write statement once per parameter set
+            
+            The SQL is validated once and sent to the database with a single executemany call
+            on one connection, so N rows cost one request, one statement preparation and one
+            pipelined round trip instead of N of each. The batch is atomic: if any parameter
+            set fails, none of them are applied. Rows from a RETURNING clause are discarded.
+            
+            Parameters:
+            - **sql**: The INSERT, UPDATE or DELETE statement to execute
+            - **parameter_sets**: Array of parameter lists, each bound to $1, $2, etc. in order
+            
+            Returns:
+            - **success**: Whether the batch executed successfully
+            - **message**: Human-readable message about the execution
+            - **affected_rows**: Number of parameter sets executed
+            - **sql**: The SQL statement that was executed
+            
+            Example:
+            ```json
+            {
+                "sql": "INSERT INTO users (name, email, department) VALUES ($1, $2, $3)",
+                "parameter_sets": [
+                    ["Jane Smith", "jane@example.com", "marketing"],
+                    ["John Doe", "john@example.com", "engineering"]
+                ]
+            }
+            ```
+            """
+            try:
+                # Validate SQL using sql_security (cached per statement text)
+                _validate_cached(request.sql, "write")
+                if not request.parameter_sets:
+                    raise HTTPException(status_code=400, detail="No parameter sets provided")
+                logger.info("Executing prepared SQL batch of %d: %s", len(request.parameter_sets), request.sql)
+                
+                async with _get_connection() as conn:
+                    await conn.executemany(request.sql, request.parameter_sets)
+                
+                affected_rows = len(request.parameter_sets)
+                return _sql_response(
+                    message=f"Prepared SQL batch executed successfully. Parameter sets executed: {affected_rows}",
+                    affected_rows=affected_rows,
+                    sql=request.sql,
+                    parameters=None
+                )
+            except HTTPException:
+                raise
+            except PoolTimeoutError as e:
+                raise _pool_busy(e)
+            except Exception as e:
+                logger.error(f"Failed to execute prepared SQL batch: {e}")
+                raise HTTPException(status_code=500, detail=f"Failed to execute prepared SQL batch: {str(e)}")
+
+        @self.router.post("/pipeline", responses={200: {"model": PreparedPipelineResponse}}, summary="Execute Prepared SQL Pipeline", description="Execute a list of prepared statements in one transaction", openapi_extra=body_openapi(PreparedPipelineRequest))
+        async def execute_prepared_pipeline(request: PreparedPipelineRequest = Depends(json_body(PreparedPipelineRequest))):
+            """
+            Execute a list of prepared statements in one transaction on one connection
+            
+            Every statement is validated and its parameters converted before a connection is
+            acquired, so K statements cost one pool acquire and one transaction instead of K
+            requests. The pipeline is atomic: if any statement fails, none of them are applied.
+            Rows from a RETURNING clause are discarded.
+            
+            Parameters:
+            - **statements**: Array of statements to execute in order, each with:
+              - **sql**: The SQL statement to execute
+              - **parameters**: Parameters bound to $1, $2, etc. (array, or object keyed "1".."N")
+              - **operation_type**: Must be "write" (the default); read statements are rejected with 400
+            
+            Returns:
+            - **success**: Whether the pipeline executed successfully
+            - **message**: Human-readable message about the execution
+            - **results**: One entry per statement with its affected_rows
+            
+            Example:
+            ```json
+            {
+                "statements": [
+                    {"sql": "INSERT INTO users (name, email) VALUES ($1, $2)", "parameters": ["Jane Smith", "jane@example.com"]},
+                    {"sql": "DELETE FROM users WHERE status = $1", "parameters": ["inactive"]}
+                ]
+            }
+            ```
+            """
+            try:
+                if not request.statements:
+                    raise HTTPException(status_code=400, detail="No statements provided")
+                statements = []
+                for statement in request.statements:
+                    if statement.operation_type != "write":
+                        # Rows are not returned from a pipeline, so reads would be silently dropped
+                        raise HTTPException(status_code=400, detail="Pipeline statements must be writes; use /select or /batch for reads")
+                    # Validate SQL using sql_security (cached per statement text)
+                    _validate_cached(statement.sql, statement.operation_type)
+                    statements.append((statement.sql, convert_parameters_to_tuple(statement.parameters)))
+                logger.info("Executing prepared SQL pipeline of %d statements", len(statements))
+                
+                async with _get_connection() as conn:
+                    async with conn.transaction():
+                        results = [
+                            {"affected_rows": parse_affected_rows(await conn.execute(sql, *parameters))}
+                            for sql, parameters in statements
+                        ]
+                
+                return RecordJSONResponse({
+                    "success": True,
+                    "message": f"Prepared SQL pipeline executed successfully. Statements executed: {len(results)}",
+                    "results": results
+                })
+            except HTTPException:
+                raise
+            except PoolTimeoutError as e:
+                raise _pool_busy(e)
+            except Exception as e:
+                logger.error(f"Failed to execute prepared SQL pipeline: {e}")
+                raise HTTPException(status_code=500, detail=f"Failed to execute prepared SQL pipeline: {str(e)}")
+
+        @self.router.post("/select", responses={200: {"model": PreparedSQLResponse}}, summary="Execute Prepared SELECT", description="Execute a prepared SELECT statement with parameters", openapi_extra=body_openapi(PreparedSelectRequest))
+        async def execute_prepared_select(request: PreparedSelectRequest = Depends(json_body(PreparedSelectRequest))):
             """
             Execute a prepared SELECT statement with parameters
             
@@ -328,7 +604,8 @@ class PreparedRouter:
             
             Parameters:
             - **sql**: The SELECT query to execute (must start with SELECT)
-            - **parameters**: Optional dictionary of parameters to bind (using $1, $2, etc. placeholders)
+            - **parameters**: Optional list of parameters bound to the $1, $2, etc. placeholders in order
+              (a dictionary keyed "1", "2", ... is still accepted)
             - **operation_type**: Should be "read" for SELECT operations
             
             Returns:
@@ -343,32 +620,24 @@ class PreparedRouter:
             ```json
             {
                 "sql": "SELECT * FROM users WHERE age > $1 AND status = $2 ORDER BY created_at DESC",
-                "parameters": {
-                    "1": 18,
-                    "2": "active"
-                },
+                "parameters": [18, "active"],
                 "operation_type": "read"
             }
             ```
             """
             try:
-                # Validate SQL using sql_security for read operations
-                sql_security.validate_sql_statement(request.sql, "read")
-                logger.info(f"Executing prepared SELECT: {request.sql}")
+                # Validate SQL using sql_security (cached per statement text)
+                _validate_cached(request.sql, "read")
+                logger.info("Executing prepared SELECT: %s", request.sql)
 
-                async with db_manager.get_connection() as conn:
-                    # Convert parameters to tuple in correct numeric order
-                    parameters = convert_parameters_to_tuple(request.parameters)
-                    
-                    # Create prepared statement
-                    stmt = PreparedStatement(request.sql, parameters)
-                    
-                    # Execute select operation
-                    rows = await db_manager.execute_prepared(stmt, conn)
-                    data = [dict(row) for row in rows]
+                # Convert parameters to tuple in correct numeric order
+                parameters = convert_parameters_to_tuple(request.parameters)
+                
+                async with _get_connection() as conn:
+                    # Execute select operation; Records are serialized directly by the response
+                    data = await _fetch_records(PreparedStatement(request.sql, parameters), conn)
                     
-                    return PreparedSQLResponse(
-                        success=True,
+                    return _sql_response(
                         message=f"Prepared SELECT query executed successfully. Rows returned: {len(data)}",
                         data=data,
                         row_count=len(data),
@@ -377,12 +646,14 @@ class PreparedRouter:
                     )
             except HTTPException:
                 raise
+            except PoolTimeoutError as e:
+                raise _pool_busy(e)
             except Exception as e:
                 logger.error(f"Failed to execute prepared SELECT: {e}")
                 raise HTTPException(status_code=500, detail=f"Failed to execute prepared SELECT: {str(e)}")
 
-        @self.router.post("/insert", response_model=PreparedSQLResponse, summary="Execute Prepared INSERT", description="Execute a prepared INSERT statement with parameters")
-        async def execute_prepared_insert(request: PreparedInsertRequest):
+        @self.router.post("/insert", responses={200: {"model": PreparedSQLResponse}}, summary="Execute Prepared INSERT", description="Execute a prepared INSERT statement with parameters", openapi_extra=body_openapi(PreparedInsertRequest))
+        async def execute_prepared_insert(request: PreparedInsertRequest = Depends(json_body(PreparedInsertRequest))):
             """
             Execute a prepared INSERT statement with parameters
             
@@ -391,7 +662,8 @@ class PreparedRouter:
             
             Parameters:
             - **sql**: The INSERT query to execute (must start with INSERT)
-            - **parameters**: Optional dictionary of parameters to bind (using $1, $2, etc. placeholders)
+            - **parameters**: Optional list of parameters bound to the $1, $2, etc. placeholders in order
+              (a dictionary keyed "1", "2", ... is still accepted)
             - **operation_type**: Should be "write" for INSERT operations
             
             Returns:
@@ -405,76 +677,15 @@ class PreparedRouter:
             ```json
             {
                 "sql": "INSERT INTO users (name, email, department) VALUES ($1, $2, $3) RETURNING *",
-                "parameters": {
-                    "1": "Jane Smith",
-                    "2": "jane@example.com",
-                    "3": "marketing"
-                },
+                "parameters": ["Jane Smith", "jane@example.com", "marketing"],
                 "operation_type": "write"
             }
             ```
             """
-            try:
-                # Validate SQL using sql_security for write operations
-                sql_security.validate_sql_statement(request.sql, "write")
-                logger.info(f"Executing prepared INSERT: {request.sql}")
-
-                async with db_manager.get_connection() as conn:
-                    # Convert parameters to tuple in correct numeric order
-                    parameters = convert_parameters_to_tuple(request.parameters)
-                    
-                    # Create prepared statement
-                    stmt = PreparedStatement(request.sql, parameters)
-                    
-                    # Check if query has RETURNING clause
-                    has_returning = bool(re.search(r'\bRETURNING\b', request.sql, re.IGNORECASE))
-                    if has_returning:
-                        # Use execute_prepared_row for queries that return data
-                        row = await db_manager.execute_prepared_row(stmt, conn)
-                        data = [row] if row else []
-                        affected_rows = 1 if row else 0
-                        
-                        return PreparedSQLResponse(
-                            success=True,
-                            message=f"Prepared INSERT query executed successfully. Affected rows: {affected_rows}",
-                            data=data,
-                            row_count=len(data),
-                            affected_rows=affected_rows,
-                            sql=request.sql,
-                            parameters=request.parameters
-                        )
-                    
-                    # Execute insert operation without RETURNING
-                    result = await conn.execute(stmt.sql, *stmt.parameters)
-                    
-                    # Parse the result to extract the number of affected rows
-                    affected_rows = 0
-                    if result:
-                        try:
-                            # Result format is like "INSERT 0 1"
-                            parts = result.split()
-                            if len(parts) >= 3:
-                                affected_rows = int(parts[2])  # Third part is the count
-                            else:
-                                affected_rows = int(result)
-                        except (ValueError, IndexError):
-                            affected_rows = 0
-                    
-                    return PreparedSQLResponse(
-                        success=True,
-                        message=f"Prepared INSERT query executed successfully. Affected rows: {affected_rows}",
-                        affected_rows=affected_rows,
-                        sql=request.sql,
-                        parameters=request.parameters
-                    )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to execute prepared INSERT: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to execute prepared INSERT: {str(e)}")
+            return await self._exec_write("INSERT", request)
 
-        @self.router.post("/update", response_model=PreparedSQLResponse, summary="Execute Prepared UPDATE", description="Execute a prepared UPDATE statement with parameters")
-        async def execute_prepared_update(request: PreparedUpdateRequest):
+        @self.router.post("/update", responses={200: {"model": PreparedSQLResponse}}, summary="Execute Prepared UPDATE", description="Execute a prepared UPDATE statement with parameters", openapi_extra=body_openapi(PreparedUpdateRequest))
+        async def execute_prepared_update(request: PreparedUpdateRequest = Depends(json_body(PreparedUpdateRequest))):
             """
             Execute a prepared UPDATE statement with parameters
             
@@ -483,7 +694,8 @@ class PreparedRouter:
             
             Parameters:
             - **sql**: The UPDATE query to execute (must start with UPDATE)
-            - **parameters**: Optional dictionary of parameters to bind (using $1, $2, etc. placeholders)
+            - **parameters**: Optional list of parameters bound to the $1, $2, etc. placeholders in order
+              (a dictionary keyed "1", "2", ... is still accepted)
             - **operation_type**: Should be "write" for UPDATE operations
             
             Returns:
@@ -497,75 +709,15 @@ class PreparedRouter:
             ```json
             {
                 "sql": "UPDATE users SET status = $1, updated_at = NOW() WHERE id = $2 RETURNING *",
-                "parameters": {
-                    "1": "inactive",
-                    "2": 123
-                },
+                "parameters": ["inactive", 123],
                 "operation_type": "write"
             }
             ```
             """
-            try:
-                # Validate SQL using sql_security for write operations
-                sql_security.validate_sql_statement(request.sql, "write")
-                logger.info(f"Executing prepared UPDATE: {request.sql}")
+            return await self._exec_write("UPDATE", request)
 
-                async with db_manager.get_connection() as conn:
-                    # Convert parameters to tuple in correct numeric order
-                    parameters = convert_parameters_to_tuple(request.parameters)
-                    
-                    # Create prepared statement
-                    stmt = PreparedStatement(request.sql, parameters)
-                    
-                    # Check if query has RETURNING clause
-                    has_returning = bool(re.search(r'\bRETURNING\b', request.sql, re.IGNORECASE))
-                    if has_returning:
-                        # Use execute_prepared_row for queries that return data
-                        row = await db_manager.execute_prepared_row(stmt, conn)
-                        data = [row] if row else []
-                        affected_rows = 1 if row else 0
-                        
-                        return PreparedSQLResponse(
-                            success=True,
-                            message=f"Prepared UPDATE query executed successfully. Affected rows: {affected_rows}",
-                            data=data,
-                            row_count=len(data),
-                            affected_rows=affected_rows,
-                            sql=request.sql,
-                            parameters=request.parameters
-                        )
-                    
-                    # Execute update operation without RETURNING
-                    result = await conn.execute(stmt.sql, *stmt.parameters)
-                    
-                    # Parse the result to extract the number of affected rows
-                    affected_rows = 0
-                    if result:
-                        try:
-                            # Result format is like "UPDATE 1"
-                            parts = result.split()
-                            if len(parts) >= 2:
-                                affected_rows = int(parts[1])  # Second part is the count
-                            else:
-                                affected_rows = int(result)
-                        except (ValueError, IndexError):
-                            affected_rows = 0
-                    
-                    return PreparedSQLResponse(
-                        success=True,
-                        message=f"Prepared UPDATE query executed successfully. Affected rows: {affected_rows}",
-                        affected_rows=affected_rows,
-                        sql=request.sql,
-                        parameters=request.parameters
-                    )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to execute prepared UPDATE: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to execute prepared UPDATE: {str(e)}")
-
-        @self.router.post("/delete", response_model=PreparedSQLResponse, summary="Execute Prepared DELETE", description="Execute a prepared DELETE statement with parameters")
-        async def execute_prepared_delete(request: PreparedDeleteRequest):
+        @self.router.post("/delete", responses={200: {"model": PreparedSQLResponse}}, summary="Execute Prepared DELETE", description="Execute a prepared DELETE statement with parameters", openapi_extra=body_openapi(PreparedDeleteRequest))
+        async def execute_prepared_delete(request: PreparedDeleteRequest = Depends(json_body(PreparedDeleteRequest))):
             """
             Execute a prepared DELETE statement with parameters
             
@@ -574,7 +726,8 @@ class PreparedRouter:
             
             Parameters:
             - **sql**: The DELETE query to execute (must start with DELETE)
-            - **parameters**: Optional dictionary of parameters to bind (using $1, $2, etc. placeholders)
+            - **parameters**: Optional list of parameters bound to the $1, $2, etc. placeholders in order
+              (a dictionary keyed "1", "2", ... is still accepted)
             - **operation_type**: Should be "write" for DELETE operations
             
             Returns:
@@ -588,73 +741,14 @@ class PreparedRouter:
             ```json
             {
                 "sql": "DELETE FROM users WHERE id = $1 RETURNING *",
-                "parameters": {
-                    "1": 123
-                },
+                "parameters": [123],
                 "operation_type": "write"
             }
             ```
             """
-            try:
-                # Validate SQL using sql_security for write operations
-                sql_security.validate_sql_statement(request.sql, "write")
-                logger.info(f"Executing prepared DELETE: {request.sql}")
+            return await self._exec_write("DELETE", request)
 
-                async with db_manager.get_connection() as conn:
-                    # Convert parameters to tuple in correct numeric order
-                    parameters = convert_parameters_to_tuple(request.parameters)
-                    
-                    # Create prepared statement
-                    stmt = PreparedStatement(request.sql, parameters)
-                    
-                    # Check if query has RETURNING clause
-                    has_returning = bool(re.search(r'\bRETURNING\b', request.sql, re.IGNORECASE))
-                    if has_returning:
-                        # Use execute_prepared_row for queries that return data
-                        row = await db_manager.execute_prepared_row(stmt, conn)
-                        data = [row] if row else []
-                        affected_rows = 1 if row else 0
-                        
-                        return PreparedSQLResponse(
-                            success=True,
-                            message=f"Prepared DELETE query executed successfully. Affected rows: {affected_rows}",
-                            data=data,
-                            row_count=len(data),
-                            affected_rows=affected_rows,
-                            sql=request.sql,
-                            parameters=request.parameters
-                        )
-                    
-                    # Execute delete operation without RETURNING
-                    result = await conn.execute(stmt.sql, *stmt.parameters)
-                    
-                    # Parse the result to extract the number of affected rows
-                    affected_rows = 0
-                    if result:
-                        try:
-                            # Result format is like "DELETE 1"
-                            parts = result.split()
-                            if len(parts) >= 2:
-                                affected_rows = int(parts[1])  # Second part is the count
-                            else:
-                                affected_rows = int(result)
-                        except (ValueError, IndexError):
-                            affected_rows = 0
-                    
-                    return PreparedSQLResponse(
-                        success=True,
-                        message=f"Prepared DELETE query executed successfully. Affected rows: {affected_rows}",
-                        affected_rows=affected_rows,
-                        sql=request.sql,
-                        parameters=request.parameters
-                    )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Failed to execute prepared DELETE: {e}")
-                raise HTTPException(status_code=500, detail=f"Failed to execute prepared DELETE: {str(e)}")
-
-        @self.router.get("/statements", response_model=StatementsResponse, summary="Get Prepared Statements", description="Get information about cached prepared statements")
+        @self.router.get("/statements", responses={200: {"model": StatementsResponse}}, summary="Get Prepared Statements", description="Get information about cached prepared statements")
         async def get_prepared_statements():
             """
             Get information about cached prepared statements
@@ -666,6 +760,8 @@ class PreparedRouter:
             - **statements**: Array of prepared statement information objects
             - **count**: Total number of cached statements
             - **message**: Human-readable message about the results
+            - **cache_stats**: Registry capacity and hit/miss/eviction counters
+            - **validation_cache_stats**: Capacity, size and hit/miss counters of the SQL validation cache
             
             Each statement object contains:
             - **name**: Statement name/identifier
@@ -680,22 +776,24 @@ class PreparedRouter:
             """
             try:
                 # Get prepared statements from the database manager
-                statements = db_manager.prepared_statements
+                # Snapshot the cache once so concurrent mutation cannot affect the iteration
+                statements = list(db_manager.prepared_statements.items())
+                count = len(statements)
                 
-                statement_info = []
-                for name, stmt in statements.items():
-                    statement_info.append(PreparedStatementInfo(
-                        name=name,
-                        sql=stmt.sql,
-                        parameter_count=len(stmt.parameters),
-                        created_at="N/A"  # We don't track creation time currently
-                    ))
+                # Plain dicts in the PreparedStatementInfo shape; we don't track creation time currently
+                statement_info = [
+                    {"name": name, "sql": stmt.sql, "parameter_count": len(stmt.parameters), "created_at": "N/A"}
+                    for name, stmt in statements
+                ]
                 
-                return {
+                # Rendered by orjson directly, skipping the jsonable_encoder pass over the list
+                return RecordJSONResponse({
                     "statements": statement_info,
-                    "count": len(statement_info),
-                    "message": f"Found {len(statement_info)} cached prepared statements"
-                }
+                    "count": count,
+                    "message": f"Found {count} cached prepared statements",
+                    "cache_stats": {"max_size": settings.NAMED_STATEMENT_CACHE_SIZE, **db_manager.statement_cache_stats},
+                    "validation_cache_stats": _validation_cache_stats()
+                })
             except Exception as e:
                 logger.error(f"Failed to get prepared statements: {e}")
                 raise HTTPException(status_code=500, detail=f"Failed to get prepared statements: {str(e)}")
@@ -721,14 +819,13 @@ class PreparedRouter:
             ```
             """
             try:
-                if statement_name in db_manager.prepared_statements:
-                    del db_manager.prepared_statements[statement_name]
-                    return {
-                        "success": True,
-                        "message": f"Prepared statement '{statement_name}' cleared from cache"
-                    }
-                else:
+                # Single atomic lookup-and-remove
+                if db_manager.prepared_statements.pop(statement_name, None) is None:
                     raise HTTPException(status_code=404, detail=f"Prepared statement '{statement_name}' not found in cache")
+                return {
+                    "success": True,
+                    "message": f"Prepared statement '{statement_name}' cleared from cache"
+                }
             except HTTPException:
                 raise
             except Exception as e:
@@ -763,8 +860,8 @@ class PreparedRouter:
                 logger.error(f"Failed to clear all prepared statements: {e}")
                 raise HTTPException(status_code=500, detail=f"Failed to clear all prepared statements: {str(e)}")
 
-        @self.router.post("/validate", response_model=ValidationResponse, summary="Validate Prepared SQL", description="Validate a prepared SQL statement without executing it")
-        async def validate_prepared_sql(request: PreparedSQLRequest):
+        @self.router.post("/validate", responses={200: {"model": ValidationResponse}}, summary="Validate Prepared SQL", description="Validate a prepared SQL statement without executing it", openapi_extra=body_openapi(PreparedSQLRequest))
+        async def validate_prepared_sql(request: PreparedSQLRequest = Depends(json_body(PreparedSQLRequest))):
             """
             Validate a prepared SQL statement without executing it
             
@@ -773,7 +870,7 @@ class PreparedRouter:
             
             Parameters:
             - **sql**: The SQL query to validate
-            - **parameters**: Optional dictionary of parameters to validate
+            - **parameters**: Optional list of parameters to validate
             - **operation_type**: Type of operation ("read" or "write")
             
             Returns:
@@ -790,62 +887,121 @@ class PreparedRouter:
             ```json
             {
                 "sql": "SELECT * FROM users WHERE id = $1 AND active = $2",
-                "parameters": {
-                    "1": 123,
-                    "2": true
-                },
+                "parameters": [123, true],
                 "operation_type": "read"
             }
             ```
             """
             try:
-                # Validate SQL using sql_security
-                sql_security.validate_sql_statement(request.sql, request.operation_type)
+                # Validate SQL using sql_security (cached per statement text)
+                _validate_cached(request.sql, request.operation_type)
                 
                 # Count parameters
                 param_count = len(request.parameters) if request.parameters else 0
                 
                 # Count placeholders in SQL
-                import re
-                placeholder_count = len(re.findall(r'\$\d+', request.sql))
+                placeholder_count = count_placeholders(request.sql)
                 
                 # Check for parameter mismatch
                 if param_count != placeholder_count:
-                    return {
-                        "valid": False,
-                        "message": f"Parameter count mismatch: SQL expects {placeholder_count} parameters, but {param_count} were provided",
-                        "sql": request.sql,
-                        "parameters": request.parameters,
-                        "placeholder_count": placeholder_count,
-                        "parameter_count": param_count
-                    }
+                    return _validation_response(
+                        valid=False,
+                        message=f"Parameter count mismatch: SQL expects {placeholder_count} parameters, but {param_count} were provided",
+                        sql=request.sql,
+                        parameters=request.parameters,
+                        placeholder_count=placeholder_count,
+                        parameter_count=param_count
+                    )
                 
-                return {
-                    "valid": True,
-                    "message": "Prepared SQL statement is valid",
-                    "sql": request.sql,
-                    "parameters": request.parameters,
-                    "placeholder_count": placeholder_count,
-                    "parameter_count": param_count,
-                    "operation_type": request.operation_type
-                }
+                return _validation_response(
+                    valid=True,
+                    message="Prepared SQL statement is valid",
+                    sql=request.sql,
+                    parameters=request.parameters,
+                    placeholder_count=placeholder_count,
+                    parameter_count=param_count,
+                    operation_type=request.operation_type
+                )
             except HTTPException as e:
-                return {
-                    "valid": False,
-                    "message": str(e.detail),
-                    "sql": request.sql,
-                    "parameters": request.parameters,
-                    "error": str(e.detail)
-                }
+                return _validation_response(
+                    valid=False,
+                    message=str(e.detail),
+                    sql=request.sql,
+                    parameters=request.parameters,
+                    error=str(e.detail)
+                )
             except Exception as e:
                 logger.error(f"Failed to validate prepared SQL: {e}")
-                return {
-                    "valid": False,
-                    "message": f"Validation failed: {str(e)}",
-                    "sql": request.sql,
-                    "parameters": request.parameters,
-                    "error": str(e)
-                }
+                return _validation_response(
+                    valid=False,
+                    message=f"Validation failed: {str(e)}",
+                    sql=request.sql,
+                    parameters=request.parameters,
+                    error=str(e)
+                )
+
+        # Single-request handlers /batch fans out to: endpoint -> (request model, handler)
+        batch_handlers = {
+            "validate": (PreparedSQLRequest, validate_prepared_sql),
+            "select": (PreparedSelectRequest, execute_prepared_select),
+            "execute": (PreparedSQLRequest, execute_prepared_sql),
+        }
+        
+        async def run_batch_item(item: PreparedBatchItem) -> bytes:
+            """Run one batch request and render its {status_code, body} result as JSON"""
+            request_model, handler = batch_handlers[item.endpoint]
+            try:
+                result = await handler(request_model.model_validate(item.body))
+            except ValidationError as e:
+                status_code, body = 422, dumps({"detail": e.errors(include_url=False)})
+            except HTTPException as e:
+                status_code, body = e.status_code, dumps({"detail": e.detail})
+            else:
+                # Already rendered by the handler; spliced in without re-serializing
+                status_code, body = result.status_code, result.body
+            return b'{"status_code":%d,"body":%b}' % (status_code, body)
+
+        @self.router.post("/batch", responses={200: {"model": PreparedBatchResponse}}, summary="Execute Prepared SQL Requests in Batch", description="Run several validate, select and execute requests in one HTTP call", openapi_extra=body_openapi(PreparedBatchRequest))
+        async def execute_prepared_batch(request: PreparedBatchRequest = Depends(json_body(PreparedBatchRequest))):
+            """
+            Run several independent validate, select and execute requests in one HTTP call
+            
+            Each entry names the endpoint it targets and carries the body that endpoint would
+            receive. The entries run concurrently on separate pooled connections, at most a
+            quarter of the pool at a time, and each one succeeds or fails on its own; results are returned in request order as
+            {status_code, body}, where body is exactly what the single endpoint would return.
+            Use /pipeline instead when writes must be ordered or atomic.
+            
+            Parameters:
+            - **requests**: Array (at most 100) of {endpoint, body}, endpoint being "validate", "select" or "execute"
+            
+            Returns:
+            - **results**: One {status_code, body} entry per request, in order
+            
+            Example:
+            ```json
+            {
+                "requests": [
+                    {"endpoint": "validate", "body": {"sql": "SELECT * FROM users WHERE id = $1", "parameters": [123]}},
+                    {"endpoint": "select", "body": {"sql": "SELECT COUNT(*) AS total FROM users"}}
+                ]
+            }
+            ```
+            """
+            if not request.requests:
+                raise HTTPException(status_code=400, detail="No requests provided")
+            if len(request.requests) > _MAX_BATCH_SIZE:
+                raise HTTPException(status_code=400, detail=f"Batch exceeds {_MAX_BATCH_SIZE} requests")
+            logger.info("Executing prepared batch of %d requests", len(request.requests))
+            
+            semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+            
+            async def run_bounded(item: PreparedBatchItem) -> bytes:
+                async with semaphore:
+                    return await run_batch_item(item)
+            
+            results = await asyncio.gather(*(run_bounded(item) for item in request.requests))
+            return Response(content=b'{"results":[' + b','.join(results) + b']}', media_type="application/json")
 
 # Create router instance
 prepared_router = PreparedRouter().router
@@ -1,96 +1,194 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+import asyncpg
+import hashlib
 import logging
-import re
-from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
+from pydantic import BaseModel, ConfigDict, model_validator
 
-from app.core.database import db_manager, PreparedStatement
-from app.core.sql_security import sql_security
+from app.core.config import settings
+from app.core.database import db_manager, PreparedStatement, parse_affected_rows
+from app.core.responses import RecordJSONResponse, dumps
+from app.core.sql_security import count_placeholders, validate_sql_cached
 
 logger = logging.getLogger(__name__)
 
-# Pydantic models for raw SQL requests
-class RawSQLRequest(BaseModel):
-    """Model for raw SQL requests"""
-    sql: str
-    parameters: Optional[Dict[str, Any]] = None
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "SELECT * FROM users WHERE age > $1 AND status = $2",
-                "parameters": {
-                    "1": 18,
-                    "2": "active"
-                }
-            }
-        }
+# Shared OpenAPI examples for the raw SQL models
+_READ_EXAMPLE = {
+    "sql": "SELECT * FROM users WHERE age > $1 AND status = $2",
+    "parameters": {
+        "1": 18,
+        "2": "active"
+    }
+}
+
+_WRITE_EXAMPLE = {
+    "sql": "UPDATE users SET status = $1 WHERE id = $2 RETURNING *",
+    "parameters": {
+        "1": "inactive",
+        "2": 123
+    }
+}
+
+_RESPONSE_EXAMPLE = {
+    "success": True,
+    "message": "Raw SQL query executed successfully. Rows returned: 5",
+    "data": [
+        {"id": 1, "name": "John Doe", "age": 25, "status": "active"},
+        {"id": 2, "name": "Jane Smith", "age": 30, "status": "active"}
+    ],
+    "row_count": 2,
+    "affected_rows": None
+}
 
+# Pydantic models for raw SQL requests
 class RawSQLReadRequest(BaseModel):
-    """Model for raw SQL read requests"""
-    sql: str
+    """Model for raw SQL read requests; a registered statement may be sent by statement_id alone"""
+    model_config = ConfigDict(json_schema_extra={"example": _READ_EXAMPLE})
+    
+    sql: Optional[str] = None
     parameters: Optional[Dict[str, Any]] = None
+    statement_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "SELECT * FROM users WHERE age > $1 AND status = $2 ORDER BY created_at DESC",
-                "parameters": {
-                    "1": 18,
-                    "2": "active"
-                }
-            }
-        }
+    @model_validator(mode="after")
+    def _require_sql_or_statement_id(self) -> "RawSQLReadRequest":
+        if self.sql is None and self.statement_id is None:
+            raise ValueError("Either sql or statement_id is required")
+        return self
 
 class RawSQLWriteRequest(BaseModel):
     """Model for raw SQL write requests"""
+    model_config = ConfigDict(json_schema_extra={"example": _WRITE_EXAMPLE})
+    
     sql: str
     parameters: Optional[Dict[str, Any]] = None
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sql": "UPDATE users SET status = $1 WHERE id = $2 RETURNING *",
-                "parameters": {
-                    "1": "inactive",
-                    "2": 123
-                }
-            }
-        }
 
 class RawSQLResponse(BaseModel):
     """Model for raw SQL responses"""
+    model_config = ConfigDict(json_schema_extra={"example": _RESPONSE_EXAMPLE})
+    
     success: bool
     message: str
     data: Optional[list] = None
     row_count: Optional[int] = None
     affected_rows: Optional[int] = None
+
+# Rows fetched from the server-side cursor per streamed chunk
+_STREAM_FETCH_SIZE = 500
+
+# Validated read statements addressable by statement_id (the SHA-1 hex digest of the
+# SQL text); least recently used entries are evicted past NAMED_STATEMENT_CACHE_SIZE
+_statement_registry: "OrderedDict[str, str]" = OrderedDict()
+
+def statement_id_for(sql: str) -> str:
+    """Return the statement_id clients use to refer to sql"""
+    return hashlib.sha1(sql.encode()).hexdigest()
+
+def _resolve_read_sql(request: RawSQLReadRequest) -> str:
+    """
+    Return the validated SQL for a read request
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Raw SQL query executed successfully. Rows returned: 5",
-                "data": [
-                    {"id": 1, "name": "John Doe", "age": 25, "status": "active"},
-                    {"id": 2, "name": "Jane Smith", "age": 30, "status": "active"}
-                ],
-                "row_count": 2,
-                "affected_rows": None
-            }
-        }
+    A request carrying both sql and statement_id registers the statement, so later
+    requests can send statement_id alone.
+    
+    Raises:
+        HTTPException: If the SQL is invalid, the statement_id does not match the
+            SQL, or a statement_id sent alone is not registered
+    """
+    if request.sql is None:
+        sql = _statement_registry.get(request.statement_id)
+        if sql is None:
+            raise HTTPException(status_code=404, detail="Unknown statement_id: resend the request with its sql")
+        _statement_registry.move_to_end(request.statement_id)
+        return sql
+    
+    # Validate SQL using sql_security (cached per statement text)
+    validate_sql_cached(request.sql, "read")
+    if request.statement_id is not None:
+        if request.statement_id != statement_id_for(request.sql):
+            raise HTTPException(status_code=400, detail="statement_id does not match the SHA-1 of sql")
+        _statement_registry[request.statement_id] = request.sql
+        _statement_registry.move_to_end(request.statement_id)
+        while len(_statement_registry) > settings.NAMED_STATEMENT_CACHE_SIZE:
+            _statement_registry.popitem(last=False)
+    return request.sql
+
+def _bind_parameters(sql: str, parameters: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """
+    Resolve request parameters into positional arguments for sql
+    
+    Raises:
+        HTTPException: If the number of parameters does not match the $N placeholders
+    """
+    # Placeholders only need counting when there are parameters to bind
+    if not parameters:
+        return ()
+    param_count = count_placeholders(sql)
+    if param_count == 0:
+        # SQL has no placeholders but parameters are provided - ignore parameters
+        logger.warning("SQL has no parameter placeholders but parameters were provided: %s", parameters)
+        return ()
+    if param_count != len(parameters):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Parameter count mismatch: SQL expects {param_count} parameters, but {len(parameters)} were provided"
+        )
+    # Values are bound natively by asyncpg, looked up by position so that key order
+    # in the request can never change which value binds to which placeholder
+    try:
+        return tuple(parameters[str(i)] for i in range(1, param_count + 1))
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f'Parameter keys must be "1" to "{param_count}" matching $1..${param_count}'
+        )
+
+def _raise_for_input_error(e: Exception) -> None:
+    """
+    Raise a 400 when asyncpg rejected the request's parameters rather than failing itself
+    
+    Covers values that do not fit their placeholder types (DataError) and SQL that
+    expects arguments the request did not send, which asyncpg reports as an
+    InterfaceError once the server has described the statement.
+    """
+    if isinstance(e, asyncpg.DataError) or (
+            isinstance(e, asyncpg.InterfaceError) and str(e).startswith("the server expects")):
+        raise HTTPException(status_code=400, detail=f"Invalid query input: {str(e)}")
+
+async def _stream_rows(cursor, stack: AsyncExitStack) -> AsyncIterator[bytes]:
+    """Yield a cursor's rows as one JSON array, one chunk per fetched batch, then release its connection"""
+    try:
+        separator = b'['
+        while True:
+            rows = await cursor.fetch(_STREAM_FETCH_SIZE)
+            if not rows:
+                break
+            # Serialize the whole batch in one orjson call and splice it into the array
+            yield separator + dumps(rows)[1:-1]
+            separator = b','
+        yield b'[]' if separator == b'[' else b']'
+    except Exception as e:
+        logger.error(f"Raw SQL stream aborted: {e}")
+        raise
+    finally:
+        await stack.aclose()
 
 class RawRouter:
     """Raw SQL router for executing raw SQL queries"""
     
     def __init__(self):
-        self.router = APIRouter(prefix="/raw", tags=["Raw SQL Operations"])
+        # orjson-backed default response class for every route
+        self.router = APIRouter(prefix="/raw", tags=["Raw SQL Operations"],
+                                default_response_class=RecordJSONResponse)
         self._setup_routes()
     
     def _setup_routes(self):
         """Setup all raw SQL routes"""
         
-        @self.router.post("/sql", response_model=RawSQLResponse, summary="Execute Raw SQL Query", description="Execute a raw SQL query with optional parameters")
+        @self.router.post("/sql", responses={200: {"model": RawSQLResponse}}, summary="Execute Raw SQL Query", description="Execute a raw SQL query with optional parameters")
         async def execute_raw_sql(request: RawSQLReadRequest):
             """
             Execute a raw SQL query with optional parameters.
@@ -101,6 +199,7 @@ class RawRouter:
             Parameters:
             - **sql**: The SQL query to execute (must start with SELECT)
             - **parameters**: Optional dictionary of parameters to bind (using $1, $2, etc. placeholders)
+            - **statement_id**: Optional SHA-1 hex digest of the SQL; once registered, sql may be omitted
             
             Returns:
             - **success**: Whether the query executed successfully
@@ -121,53 +220,89 @@ class RawRouter:
             ```
             """
             try:
-                # Validate SQL using sql_security
-                sql_security.validate_sql_statement(request.sql, "read")
-                logger.info(f"Executing raw SQL: {request.sql}")
+                sql = _resolve_read_sql(request)
+                logger.debug("Executing raw SQL: %s", sql)
+
+                parameters = _bind_parameters(sql, request.parameters)
 
                 async with db_manager.get_connection() as conn:
-                    # Count the number of parameter placeholders in the SQL
-                    param_count = len(re.findall(r'\$\d+', request.sql))
-                    
-                    if request.parameters and param_count > 0:
-                        # SQL has placeholders and parameters are provided
-                        if param_count != len(request.parameters):
-                            raise HTTPException(
-                                status_code=400,
-                                detail=f"Parameter count mismatch: SQL expects {param_count} parameters, but {len(request.parameters)} were provided"
-                            )
-                        
-                        # Use parameterized query with prepared statement
-                        # Convert all parameters to strings for PostgreSQL compatibility
-                        param_list = [str(value) for value in request.parameters.values()]
-                        stmt = PreparedStatement(request.sql, tuple(param_list))
-                        rows = await db_manager.execute_prepared(stmt, conn)
-                    elif request.parameters and param_count == 0:
-                        # SQL has no placeholders but parameters are provided - ignore parameters
-                        logger.warning(f"SQL has no parameter placeholders but parameters were provided: {request.parameters}")
-                        stmt = PreparedStatement(request.sql, ())
-                        rows = await db_manager.execute_prepared(stmt, conn)
-                    else:
-                        # No parameters or no placeholders - execute raw SQL
-                        stmt = PreparedStatement(request.sql, ())
-                        rows = await db_manager.execute_prepared(stmt, conn)
+                    # Served from the connection's statement cache; Records are kept as-is
+                    rows = await db_manager.fetch_records(PreparedStatement(sql, parameters), conn)
                     
-                    # Convert rows to list of dicts
-                    data = [dict(row) for row in rows]
-                    
-                    return RawSQLResponse(
-                        success=True,
-                        message=f"Raw SQL query executed successfully. Rows returned: {len(data)}",
-                        data=data,
-                        row_count=len(data)
-                    )
+                    # RawSQLResponse-shaped body rendered directly; rows are serialized
+                    # straight from the asyncpg Records without a response model pass
+                    return RecordJSONResponse({
+                        "success": True,
+                        "message": f"Raw SQL query executed successfully. Rows returned: {len(rows)}",
+                        "data": rows,
+                        "row_count": len(rows),
+                        "affected_rows": None
+                    })
             except HTTPException:
                 raise
             except Exception as e:
+                _raise_for_input_error(e)
                 logger.error(f"Failed to execute raw SQL: {e}")
                 raise HTTPException(status_code=500, detail=f"Failed to execute raw SQL: {str(e)}")
 
-        @self.router.post("/sql/write", response_model=RawSQLResponse, summary="Execute Raw SQL Write Query", description="Execute a raw SQL write query (INSERT, UPDATE, DELETE) with optional parameters")
+        @self.router.post("/sql/stream", response_class=StreamingResponse, summary="Stream Raw SQL Query Results", description="Execute a raw SQL read query and stream the rows as a JSON array")
+        async def stream_raw_sql(request: RawSQLReadRequest):
+            """
+            Execute a raw SQL read query and stream its rows as a JSON array.
+            
+            Rows are read from a server-side cursor in batches of 500 and written to the
+            response as they arrive, so memory use stays flat however large the result set is.
+            Validation and parameter rules are the same as for /raw/sql, and errors detected
+            before the first row (invalid SQL, parameter mismatch) are returned as usual. A
+            failure while streaming ends the response early.
+            
+            Parameters:
+            - **sql**: The SQL query to execute (must start with SELECT)
+            - **parameters**: Optional dictionary of parameters to bind (using $1, $2, etc. placeholders)
+            - **statement_id**: Optional SHA-1 hex digest of the SQL; once registered, sql may be omitted
+            
+            Returns:
+            - Array of result rows
+            
+            Example:
+            ```json
+            {
+                "sql": "SELECT * FROM users WHERE age > $1 AND status = $2",
+                "parameters": {
+                    "1": 18,
+                    "2": "active"
+                }
+            }
+            ```
+            """
+            try:
+                sql = _resolve_read_sql(request)
+                parameters = _bind_parameters(sql, request.parameters)
+                logger.debug("Streaming raw SQL: %s", sql)
+
+                # The connection outlives this handler: it is released when the stream ends
+                stack = AsyncExitStack()
+                try:
+                    conn = await stack.enter_async_context(db_manager.get_connection())
+                    # Server-side cursors only exist inside a transaction
+                    await stack.enter_async_context(conn.transaction())
+                    statement = await conn.prepare(sql)
+                    cursor = await statement.cursor(*parameters)
+                except BaseException:
+                    await stack.aclose()
+                    raise
+                
+                # The background task releases the connection if the stream is never consumed
+                return StreamingResponse(_stream_rows(cursor, stack), media_type="application/json",
+                                         background=BackgroundTask(stack.aclose))
+            except HTTPException:
+                raise
+            except Exception as e:
+                _raise_for_input_error(e)
+                logger.error(f"Failed to stream raw SQL: {e}")
+                raise HTTPException(status_code=500, detail=f"Failed to stream raw SQL: {str(e)}")
+
+        @self.router.post("/sql/write", responses={200: {"model": RawSQLResponse}}, summary="Execute Raw SQL Write Query", description="Execute a raw SQL write query (INSERT, UPDATE, DELETE) with optional parameters")
         async def execute_raw_write_sql(request: RawSQLWriteRequest):
             """
             Execute a raw SQL write query (INSERT, UPDATE, DELETE) with optional parameters.
@@ -198,58 +333,28 @@ class RawRouter:
             ```
             """
             try:
-                # Validate SQL using sql_security for write operations
-                sql_security.validate_sql_statement(request.sql, "write")
-                logger.info(f"Executing raw write SQL: {request.sql}")
+                # Validate SQL using sql_security for write operations (cached per statement text)
+                validate_sql_cached(request.sql, "write")
+                logger.debug("Executing raw write SQL: %s", request.sql)
+
+                parameters = _bind_parameters(request.sql, request.parameters)
 
                 async with db_manager.get_connection() as conn:
-                    # Count the number of parameter placeholders in the SQL
-                    param_count = len(re.findall(r'\$\d+', request.sql))
-                    
-                    if request.parameters and param_count > 0:
-                        # SQL has placeholders and parameters are provided
-                        if param_count != len(request.parameters):
-                            raise HTTPException(
-                                status_code=400,
-                                detail=f"Parameter count mismatch: SQL expects {param_count} parameters, but {len(request.parameters)} were provided"
-                            )
-                        
-                        # Use parameterized query with prepared statement
-                        # Convert all parameters to strings for PostgreSQL compatibility
-                        param_list = [str(value) for value in request.parameters.values()]
-                        stmt = PreparedStatement(request.sql, tuple(param_list))
-                        result = await conn.execute(stmt.sql, *stmt.parameters)
-                    elif request.parameters and param_count == 0:
-                        # SQL has no placeholders but parameters are provided - ignore parameters
-                        logger.warning(f"SQL has no parameter placeholders but parameters were provided: {request.parameters}")
-                        stmt = PreparedStatement(request.sql, ())
-                        result = await conn.execute(stmt.sql, *stmt.parameters)
-                    else:
-                        # No parameters or no placeholders - execute raw SQL
-                        stmt = PreparedStatement(request.sql, ())
-                        result = await conn.execute(stmt.sql, *stmt.parameters)
+                    result = await conn.execute(request.sql, *parameters)
                     
-                    # Parse the result to extract the number of affected rows
-                    affected_rows = 0
-                    if result:
-                        try:
-                            # Result format is like "UPDATE 1" or "INSERT 0 1"
-                            parts = result.split()
-                            if len(parts) >= 2:
-                                affected_rows = int(parts[-1])  # Last part is usually the count
-                            else:
-                                affected_rows = int(result)
-                        except (ValueError, IndexError):
-                            affected_rows = 0
+                    affected_rows = parse_affected_rows(result)
                     
-                    return RawSQLResponse(
-                        success=True,
-                        message=f"Raw SQL write query executed successfully. Affected rows: {affected_rows}",
-                        affected_rows=affected_rows
-                    )
+                    return RecordJSONResponse({
+                        "success": True,
+                        "message": f"Raw SQL write query executed successfully. Affected rows: {affected_rows}",
+                        "data": None,
+                        "row_count": None,
+                        "affected_rows": affected_rows
+                    })
             except HTTPException:
                 raise
             except Exception as e:
+                _raise_for_input_error(e)
                 logger.error(f"Failed to execute raw write SQL: {e}")
                 raise HTTPException(status_code=500, detail=f"Failed to execute raw write SQL: {str(e)}")
 
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Run the CRUD, prepared SQL and edge-case endpoint tests in one process
+
+All suites share a single httpx AsyncClient, so every request after the
+first reuses a kept-alive connection to the service instead of opening a new one.
+"""
+
+import asyncio
+import httpx
+
+from test_crud_endpoints import CrudEndpointTester
+from test_prepared_endpoints import PreparedEndpointTester
+from test_edge_cases import test_edge_cases
+
+async def main():
+    """Run all endpoint test suites over one shared client"""
+    # Every request goes to the one service host, so the pool is sized for that
+    # host alone and idle connections are kept warm between suites
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=120)
+    async with httpx.AsyncClient(timeout=10.0, limits=limits, headers={"Connection": "keep-alive"}) as client:
+        async with CrudEndpointTester(client) as tester:
+            await tester.run_all_crud_tests()
+        async with PreparedEndpointTester(client) as tester:
+            await tester.run_all_tests()
+        await test_edge_cases(client)
+
+if __name__ == "__main__":
+    try:
+        # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(main())
@@ -10,29 +10,51 @@ This script runs all test suites including:
 """
 
 import asyncio
+import httpx
+import shlex
 import subprocess
 import sys
 import os
 import time
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a command and return success status"""
+BASE_URL = "http://localhost:8000"
+
+def print_banner(description, command):
+    """Print the section header for a test step"""
     print(f"\n{'='*60}")
     print(f"🧪 {description}")
     print(f"{'='*60}")
     print(f"Running: {command}")
     print()
+
+def report_result(description, returncode, duration):
+    """Print the outcome of a test step and return whether it passed"""
+    status = "✅ PASSED" if returncode == 0 else "❌ FAILED"
+    print(f"\n{status} - {description} (took {duration:.2f}s)")
+    return returncode == 0
+
+def run_command(command, description):
+    """Run a command and return success status"""
+    print_banner(description, command)
     
     start_time = time.time()
-    result = subprocess.run(command, shell=True, capture_output=False)
+    # Exec the command directly rather than through /bin/sh
+    result = subprocess.run(shlex.split(command), shell=False, capture_output=False)
     end_time = time.time()
     
-    duration = end_time - start_time
-    status = "✅ PASSED" if result.returncode == 0 else "❌ FAILED"
-    
-    print(f"\n{status} - {description} (took {duration:.2f}s)")
-    return result.returncode == 0
+    return report_result(description, result.returncode, end_time - start_time)
+
+async def run_script(script):
+    """Run a Python test script, capturing its output; returns (returncode, output, duration)"""
+    start_time = time.time()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
+    )
+    output, _ = await process.communicate()
+    return process.returncode, output.decode(errors="replace"), time.time() - start_time
 
 def run_pytest_tests():
     """Run pytest test suite"""
@@ -41,22 +63,31 @@ def run_pytest_tests():
         "Running pytest test suite"
     )
 
-def run_endpoint_tests():
-    """Run individual endpoint test scripts"""
+async def run_endpoint_tests():
+    """Run individual endpoint test scripts concurrently"""
     test_scripts = [
-        ("python test_admin_endpoints.py", "Admin Endpoints"),
-        ("python test_crud_endpoints.py", "CRUD Operations"),
-        ("python test_raw_endpoints.py", "Raw SQL Operations"),
-        ("python test_prepared_endpoints.py", "Prepared SQL Operations")
+        ("test_admin_endpoints.py", "Admin Endpoints"),
+        ("test_crud_endpoints.py", "CRUD Operations"),
+        ("test_raw_endpoints.py", "Raw SQL Operations"),
+        ("test_prepared_endpoints.py", "Prepared SQL Operations")
     ]
     
-    results = []
-    for command, description in test_scripts:
-        if os.path.exists(command.split()[-1]):
-            results.append(run_command(command, description))
+    available = []
+    for script, description in test_scripts:
+        if os.path.exists(script):
+            available.append((script, description))
         else:
             print(f"⚠️  Skipping {description} - test file not found")
-            results.append(True)  # Don't fail overall if test file missing
+    
+    # The scripts are independent, so they run side by side; output is buffered
+    # per script and printed in order once all have finished
+    outcomes = await asyncio.gather(*(run_script(script) for script, _ in available))
+    
+    results = []
+    for (script, description), (returncode, output, duration) in zip(available, outcomes):
+        print_banner(description, f"python {script}")
+        print(output, end="")
+        results.append(report_result(description, returncode, duration))
     
     return all(results)
 
@@ -74,11 +105,10 @@ def run_connection_test():
         "Running basic connection test"
     )
 
-def check_service_health():
+async def check_service_health(client):
     """Check if the service is running and healthy"""
     try:
-        import requests
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = await client.get("/health", timeout=5)
         if response.status_code == 200:
             print("✅ Service is running and healthy")
             return True
@@ -90,14 +120,15 @@ def check_service_health():
         print("💡 Make sure the service is running with: uvicorn app.main:app --host 0.0.0.0 --port 8000")
         return False
 
-def main():
+async def main():
     """Main test runner"""
     print("🚀 Database Service API - Comprehensive Test Suite")
     print("=" * 60)
     
     # Check if service is running
     print("\n🔍 Checking service health...")
-    service_healthy = check_service_health()
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        service_healthy = await check_service_health(client)
     
     if not service_healthy:
         print("\n⚠️  Service is not running. Some tests may fail.")
@@ -120,7 +151,7 @@ def main():
     test_results.append(("Integration Tests", run_integration_tests()))
     
     # Run endpoint-specific tests
-    test_results.append(("Endpoint Tests", run_endpoint_tests()))
+    test_results.append(("Endpoint Tests", await run_endpoint_tests()))
     
     # Print summary
     print(f"\n{'='*60}")
@@ -146,4 +177,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
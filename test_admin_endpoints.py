@@ -4,10 +4,10 @@ Test script for Admin endpoints
 """
 
 import asyncio
-import aiohttp
-import json
+import httpx
 import logging
-from typing import Dict, Any
+import orjson
+from typing import Dict, Any, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,41 +17,45 @@ logger = logging.getLogger(__name__)
 BASE_URL = "http://localhost:8000"
 ADMIN_BASE = f"{BASE_URL}/admin"
 
+def log_result(message: str, result: Any):
+    """Log a pretty-printed result at DEBUG level; the JSON is only rendered when DEBUG is enabled"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", message, orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode())
+
 class AdminEndpointTester:
     """Test class for admin endpoints"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # A client passed in by the caller is shared and left open on exit
+        self.session = client
+        self._owns_session = client is None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            # One pooled keep-alive client shared by all (concurrent) probes
+            self.session = httpx.AsyncClient(
+                base_url=BASE_URL,
+                limits=httpx.Limits(max_keepalive_connections=16)
+            )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        if self.session and self._owns_session:
+            await self.session.aclose()
     
     async def make_request(self, method: str, url: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
         """Make HTTP request and return response"""
         try:
-            if method.upper() == "GET":
-                async with self.session.get(url) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
-            elif method.upper() == "POST":
-                async with self.session.post(url, json=data) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
+            # Bodies are (de)serialized with orjson rather than httpx's stdlib json
+            content = orjson.dumps(data) if data is not None else None
+            headers = {"Content-Type": "application/json"} if content is not None else None
+            response = await self.session.request(method.upper(), url, content=content, headers=headers)
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            return {
+                "error": f"HTTP {response.status_code}",
+                "detail": response.text
+            }
         except Exception as e:
             logger.error(f"Request failed: {e}")
             return {"error": str(e)}
@@ -61,7 +65,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET / (root endpoint)...")
         
         result = await self.make_request("GET", BASE_URL)
-        logger.info(f"Root endpoint result: {json.dumps(result, indent=2)}")
+        log_result("Root endpoint result", result)
         
         if "error" not in result:
             logger.info("✅ Root endpoint working")
@@ -74,7 +78,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET /health (simple health check)...")
         
         result = await self.make_request("GET", f"{BASE_URL}/health")
-        logger.info(f"Health endpoint result: {json.dumps(result, indent=2)}")
+        log_result("Health endpoint result", result)
         
         if "error" not in result:
             logger.info("✅ Health endpoint working")
@@ -87,7 +91,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET /admin/health (detailed health check)...")
         
         result = await self.make_request("GET", f"{ADMIN_BASE}/health")
-        logger.info(f"Admin health result: {json.dumps(result, indent=2)}")
+        log_result("Admin health result", result)
         
         if "error" not in result and result.get("status") == "healthy":
             logger.info("✅ Admin health check passed")
@@ -100,7 +104,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET /admin/test-connection (connection test)...")
         
         result = await self.make_request("GET", f"{ADMIN_BASE}/test-connection")
-        logger.info(f"Connection test result: {json.dumps(result, indent=2)}")
+        log_result("Connection test result", result)
         
         if "error" not in result and result.get("status") == "success":
             logger.info("✅ Connection test passed")
@@ -113,7 +117,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET /admin/db-info (database information)...")
         
         result = await self.make_request("GET", f"{ADMIN_BASE}/db-info")
-        logger.info(f"Database info result: {json.dumps(result, indent=2)}")
+        log_result("Database info result", result)
         
         if "error" not in result:
             logger.info("✅ Database info retrieved successfully")
@@ -126,7 +130,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET /admin/databases (list all databases)...")
         
         result = await self.make_request("GET", f"{ADMIN_BASE}/databases")
-        logger.info(f"Databases result: {json.dumps(result, indent=2)}")
+        log_result("Databases result", result)
         
         if "error" not in result:
             logger.info("✅ Databases list retrieved successfully")
@@ -139,7 +143,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET /admin/schemas (list all schemas)...")
         
         result = await self.make_request("GET", f"{ADMIN_BASE}/schemas")
-        logger.info(f"Schemas result: {json.dumps(result, indent=2)}")
+        log_result("Schemas result", result)
         
         if "error" not in result:
             logger.info("✅ Schemas list retrieved successfully")
@@ -152,7 +156,7 @@ class AdminEndpointTester:
         logger.info("🔍 Testing GET /admin/tables (list all tables)...")
         
         result = await self.make_request("GET", f"{ADMIN_BASE}/tables")
-        logger.info(f"Tables result: {json.dumps(result, indent=2)}")
+        log_result("Tables result", result)
         
         if "error" not in result:
             logger.info("✅ Tables list retrieved successfully")
@@ -165,7 +169,7 @@ class AdminEndpointTester:
         logger.info(f"🔍 Testing GET /admin/tables/{schema_name} (tables in schema)...")
         
         result = await self.make_request("GET", f"{ADMIN_BASE}/tables/{schema_name}")
-        logger.info(f"Tables by schema result: {json.dumps(result, indent=2)}")
+        log_result("Tables by schema result", result)
         
         if "error" not in result:
             logger.info(f"✅ Tables in schema '{schema_name}' retrieved successfully")
@@ -178,21 +182,21 @@ class AdminEndpointTester:
         logger.info("🚀 Starting Admin endpoint tests...")
         
         try:
-            # Test basic endpoints first
-            await self.test_root_endpoint()
-            await self.test_health_endpoint()
-            
-            # Test admin endpoints
-            await self.test_admin_health()
-            await self.test_admin_connection()
-            await self.test_admin_db_info()
-            await self.test_admin_databases()
-            await self.test_admin_schemas()
-            await self.test_admin_tables()
-            
-            # Test tables by schema (try common schema names)
-            for schema in ["public", "information_schema"]:
-                await self.test_admin_tables_by_schema(schema)
+            # The probes are independent read-only requests, so run them concurrently
+            await asyncio.gather(
+                # Basic endpoints
+                self.test_root_endpoint(),
+                self.test_health_endpoint(),
+                # Admin endpoints
+                self.test_admin_health(),
+                self.test_admin_connection(),
+                self.test_admin_db_info(),
+                self.test_admin_databases(),
+                self.test_admin_schemas(),
+                self.test_admin_tables(),
+                # Tables by schema (try common schema names)
+                *[self.test_admin_tables_by_schema(schema) for schema in ["public", "information_schema"]]
+            )
             
             logger.info("✅ All admin endpoint tests completed!")
             
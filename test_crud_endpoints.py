@@ -4,10 +4,11 @@ Test script for CRUD endpoints
 """
 
 import asyncio
-import aiohttp
-import json
+import httpx
 import logging
-from typing import Dict, Any
+import orjson
+import random
+from typing import Dict, Any, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,79 +17,79 @@ logger = logging.getLogger(__name__)
 # Test configuration
 BASE_URL = "http://localhost:8000"
 CRUD_BASE = f"{BASE_URL}/crud"
+DOCS_URL = f"{CRUD_BASE}/public/documents"
+DOCS_LIST_LIMIT1 = f"{DOCS_URL}?limit=1"
+DOCS_LIST_LIMIT5 = f"{DOCS_URL}?limit=5"
+DOCS_PAGE_URL = f"{DOCS_URL}?limit=2&offset=0"
+DOCS_ORDERED_URL = f"{DOCS_URL}?limit=3&order_by=content DESC"
+MISSING_TABLE_URL = f"{CRUD_BASE}/public/non_existent_table"
+JSON_HEADERS = {"Content-Type": "application/json"}
+KEEPALIVE_HEADERS = {"Connection": "keep-alive"}
+KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=120)
+
+# Connection-level failures worth retrying, with exponential backoff plus jitter
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.05
+TRANSIENT_ERRORS = (httpx.ConnectError, httpx.RemoteProtocolError, httpx.TimeoutException)
+
+class ResponseDetail(bytes):
+    """Raw error response body, decoded to text only when it is actually formatted"""
+    
+    def __str__(self) -> str:
+        return self.decode("utf-8", errors="replace")
+
+def log_result(message: str, result: Any):
+    """Log a pretty-printed result at DEBUG level; the JSON is only rendered when DEBUG is enabled"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", message, orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode())
 
 class CrudEndpointTester:
     """Test class for CRUD endpoints"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # A client passed in by the caller is shared and left open on exit
+        self.session = client
+        self._owns_session = client is None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = httpx.AsyncClient(timeout=10.0, limits=KEEPALIVE_LIMITS, headers=KEEPALIVE_HEADERS)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        if self.session and self._owns_session:
+            await self.session.aclose()
     
     async def make_request(self, method: str, url: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make HTTP request and return response"""
-        try:
-            if method.upper() == "GET":
-                async with self.session.get(url) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
-            elif method.upper() == "POST":
-                async with self.session.post(url, json=data) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
-            elif method.upper() == "PUT":
-                async with self.session.put(url, json=data) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
-            elif method.upper() == "DELETE":
-                async with self.session.delete(url) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
-            elif method.upper() == "PATCH":
-                async with self.session.patch(url, json=data) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            return {"error": str(e)}
+        """Make HTTP request (method given as an upper-case verb) and return response, retrying transient connection failures"""
+        # Bodies are (de)serialized with orjson rather than httpx's stdlib json
+        body = orjson.dumps(data) if data is not None else None
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                response = await self.session.request(method, url, content=body, headers=JSON_HEADERS)
+                if response.status_code == 200:
+                    return orjson.loads(response.content)
+                return {
+                    "error": f"HTTP {response.status_code}",
+                    "detail": ResponseDetail(response.content)
+                }
+            except TRANSIENT_ERRORS as e:
+                if attempt + 1 == RETRY_ATTEMPTS:
+                    logger.error("Request failed after %d attempts: %r", RETRY_ATTEMPTS, e)
+                    return {"error": str(e) or type(e).__name__}
+                delay = RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+                logger.warning("Retrying %s %s in %.2fs: %r", method, url, delay, e)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error("Request failed: %s", e)
+                return {"error": str(e)}
     
     async def test_health_check(self):
         """Test that the service is running"""
         logger.info("🔍 Testing service health...")
         
         result = await self.make_request("GET", f"{BASE_URL}/admin/health")
-        logger.info(f"Health check result: {json.dumps(result, indent=2)}")
+        log_result("Health check result", result)
         
         if result.get("status") == "healthy":
             logger.info("✅ Service is healthy")
@@ -101,8 +102,8 @@ class CrudEndpointTester:
         logger.info("🔍 Testing GET /crud/{schema}/{table} - Read multiple records...")
         
         # Test reading from public.documents table
-        result = await self.make_request("GET", f"{CRUD_BASE}/public/documents?limit=5")
-        logger.info(f"Read multiple records result: {json.dumps(result, indent=2)}")
+        result = await self.make_request("GET", DOCS_LIST_LIMIT5)
+        log_result("Read multiple records result", result)
         
         if "error" not in result and result.get("records") is not None:
             logger.info("✅ Read multiple records successful")
@@ -111,18 +112,19 @@ class CrudEndpointTester:
         
         return result
     
-    async def test_crud_read_single(self):
-        """Test reading a single record by ID"""
+    async def test_crud_read_single(self, record_id: Optional[Any] = None):
+        """Test reading a single record by ID (discovered with an extra GET when not given)"""
         logger.info("🔍 Testing GET /crud/{schema}/{table}/{id} - Read single record...")
         
-        # First, get a record ID from the documents table
-        records_result = await self.make_request("GET", f"{CRUD_BASE}/public/documents?limit=1")
+        # Without a known ID, first get a record ID from the documents table
+        records_result = {"records": [{"id": record_id}]} if record_id else \
+            await self.make_request("GET", DOCS_LIST_LIMIT1)
         
         if "error" not in records_result and records_result.get("records"):
             record_id = records_result["records"][0].get("id")
             if record_id:
-                result = await self.make_request("GET", f"{CRUD_BASE}/public/documents/{record_id}")
-                logger.info(f"Read single record result: {json.dumps(result, indent=2)}")
+                result = await self.make_request("GET", f"{DOCS_URL}/{record_id}")
+                log_result("Read single record result", result)
                 
                 if "error" not in result and result.get("data"):
                     logger.info("✅ Read single record successful")
@@ -148,8 +150,8 @@ class CrudEndpointTester:
             }
         }
         
-        result = await self.make_request("POST", f"{CRUD_BASE}/public/documents", create_data)
-        logger.info(f"Create record result: {json.dumps(result, indent=2)}")
+        result = await self.make_request("POST", DOCS_URL, create_data)
+        log_result("Create record result", result)
         
         if "error" not in result and result.get("data"):
             logger.info("✅ Create record successful")
@@ -158,12 +160,13 @@ class CrudEndpointTester:
         
         return result
     
-    async def test_crud_update(self):
-        """Test updating an existing record"""
+    async def test_crud_update(self, record_id: Optional[Any] = None):
+        """Test updating an existing record (discovered with an extra GET when not given)"""
         logger.info("🔍 Testing PUT /crud/{schema}/{table}/{id} - Update record...")
         
-        # First, get a record ID from the documents table
-        records_result = await self.make_request("GET", f"{CRUD_BASE}/public/documents?limit=1")
+        # Without a known ID, first get a record ID from the documents table
+        records_result = {"records": [{"id": record_id}]} if record_id else \
+            await self.make_request("GET", DOCS_LIST_LIMIT1)
         
         if "error" not in records_result and records_result.get("records"):
             record_id = records_result["records"][0].get("id")
@@ -174,8 +177,8 @@ class CrudEndpointTester:
                     }
                 }
                 
-                result = await self.make_request("PUT", f"{CRUD_BASE}/public/documents/{record_id}", update_data)
-                logger.info(f"Update record result: {json.dumps(result, indent=2)}")
+                result = await self.make_request("PUT", f"{DOCS_URL}/{record_id}", update_data)
+                log_result("Update record result", result)
                 
                 if "error" not in result and result.get("data"):
                     logger.info("✅ Update record successful")
@@ -190,24 +193,27 @@ class CrudEndpointTester:
         
         return result
     
-    async def test_crud_delete(self):
-        """Test deleting a record"""
+    async def test_crud_delete(self, record_id: Optional[Any] = None):
+        """Test deleting a record (a fresh one is created first when no ID is given)"""
         logger.info("🔍 Testing DELETE /crud/{schema}/{table}/{id} - Delete record...")
         
-        # First, create a record to delete
-        create_data = {
-            "data": {
-                "content": "This document will be deleted by the CRUD test script"
+        if record_id:
+            create_result = {"data": {"id": record_id}}
+        else:
+            # First, create a record to delete
+            create_data = {
+                "data": {
+                    "content": "This document will be deleted by the CRUD test script"
+                }
             }
-        }
-        
-        create_result = await self.make_request("POST", f"{CRUD_BASE}/public/documents", create_data)
+            
+            create_result = await self.make_request("POST", DOCS_URL, create_data)
         
         if "error" not in create_result and create_result.get("data"):
             record_id = create_result["data"].get("id")
             if record_id:
-                result = await self.make_request("DELETE", f"{CRUD_BASE}/public/documents/{record_id}")
-                logger.info(f"Delete record result: {json.dumps(result, indent=2)}")
+                result = await self.make_request("DELETE", f"{DOCS_URL}/{record_id}")
+                log_result("Delete record result", result)
                 
                 if "error" not in result and result.get("deleted_record"):
                     logger.info("✅ Delete record successful")
@@ -234,8 +240,8 @@ class CrudEndpointTester:
             }
         }
         
-        result = await self.make_request("PATCH", f"{CRUD_BASE}/public/documents/{test_id}", upsert_data)
-        logger.info(f"Upsert record result: {json.dumps(result, indent=2)}")
+        result = await self.make_request("PATCH", f"{DOCS_URL}/{test_id}", upsert_data)
+        log_result("Upsert record result", result)
         
         if "error" not in result and result.get("record"):
             logger.info("✅ Upsert record successful")
@@ -249,8 +255,8 @@ class CrudEndpointTester:
         logger.info("🔍 Testing CRUD pagination features...")
         
         # Test with limit and offset
-        result = await self.make_request("GET", f"{CRUD_BASE}/public/documents?limit=2&offset=0")
-        logger.info(f"Pagination test result: {json.dumps(result, indent=2)}")
+        result = await self.make_request("GET", DOCS_PAGE_URL)
+        log_result("Pagination test result", result)
         
         if "error" not in result and result.get("records") is not None:
             logger.info("✅ Pagination test successful")
@@ -264,8 +270,8 @@ class CrudEndpointTester:
         logger.info("🔍 Testing CRUD ordering features...")
         
         # Test with ordering
-        result = await self.make_request("GET", f"{CRUD_BASE}/public/documents?limit=3&order_by=content DESC")
-        logger.info(f"Ordering test result: {json.dumps(result, indent=2)}")
+        result = await self.make_request("GET", DOCS_ORDERED_URL)
+        log_result("Ordering test result", result)
         
         if "error" not in result and result.get("records") is not None:
             logger.info("✅ Ordering test successful")
@@ -279,8 +285,8 @@ class CrudEndpointTester:
         logger.info("🔍 Testing CRUD error handling...")
         
         # Test with non-existent table
-        result = await self.make_request("GET", f"{CRUD_BASE}/public/non_existent_table")
-        logger.info(f"Error handling test result: {json.dumps(result, indent=2)}")
+        result = await self.make_request("GET", MISSING_TABLE_URL)
+        log_result("Error handling test result", result)
         
         if "error" in result:
             logger.info("✅ Error handling working correctly")
@@ -294,26 +300,30 @@ class CrudEndpointTester:
         logger.info("🚀 Starting CRUD endpoint tests...")
         
         try:
-            # Test health first
-            await self.test_health_check()
+            # Read-only checks have no data dependencies, so run them concurrently
+            await asyncio.gather(
+                self.test_health_check(),
+                self.test_crud_read_multiple(),
+                self.test_crud_pagination(),
+                self.test_crud_ordering(),
+                self.test_crud_error_handling()
+            )
             
-            # Test CRUD operations
-            await self.test_crud_read_multiple()
-            await self.test_crud_read_single()
-            await self.test_crud_create()
-            await self.test_crud_update()
-            await self.test_crud_delete()
+            # The created record is threaded through read/update/delete, which
+            # saves each of them a discovery request
+            created = await self.test_crud_create()
+            record_id = (created.get("data") or {}).get("id")
+            await asyncio.gather(
+                self.test_crud_read_single(record_id),
+                self.test_crud_update(record_id)
+            )
+            await self.test_crud_delete(record_id)
             await self.test_crud_upsert()
             
-            # Test CRUD features
-            await self.test_crud_pagination()
-            await self.test_crud_ordering()
-            await self.test_crud_error_handling()
-            
             logger.info("✅ All CRUD endpoint tests completed!")
             
         except Exception as e:
-            logger.error(f"❌ CRUD test failed: {e}")
+            logger.error("❌ CRUD test failed: %s", e)
             raise
 
 async def main():
@@ -322,4 +332,10 @@ async def main():
         await tester.run_all_crud_tests()
 
 if __name__ == "__main__":
+    try:
+        # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -4,11 +4,12 @@ Test edge cases for parameter handling
 """
 
 import asyncio
-import aiohttp
-import json
+import httpx
+import orjson
+from typing import Optional
 
-async def test_edge_cases():
-    """Test various edge cases"""
+async def test_edge_cases(client: Optional[httpx.AsyncClient] = None):
+    """Test various edge cases, reusing client when one is given"""
     base_url = "http://localhost:8000"
     
     print("🧪 Testing Edge Cases...")
@@ -37,26 +38,33 @@ async def test_edge_cases():
         }
     ]
     
+    if client is None:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            await _run_edge_cases(client, base_url, test_cases)
+    else:
+        await _run_edge_cases(client, base_url, test_cases)
+
+async def _run_edge_cases(client: httpx.AsyncClient, base_url: str, test_cases: list):
+    """Post each edge case to the service and print the outcome"""
     try:
-        async with aiohttp.ClientSession() as session:
-            for test_case in test_cases:
-                print(f"\n📝 Testing: {test_case['name']}")
-                print(f"SQL: {test_case['sql']}")
-                print(f"Parameters: {test_case['parameters']}")
-                
-                data = {
-                    "sql": test_case['sql'],
-                    "parameters": test_case['parameters']
-                }
-                
-                async with session.post(f"{base_url}/crud/raw-sql", json=data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        print(f"✅ Success: {result.get('message', 'No message')}")
-                    else:
-                        error_text = await response.text()
-                        print(f"❌ Error ({response.status}): {error_text}")
-                        
+        for test_case in test_cases:
+            print(f"\n📝 Testing: {test_case['name']}")
+            print(f"SQL: {test_case['sql']}")
+            print(f"Parameters: {test_case['parameters']}")
+            
+            data = {
+                "sql": test_case['sql'],
+                "parameters": test_case['parameters']
+            }
+            
+            response = await client.post(f"{base_url}/crud/raw-sql", content=orjson.dumps(data),
+                                         headers={"Content-Type": "application/json"})
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                print(f"✅ Success: {result.get('message', 'No message')}")
+            else:
+                print(f"❌ Error ({response.status_code}): {response.text}")
+                    
     except Exception as e:
         print(f"❌ Error testing SQL: {e}")
 
@@ -4,10 +4,11 @@ Test script for the new prepared SQL endpoints
 """
 
 import asyncio
-import aiohttp
-import json
+import httpx
 import logging
-from typing import Dict, Any
+import orjson
+import random
+from typing import Dict, Any, List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,70 +17,103 @@ logger = logging.getLogger(__name__)
 # Test configuration
 BASE_URL = "http://localhost:8000"
 PREPARED_BASE = f"{BASE_URL}/crud/prepared"
+JSON_HEADERS = {"Content-Type": "application/json"}
+KEEPALIVE_HEADERS = {"Connection": "keep-alive"}
+KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=120)
+
+# Connection-level failures worth retrying, with exponential backoff plus jitter
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.05
+TRANSIENT_ERRORS = (httpx.ConnectError, httpx.RemoteProtocolError, httpx.TimeoutException)
+
+class ResponseDetail(bytes):
+    """Raw error response body, decoded to text only when it is actually formatted"""
+    
+    def __str__(self) -> str:
+        return self.decode("utf-8", errors="replace")
+
+def log_result(message: str, result: Any):
+    """Log a pretty-printed result at DEBUG level; the JSON is only rendered when DEBUG is enabled"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", message, orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode())
 
 class PreparedEndpointTester:
     """Test class for prepared SQL endpoints"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # A client passed in by the caller is shared and left open on exit
+        self.session = client
+        self._owns_session = client is None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = httpx.AsyncClient(timeout=10.0, limits=KEEPALIVE_LIMITS, headers=KEEPALIVE_HEADERS)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        if self.session and self._owns_session:
+            await self.session.aclose()
     
     async def make_request(self, method: str, url: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make HTTP request and return response"""
-        try:
-            if method.upper() == "GET":
-                async with self.session.get(url) as response:
-                    return await response.json()
-            elif method.upper() == "POST":
-                async with self.session.post(url, json=data) as response:
-                    return await response.json()
-            elif method.upper() == "DELETE":
-                async with self.session.delete(url) as response:
-                    return await response.json()
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            return {"error": str(e)}
+        """Make HTTP request (method given as an upper-case verb) and return response, retrying transient connection failures"""
+        # Bodies are (de)serialized with orjson rather than httpx's stdlib json
+        body = orjson.dumps(data) if data is not None else None
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                response = await self.session.request(method, url, content=body, headers=JSON_HEADERS)
+                if response.status_code == 200:
+                    return orjson.loads(response.content)
+                return {
+                    "error": f"HTTP {response.status_code}",
+                    "detail": ResponseDetail(response.content)
+                }
+            except TRANSIENT_ERRORS as e:
+                if attempt + 1 == RETRY_ATTEMPTS:
+                    logger.error("Request failed after %d attempts: %r", RETRY_ATTEMPTS, e)
+                    return {"error": str(e) or type(e).__name__}
+                delay = RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+                logger.warning("Retrying %s %s in %.2fs: %r", method, url, delay, e)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error("Request failed: %s", e)
+                return {"error": str(e)}
+    
+    async def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit several {endpoint, body} requests in one POST to /batch; returns their results in order"""
+        result = await self.make_request("POST", f"{PREPARED_BASE}/batch", {"requests": requests})
+        if "error" in result:
+            return [result] * len(requests)
+        return result["results"]
     
     async def test_validate_endpoint(self):
         """Test the validate endpoint"""
         logger.info("Testing /crud/prepared/validate endpoint...")
         
-        # Test valid SQL
-        valid_request = {
-            "sql": "SELECT * FROM users WHERE id = $1 AND active = $2",
-            "parameters": {"1": 123, "2": True},
-            "operation_type": "read"
-        }
-        
-        result = await self.make_request("POST", f"{PREPARED_BASE}/validate", valid_request)
-        logger.info(f"Valid SQL validation result: {json.dumps(result, indent=2)}")
-        
-        # Test invalid SQL (wrong parameter count)
-        invalid_request = {
-            "sql": "SELECT * FROM users WHERE id = $1 AND active = $2",
-            "parameters": {"1": 123},  # Missing second parameter
-            "operation_type": "read"
-        }
-        
-        result = await self.make_request("POST", f"{PREPARED_BASE}/validate", invalid_request)
-        logger.info(f"Invalid SQL validation result: {json.dumps(result, indent=2)}")
-        
-        # Test dangerous SQL
-        dangerous_request = {
-            "sql": "DROP TABLE users",
-            "parameters": {},
-            "operation_type": "write"
-        }
+        requests = [
+            # Test valid SQL
+            {
+                "sql": "SELECT * FROM users WHERE id = $1 AND active = $2",
+                "parameters": [123, True],
+                "operation_type": "read"
+            },
+            # Test invalid SQL (wrong parameter count)
+            {
+                "sql": "SELECT * FROM users WHERE id = $1 AND active = $2",
+                "parameters": [123],  # Missing second parameter
+                "operation_type": "read"
+            },
+            # Test dangerous SQL
+            {
+                "sql": "DROP TABLE users",
+                "parameters": [],
+                "operation_type": "write"
+            }
+        ]
         
-        result = await self.make_request("POST", f"{PREPARED_BASE}/validate", dangerous_request)
-        logger.info(f"Dangerous SQL validation result: {json.dumps(result, indent=2)}")
+        # All three validations go out in a single request
+        results = await self.batch([{"endpoint": "validate", "body": body} for body in requests])
+        for label, result in zip(["Valid", "Invalid", "Dangerous"], results):
+            log_result(f"{label} SQL validation result", result)
     
     async def test_select_endpoint(self):
         """Test the select endpoint"""
@@ -88,22 +122,22 @@ class PreparedEndpointTester:
         # Test simple select
         select_request = {
             "sql": "SELECT version() as db_version",
-            "parameters": {},
+            "parameters": [],
             "operation_type": "read"
         }
         
         result = await self.make_request("POST", f"{PREPARED_BASE}/select", select_request)
-        logger.info(f"Select result: {json.dumps(result, indent=2)}")
+        log_result("Select result", result)
         
         # Test parameterized select
         param_select_request = {
             "sql": "SELECT current_database() as db_name, current_user as user",
-            "parameters": {},
+            "parameters": [],
             "operation_type": "read"
         }
         
         result = await self.make_request("POST", f"{PREPARED_BASE}/select", param_select_request)
-        logger.info(f"Parameterized select result: {json.dumps(result, indent=2)}")
+        log_result("Parameterized select result", result)
     
     async def test_insert_endpoint(self):
         """Test the insert endpoint"""
@@ -117,17 +151,12 @@ class PreparedEndpointTester:
                 VALUES ($1, $2, $3, $4) 
                 RETURNING table_name
             """,
-            "parameters": {
-                "1": "test_db",
-                "2": "test_schema", 
-                "3": "test_table",
-                "4": "BASE TABLE"
-            },
+            "parameters": ["test_db", "test_schema", "test_table", "BASE TABLE"],
             "operation_type": "write"
         }
         
         result = await self.make_request("POST", f"{PREPARED_BASE}/insert", insert_request)
-        logger.info(f"Insert result: {json.dumps(result, indent=2)}")
+        log_result("Insert result", result)
     
     async def test_update_endpoint(self):
         """Test the update endpoint"""
@@ -136,15 +165,12 @@ class PreparedEndpointTester:
         # Test update (this will likely fail since we're not actually updating real data)
         update_request = {
             "sql": "UPDATE information_schema.tables SET table_name = $1 WHERE table_name = $2",
-            "parameters": {
-                "1": "updated_table",
-                "2": "non_existent_table"
-            },
+            "parameters": ["updated_table", "non_existent_table"],
             "operation_type": "write"
         }
         
         result = await self.make_request("POST", f"{PREPARED_BASE}/update", update_request)
-        logger.info(f"Update result: {json.dumps(result, indent=2)}")
+        log_result("Update result", result)
     
     async def test_delete_endpoint(self):
         """Test the delete endpoint"""
@@ -153,38 +179,36 @@ class PreparedEndpointTester:
         # Test delete (this will likely fail since we're not actually deleting real data)
         delete_request = {
             "sql": "DELETE FROM information_schema.tables WHERE table_name = $1",
-            "parameters": {
-                "1": "non_existent_table"
-            },
+            "parameters": ["non_existent_table"],
             "operation_type": "write"
         }
         
         result = await self.make_request("POST", f"{PREPARED_BASE}/delete", delete_request)
-        logger.info(f"Delete result: {json.dumps(result, indent=2)}")
+        log_result("Delete result", result)
     
     async def test_execute_endpoint(self):
         """Test the general execute endpoint"""
         logger.info("Testing /crud/prepared/execute endpoint...")
         
-        # Test read operation
-        read_request = {
-            "sql": "SELECT current_timestamp as current_time",
-            "parameters": {},
-            "operation_type": "read"
-        }
-        
-        result = await self.make_request("POST", f"{PREPARED_BASE}/execute", read_request)
-        logger.info(f"Execute read result: {json.dumps(result, indent=2)}")
-        
-        # Test write operation
-        write_request = {
-            "sql": "SELECT 1 as test_value",
-            "parameters": {},
-            "operation_type": "write"
-        }
+        requests = [
+            # Test read operation
+            {
+                "sql": "SELECT current_timestamp as current_time",
+                "parameters": [],
+                "operation_type": "read"
+            },
+            # Test write operation
+            {
+                "sql": "SELECT 1 as test_value",
+                "parameters": [],
+                "operation_type": "write"
+            }
+        ]
         
-        result = await self.make_request("POST", f"{PREPARED_BASE}/execute", write_request)
-        logger.info(f"Execute write result: {json.dumps(result, indent=2)}")
+        # Both variants go out in a single request
+        results = await self.batch([{"endpoint": "execute", "body": body} for body in requests])
+        for label, result in zip(["read", "write"], results):
+            log_result(f"Execute {label} result", result)
     
     async def test_statements_management(self):
         """Test prepared statement management endpoints"""
@@ -192,22 +216,22 @@ class PreparedEndpointTester:
         
         # Get current statements
         result = await self.make_request("GET", f"{PREPARED_BASE}/statements")
-        logger.info(f"Current statements: {json.dumps(result, indent=2)}")
+        log_result("Current statements", result)
         
         # Clear all statements
         result = await self.make_request("DELETE", f"{PREPARED_BASE}/statements")
-        logger.info(f"Clear all statements result: {json.dumps(result, indent=2)}")
+        log_result("Clear all statements result", result)
         
         # Get statements again (should be empty)
         result = await self.make_request("GET", f"{PREPARED_BASE}/statements")
-        logger.info(f"Statements after clear: {json.dumps(result, indent=2)}")
+        log_result("Statements after clear", result)
     
     async def test_health_check(self):
         """Test that the service is running"""
         logger.info("Testing service health...")
         
         result = await self.make_request("GET", f"{BASE_URL}/admin/health")
-        logger.info(f"Health check result: {json.dumps(result, indent=2)}")
+        log_result("Health check result", result)
         
         if result.get("status") == "healthy":
             logger.info("✅ Service is healthy")
@@ -219,22 +243,24 @@ class PreparedEndpointTester:
         logger.info("🚀 Starting prepared endpoint tests...")
         
         try:
-            # Test health first
-            await self.test_health_check()
+            # Read-only and management checks are independent, so run them concurrently
+            await asyncio.gather(
+                self.test_health_check(),
+                self.test_validate_endpoint(),
+                self.test_select_endpoint(),
+                self.test_execute_endpoint(),
+                self.test_statements_management()
+            )
             
-            # Test prepared endpoints
-            await self.test_validate_endpoint()
-            await self.test_select_endpoint()
+            # Write endpoints run in order
             await self.test_insert_endpoint()
             await self.test_update_endpoint()
             await self.test_delete_endpoint()
-            await self.test_execute_endpoint()
-            await self.test_statements_management()
             
             logger.info("✅ All tests completed successfully!")
             
         except Exception as e:
-            logger.error(f"❌ Test failed: {e}")
+            logger.error("❌ Test failed: %s", e)
             raise
 
 async def main():
@@ -243,4 +269,10 @@ async def main():
         await tester.run_all_tests()
 
 if __name__ == "__main__":
+    try:
+        # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -5,241 +5,261 @@ Test script for Raw SQL endpoints
 
 import asyncio
 import aiohttp
-import json
+import hashlib
 import logging
-from typing import Dict, Any
+import orjson
+import os
+import socket
+import sys
+import time
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# In CI nobody reads the progress lines, so only warnings and errors are emitted
+if os.environ.get("CI") and not sys.stderr.isatty():
+    logging.getLogger().setLevel(logging.WARNING)
+
 # Test configuration
 BASE_URL = "http://localhost:8000"
 RAW_BASE = f"{BASE_URL}/raw"
 
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+_SKIP_AUTO_HEADERS = ("User-Agent",)
+
+class _LazyJson:
+    """Pretty-prints its object as JSON only when a log record is actually formatted"""
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return orjson.dumps(self.obj, default=str, option=orjson.OPT_INDENT_2).decode()
+
+# How long a healthy /admin/health response is reused before checking again
+HEALTH_CACHE_TTL = 60.0
+
+class RawCase(NamedTuple):
+    """One raw SQL request, serialized once at import, and the outcome it should produce"""
+    name: str
+    path: str
+    body: bytes
+    expect: str = "success"  # "success", "error" or "injection"
+    # Read requests that refer to the statement by statement_id instead of its SQL
+    id_body: Optional[bytes] = None
+
+def _case(name: str, path: str, payload: Dict[str, Any], expect: str = "success") -> RawCase:
+    if path != "/sql":
+        return RawCase(name, path, orjson.dumps(payload), expect)
+    # /raw/sql registers a statement sent with its statement_id (the SHA-1 of the SQL),
+    # after which the id alone is enough
+    statement_id = hashlib.sha1(payload["sql"].encode()).hexdigest()
+    id_payload = {key: value for key, value in payload.items() if key != "sql"}
+    return RawCase(name, path, orjson.dumps({**payload, "statement_id": statement_id}), expect,
+                   orjson.dumps({**id_payload, "statement_id": statement_id}))
+
+_SCHEMA_SQL = (
+    "SELECT schemaname, tablename, tableowner, hasindexes, hasrules, hastriggers "
+    "FROM pg_tables WHERE schemaname NOT IN ('information_schema', 'pg_catalog') "
+    "ORDER BY schemaname, tablename LIMIT 10"
+)
+
+# Server details and the schema listing in one round trip; the endpoint accepts a
+# single statement, so the table list is folded into a json_agg subquery
+_METADATA_SQL = (
+    "SELECT version() as db_version, current_database() as db_name, current_user as user, "
+    f"(SELECT json_agg(t) FROM ({_SCHEMA_SQL}) t) as tables"
+)
+
+# Independent read cases
+_READ_CASES = (
+    _case("Database metadata query", "/sql", {"sql": _METADATA_SQL}),
+    _case("Parameterized SQL query", "/sql", {
+        "sql": "SELECT $1 as test_param, $2 as another_param, current_timestamp as current_time",
+        "parameters": {"1": "Hello World", "2": "42"}
+    }),
+    _case("Error handling", "/sql", {"sql": "SELECT * FROM non_existent_table_12345"}, "error"),
+    _case("SQL injection protection", "/sql", {
+        "sql": "SELECT * FROM users WHERE id = 1; DROP TABLE users; --"
+    }, "injection"),
+)
+
+# Write cases, run in order: the insert uses the table the first case creates
+_WRITE_CASES = (
+    _case("Simple write operation", "/sql/write", {
+        "sql": "CREATE TEMP TABLE IF NOT EXISTS test_write_table_v2 (id TEXT, name TEXT)"
+    }),
+    _case("Parameterized write operation", "/sql/write", {
+        "sql": "INSERT INTO test_write_table_v2 (id, name) VALUES ($1, $2)",
+        "parameters": {"1": "1", "2": "test_value"}
+    }),
+    _case("Write error handling", "/sql/write", {
+        "sql": "INSERT INTO non_existent_table (id, name) VALUES (1, 'test')"
+    }, "error"),
+)
+
+# Successful read responses, shared by identical requests made within the TTL.
+# Each entry holds a future, so concurrent identical requests make a single call.
+RESPONSE_CACHE_TTL = 30.0
+_response_cache: Dict[Tuple[str, str, bytes], Tuple[float, asyncio.Future]] = {}
+
+# Process-wide client session shared by every test in this run
+_session: Optional[aiohttp.ClientSession] = None
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the shared client session, creating it on first use inside the running loop"""
+    global _session
+    if _session is None or _session.closed:
+        # Keep sockets open between calls and ask the server to do the same, so the
+        # whole run reuses a handful of connections
+        # The target host is resolved once (IPv4 only, no AAAA lookup) and cached for the run
+        connector = aiohttp.TCPConnector(limit=500, ttl_dns_cache=3600, family=socket.AF_INET,
+                                         keepalive_timeout=85, force_close=False)
+        _session = aiohttp.ClientSession(connector=connector, headers={"Connection": "keep-alive"})
+    return _session
+
+async def close_session():
+    """Close the shared client session if one was opened"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
 class RawEndpointTester:
     """Test class for raw SQL endpoints"""
     
+    # Last healthy /admin/health response, shared by every tester in the process
+    _health_cache: Optional[Dict[str, Any]] = None
+    _health_cache_ts: float = 0.0
+    
     def __init__(self):
         self.session = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # The shared session outlives the tester; close_session() releases it
+        self.session = get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        pass
     
-    async def make_request(self, method: str, url: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make HTTP request and return response"""
+    async def make_request(self, method: str, url: str, data: Dict[str, Any] = None,
+                           body: Optional[bytes] = None) -> Dict[str, Any]:
+        """Make HTTP request and return response; body, when given, is already-encoded JSON"""
+        # Bodies are pre-encoded with orjson and sent as bytes, bypassing aiohttp's json= encoder
+        if body is None and data is not None:
+            body = orjson.dumps(data)
         try:
-            if method.upper() == "GET":
-                async with self.session.get(url) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
-            elif method.upper() == "POST":
-                async with self.session.post(url, json=data) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {
-                            "error": f"HTTP {response.status}",
-                            "detail": await response.text()
-                        }
+            async with self.session.request(method, url, data=body, headers=_JSON_HEADERS,
+                                            skip_auto_headers=_SKIP_AUTO_HEADERS) as response:
+                # The body is read once as bytes; only error bodies are decoded to text
+                content = await response.read()
+                if response.status == 200:
+                    return orjson.loads(content)
+                return {
+                    "error": f"HTTP {response.status}",
+                    "detail": content.decode("utf-8", "replace")
+                }
         except Exception as e:
-            logger.error(f"Request failed: {e}")
+            logger.error("Request failed: %s", e)
             return {"error": str(e)}
     
+    async def shared_request(self, method: str, url: str, body: bytes) -> Dict[str, Any]:
+        """
+        make_request for read-only calls, answered from the response cache when possible
+        
+        Only successful responses stay cached; errors are handed to any callers
+        already waiting on them and then dropped.
+        """
+        key = (method, url, body)
+        entry = _response_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < RESPONSE_CACHE_TTL:
+            return await entry[1]
+        
+        future = asyncio.get_running_loop().create_future()
+        _response_cache[key] = (time.monotonic(), future)
+        try:
+            result = await self.make_request(method, url, body=body)
+        except BaseException:
+            _response_cache.pop(key, None)
+            future.cancel()
+            raise
+        future.set_result(result)
+        if "error" in result:
+            _response_cache.pop(key, None)
+        return result
+    
     async def test_health_check(self):
         """Test that the service is running"""
         logger.info("🔍 Testing service health...")
         
+        cls = type(self)
+        if cls._health_cache is not None and time.monotonic() - cls._health_cache_ts < HEALTH_CACHE_TTL:
+            logger.info("✅ Service is healthy (cached)")
+            return cls._health_cache
+        
         result = await self.make_request("GET", f"{BASE_URL}/admin/health")
-        logger.info(f"Health check result: {json.dumps(result, indent=2)}")
+        logger.info("Health check result: %s", _LazyJson(result))
         
         if result.get("status") == "healthy":
             logger.info("✅ Service is healthy")
+            cls._health_cache, cls._health_cache_ts = result, time.monotonic()
         else:
             logger.error("❌ Service is not healthy")
+            cls._health_cache = None
         return result
     
-    async def test_raw_sql_simple(self):
-        """Test simple raw SQL read operations"""
-        logger.info("🔍 Testing /raw/sql endpoint - Simple queries...")
-        
-        # Test 1: Simple SELECT without parameters
-        simple_request = {
-            "sql": "SELECT version() as db_version, current_database() as db_name, current_user as user"
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql", simple_request)
-        logger.info(f"Simple SQL result: {json.dumps(result, indent=2)}")
-        
-        if "error" not in result and result.get("success"):
-            logger.info("✅ Simple SQL query successful")
+    async def _run_case(self, case: RawCase) -> Dict[str, Any]:
+        """Send one table-driven case and log whether the outcome matched its expectation"""
+        logger.info("🔍 Testing %s - %s...", case.path, case.name)
+        
+        # Writes always go to the server; reads may share an identical earlier response
+        request = self.make_request if case.path == "/sql/write" else self.shared_request
+        url = f"{RAW_BASE}{case.path}"
+        result = None
+        if case.id_body is not None:
+            # Try the short form first; the server answers 404 until the statement is registered
+            result = await request("POST", url, body=case.id_body)
+        if result is None or result.get("error") == "HTTP 404":
+            result = await request("POST", url, body=case.body)
+        logger.info("%s result: %s", case.name, _LazyJson(result))
+        
+        if case.expect == "success":
+            passed = "error" not in result and bool(result.get("success"))
+        elif case.expect == "injection":
+            passed = "error" in result and "injection" in str(result).lower()
         else:
-            logger.error("❌ Simple SQL query failed")
-        
-        return result
-    
-    async def test_raw_sql_with_parameters(self):
-        """Test raw SQL with parameters"""
-        logger.info("🔍 Testing /raw/sql endpoint - Parameterized queries...")
+            passed = "error" in result
         
-        # Test 2: SELECT with parameters
-        param_request = {
-            "sql": "SELECT $1 as test_param, $2 as another_param, current_timestamp as current_time",
-            "parameters": {
-                "1": "Hello World",
-                "2": "42"
-            }
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql", param_request)
-        logger.info(f"Parameterized SQL result: {json.dumps(result, indent=2)}")
-        
-        if "error" not in result and result.get("success"):
-            logger.info("✅ Parameterized SQL query successful")
+        if passed:
+            logger.info("✅ %s passed", case.name)
+        elif case.expect == "injection":
+            logger.warning("⚠️ %s may need review", case.name)
         else:
-            logger.error("❌ Parameterized SQL query failed")
-        
+            logger.error("❌ %s failed", case.name)
         return result
     
-    async def test_raw_sql_database_info(self):
-        """Test raw SQL to get database information"""
-        logger.info("🔍 Testing /raw/sql endpoint - Database information queries...")
-        
-        # Test 3: Get database schema information
-        schema_request = {
-            "sql": """
-                SELECT 
-                    schemaname,
-                    tablename,
-                    tableowner,
-                    hasindexes,
-                    hasrules,
-                    hastriggers
-                FROM pg_tables 
-                WHERE schemaname NOT IN ('information_schema', 'pg_catalog')
-                ORDER BY schemaname, tablename
-                LIMIT 10
-            """
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql", schema_request)
-        logger.info(f"Schema info result: {json.dumps(result, indent=2)}")
-        
-        if "error" not in result and result.get("success"):
-            logger.info("✅ Schema info query successful")
-        else:
-            logger.error("❌ Schema info query failed")
-        
-        return result
+    async def _run_cases_in_order(self, cases: tuple):
+        """Run cases one after another, for cases that depend on earlier ones"""
+        for case in cases:
+            await self._run_case(case)
     
-    async def test_raw_sql_error_handling(self):
-        """Test raw SQL error handling"""
-        logger.info("🔍 Testing /raw/sql endpoint - Error handling...")
-        
-        # Test 4: Invalid SQL
-        invalid_request = {
-            "sql": "SELECT * FROM non_existent_table_12345"
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql", invalid_request)
-        logger.info(f"Invalid SQL result: {json.dumps(result, indent=2)}")
-        
-        if "error" in result:
-            logger.info("✅ Error handling working correctly")
-        else:
-            logger.error("❌ Error handling failed")
-        
-        return result
-    
-    async def test_raw_sql_write_simple(self):
-        """Test simple raw SQL write operations"""
-        logger.info("🔍 Testing /raw/sql/write endpoint - Simple write operations...")
-        
-        # Test 5: Simple write operation (CREATE TEMP TABLE with IF NOT EXISTS)
-        write_request = {
-            "sql": "CREATE TEMP TABLE IF NOT EXISTS test_write_table_v2 (id TEXT, name TEXT)"
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql/write", write_request)
-        logger.info(f"Simple write result: {json.dumps(result, indent=2)}")
-        
-        if "error" not in result and result.get("success"):
-            logger.info("✅ Simple write operation successful")
-        else:
-            logger.error("❌ Simple write operation failed")
-        
-        return result
-    
-    async def test_raw_sql_write_with_parameters(self):
-        """Test raw SQL write operations with parameters"""
-        logger.info("🔍 Testing /raw/sql/write endpoint - Parameterized write operations...")
-        
-        # Test 6: Write operation with parameters (INSERT into temp table)
-        param_write_request = {
-            "sql": "INSERT INTO test_write_table_v2 (id, name) VALUES ($1, $2)",
-            "parameters": {
-                "1": "1",
-                "2": "test_value"
-            }
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql/write", param_write_request)
-        logger.info(f"Parameterized write result: {json.dumps(result, indent=2)}")
-        
-        if "error" not in result and result.get("success"):
-            logger.info("✅ Parameterized write operation successful")
-        else:
-            logger.error("❌ Parameterized write operation failed")
-        
-        return result
-    
-    async def test_raw_sql_write_error_handling(self):
-        """Test raw SQL write error handling"""
-        logger.info("🔍 Testing /raw/sql/write endpoint - Error handling...")
-        
-        # Test 7: Invalid write operation
-        invalid_write_request = {
-            "sql": "INSERT INTO non_existent_table (id, name) VALUES (1, 'test')"
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql/write", invalid_write_request)
-        logger.info(f"Invalid write result: {json.dumps(result, indent=2)}")
-        
-        if "error" in result:
-            logger.info("✅ Write error handling working correctly")
-        else:
-            logger.error("❌ Write error handling failed")
-        
-        return result
-    
-    async def test_raw_sql_security(self):
-        """Test raw SQL security features"""
-        logger.info("🔍 Testing /raw/sql endpoint - Security features...")
-        
-        # Test 8: Test SQL injection protection
-        injection_request = {
-            "sql": "SELECT * FROM users WHERE id = 1; DROP TABLE users; --"
-        }
-        
-        result = await self.make_request("POST", f"{RAW_BASE}/sql", injection_request)
-        logger.info(f"SQL injection test result: {json.dumps(result, indent=2)}")
-        
-        if "error" in result and "injection" in str(result).lower():
-            logger.info("✅ SQL injection protection working")
-        else:
-            logger.warning("⚠️ SQL injection protection may need review")
-        
-        return result
+    async def _run_concurrently(self, *coros):
+        """
+        Run coroutines concurrently; the first failure cancels the rest
+        
+        asyncio.TaskGroup (Python 3.11+) guarantees no test task outlives this
+        call; older interpreters fall back to asyncio.gather.
+        """
+        if not hasattr(asyncio, "TaskGroup"):
+            await asyncio.gather(*coros)
+            return
+        async with asyncio.TaskGroup() as tg:
+            for coro in coros:
+                tg.create_task(coro)
     
     async def run_all_raw_tests(self):
         """Run all raw SQL endpoint tests"""
@@ -249,28 +269,32 @@ class RawEndpointTester:
             # Test health first
             await self.test_health_check()
             
-            # Test raw SQL read operations
-            await self.test_raw_sql_simple()
-            await self.test_raw_sql_with_parameters()
-            await self.test_raw_sql_database_info()
-            await self.test_raw_sql_error_handling()
-            await self.test_raw_sql_security()
-            
-            # Test raw SQL write operations
-            await self.test_raw_sql_write_simple()
-            await self.test_raw_sql_write_with_parameters()
-            await self.test_raw_sql_write_error_handling()
+            # The read cases are independent of each other and of the writes, so
+            # they run concurrently alongside the (ordered) write sequence
+            await self._run_concurrently(
+                *(self._run_case(case) for case in _READ_CASES),
+                self._run_cases_in_order(_WRITE_CASES)
+            )
             
             logger.info("✅ All raw SQL endpoint tests completed!")
             
         except Exception as e:
-            logger.error(f"❌ Raw SQL test failed: {e}")
+            logger.error("❌ Raw SQL test failed: %s", e)
             raise
 
 async def main():
     """Main test function"""
-    async with RawEndpointTester() as tester:
-        await tester.run_all_raw_tests()
+    try:
+        async with RawEndpointTester() as tester:
+            await tester.run_all_raw_tests()
+    finally:
+        await close_session()
 
 if __name__ == "__main__":
+    try:
+        # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -4,8 +4,9 @@ Test the specific resumes.prompt case
 """
 
 import asyncio
-import aiohttp
-import json
+import orjson
+
+from test_raw_endpoints import close_session, get_session
 
 async def test_resumes_case():
     """Test the specific case mentioned by the user"""
@@ -27,23 +28,37 @@ async def test_resumes_case():
     print(f"Parameters: {test_case['parameters']}")
     
     try:
-        async with aiohttp.ClientSession() as session:
-            data = {
-                "sql": test_case['sql'],
-                "parameters": test_case['parameters']
-            }
-            
-            async with session.post(f"{base_url}/crud/raw-sql", json=data) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    print(f"✅ Success: {result.get('message', 'No message')}")
-                    print(f"📊 Rows returned: {result.get('row_count', 0)}")
-                else:
-                    error_text = await response.text()
-                    print(f"❌ Error ({response.status}): {error_text}")
-                    
+        session = get_session()
+        data = {
+            "sql": test_case['sql'],
+            "parameters": test_case['parameters']
+        }
+        
+        async with session.post(f"{base_url}/crud/raw-sql", data=orjson.dumps(data),
+                                headers={"Content-Type": "application/json"}) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                print(f"✅ Success: {result.get('message', 'No message')}")
+                print(f"📊 Rows returned: {result.get('row_count', 0)}")
+            else:
+                error_text = await response.text()
+                print(f"❌ Error ({response.status}): {error_text}")
+                
     except Exception as e:
         print(f"❌ Error testing SQL: {e}")
 
+async def main():
+    """Run the case and release the shared session"""
+    try:
+        await test_resumes_case()
+    finally:
+        await close_session()
+
 if __name__ == "__main__":
-    asyncio.run(test_resumes_case())
+    try:
+        # uvloop ships with uvicorn[standard]; fall back to the default loop without it
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(main())
@@ -0,0 +1,16 @@
+"""
+orjson-backed JSON helpers for the test suite
+
+httpx encodes json= bodies and decodes response.json() with the stdlib json
+module; the tests send and parse through orjson instead.
+"""
+
+import orjson
+
+def loads(content: bytes):
+    """Decode a response body"""
+    return orjson.loads(content)
+
+def dumps(body) -> bytes:
+    """Encode a request body, to be sent as content= with JSON_HEADERS"""
+    return orjson.dumps(body)
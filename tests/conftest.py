@@ -0,0 +1,75 @@
+"""
+Shared fixtures for the test suite
+
+One event loop, one asyncpg pool and one HTTP client serve the whole session;
+the pool is opened before the first test and closed once, after the last.
+"""
+
+import asyncio
+import random
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app.core.database import close_pool, get_pool
+from app.main import app
+from tests._json import dumps, loads
+from tests.payloads import JSON_HEADERS
+
+# Seconds to wait for the database before skipping the session
+DB_PROBE_TIMEOUT = 2.0
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the session, so the asyncpg pool bound to it can be reused"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def pool():
+    """Open the shared pool before the first test and close it once, after the last
+
+    If the database cannot be reached within DB_PROBE_TIMEOUT every test is skipped,
+    instead of each one waiting out asyncpg's connect timeout.
+    """
+    try:
+        await asyncio.wait_for(get_pool(), timeout=DB_PROBE_TIMEOUT)
+    except Exception as e:
+        pytest.skip(f"Database unreachable: {e!r}")
+    yield
+    await close_pool()
+
+@pytest.fixture(scope="session")
+def transport():
+    """In-process ASGI transport; app exceptions surface in the test instead of as 500s"""
+    return ASGITransport(app=app, raise_app_exceptions=True)
+
+@pytest_asyncio.fixture(scope="session")
+async def client(transport):
+    """Async client for testing, shared by every test in the session"""
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+@pytest_asyncio.fixture(scope="session")
+async def sample_doc_id(client):
+    """Id of one document created for the session, for tests that read or update an existing record"""
+    body = dumps({"data": {"content": "Session sample document"}})
+    response = await client.post("/crud/public/documents", content=body, headers=JSON_HEADERS)
+    assert response.status_code == 200
+    record_id = loads(response.content)["id"]
+    yield record_id
+    await client.delete(f"/crud/public/documents/{record_id}")
+
+@pytest.fixture
+def unique_doc_id():
+    """A random document id far above the serial range, so upsert tests never share a row"""
+    return random.randint(10**8, 10**9)
+
+@pytest_asyncio.fixture
+async def dirty_db():
+    """Opt-in reset for tests that leave session state (e.g. temp tables) on pooled connections"""
+    yield
+    await close_pool()
+    await get_pool()
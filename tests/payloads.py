@@ -0,0 +1,29 @@
+"""
+Request bodies shared by the test modules
+
+Bodies that never change are serialized once at import time and sent as raw
+content, instead of rebuilding and re-encoding the same dict on every call.
+"""
+
+from tests._json import dumps
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+COUNT_SQL = "SELECT COUNT(*) as total FROM documents"
+
+# POST /raw/sql
+COUNT_SQL_BODY = dumps({"sql": COUNT_SQL, "parameters": {}})
+
+# POST /crud/prepared/select
+PREPARED_COUNT_BODY = dumps({"sql": COUNT_SQL, "parameters": {}, "operation_type": "read"})
+
+# POST /crud/prepared/validate
+VALIDATE_SQL_BODY = dumps({
+    "sql": "SELECT * FROM documents WHERE id = $1",
+    "parameters": {"1": "1"},
+    "operation_type": "read"
+})
+
+# POST /crud/public/documents
+CREATE_DOC_CONTENT = "Test document from pytest"
+CREATE_DOC_BODY = dumps({"data": {"content": CREATE_DOC_CONTENT}})
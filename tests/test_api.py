@@ -0,0 +1,91 @@
+"""
+Smoke tests for the read-only API endpoints
+
+Every endpoint is requested once, concurrently, and each response is checked by
+its own parametrized case.
+"""
+
+import pytest
+import pytest_asyncio
+import asyncio
+from app.main import app
+from app.core.config import settings
+from tests._json import loads
+
+# Read-only endpoints fetched together, once, for the tests that check them
+STATUS_PATHS = (
+    "/", "/health", "/admin/health", "/admin/test-connection", "/admin/db-info",
+    "/admin/databases", "/admin/schemas", "/admin/tables", "/admin/tables/public"
+)
+
+@pytest_asyncio.fixture(scope="module")
+async def status_responses(client):
+    """Responses of the read-only endpoints, requested concurrently"""
+    responses = await asyncio.gather(*(client.get(path) for path in STATUS_PATHS))
+    return dict(zip(STATUS_PATHS, responses))
+
+def _check_root(data):
+    assert data["message"] == "Database Service API"
+    assert data["version"] == app.version
+    assert "features" in data
+    assert "admin" in data["features"]
+    assert "crud" in data["features"]
+    assert "raw_sql" in data["features"]
+    assert "prepared_sql" in data["features"]
+
+def _check_health(data):
+    assert data["status"] == "healthy"
+    assert data["version"] == app.version
+    assert "detailed_health" in data
+
+def _check_admin_health(data):
+    assert data["status"] == "healthy"
+    assert data["database"] == "connected"
+    assert data["pgbouncer_host"] == settings.PGBOUNCER_HOST
+    assert data["pgbouncer_port"] == settings.PGBOUNCER_PORT
+
+def _check_connection_test(data):
+    assert data["status"] == "success"
+    assert "details" in data
+    
+    details = data["details"]
+    assert details["status"] == "connected"
+    assert details["write_test"] == "passed"
+
+def _check_db_info(data):
+    assert "version" in data
+    assert "database" in data
+    assert "user" in data
+    assert data["host"] == settings.PGBOUNCER_HOST
+    assert data["port"] == settings.PGBOUNCER_PORT
+
+def _check_list(key):
+    def check(data):
+        assert key in data
+        assert isinstance(data[key], list)
+    return check
+
+class TestAPIEndpoints:
+    """Test API endpoints"""
+    
+    @pytest.mark.parametrize("path, check", [
+        ("/", _check_root),
+        ("/health", _check_health),
+        ("/admin/health", _check_admin_health),
+        ("/admin/test-connection", _check_connection_test),
+        ("/admin/db-info", _check_db_info),
+        ("/admin/databases", _check_list("databases")),
+        ("/admin/schemas", _check_list("schemas")),
+        ("/admin/tables", _check_list("tables")),
+        ("/admin/tables/public", _check_list("tables"))
+    ], ids=["root", "health", "admin-health", "test-connection", "db-info",
+            "databases", "schemas", "tables", "tables-by-schema"])
+    async def test_get_endpoint(self, status_responses, path, check):
+        """Test the read-only GET endpoints against their shared, concurrently fetched responses"""
+        response = status_responses[path]
+        assert response.status_code == 200
+        check(loads(response.content))
+
+if __name__ == "__main__":
+    # Run tests manually
+    pytest.main([__file__, "-v"])
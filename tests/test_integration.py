@@ -7,90 +7,54 @@ including complex workflows and edge cases.
 
 import pytest
 import asyncio
-import json
-from httpx import AsyncClient
-from app.main import app
-from app.core.database import test_connection, get_pool_stats, close_pool
-from app.core.config import settings
+import hashlib
+import logging
+import time
+from app.core.database import get_pool_stats
+from tests._json import dumps, loads
+from tests.payloads import JSON_HEADERS, COUNT_SQL_BODY, PREPARED_COUNT_BODY, VALIDATE_SQL_BODY
 
-@pytest.fixture
-async def client():
-    """Async client for testing"""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+log = logging.getLogger(__name__)
 
-@pytest.fixture(autouse=True)
-async def cleanup():
-    """Cleanup after tests"""
-    yield
-    await close_pool()
-
-class TestServiceIntegration:
-    """Test complete service integration and workflows"""
-    
-    @pytest.mark.asyncio
-    async def test_service_startup_and_health(self, client):
-        """Test complete service startup and health check workflow"""
-        # Test root endpoint
-        response = await client.get("/")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["version"] == "2.1.0"
-        assert "features" in data
-        
-        # Test basic health
-        response = await client.get("/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        
-        # Test detailed admin health
-        response = await client.get("/admin/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["database"] == "connected"
+async def create_documents(client, content_prefix, count=3):
+    """Insert test documents with one INSERT statement and return their ids, newest first"""
+    response = await client.post("/raw/sql/write", content=dumps({
+        "sql": "INSERT INTO documents (content) SELECT $1 || ' ' || g FROM generate_series(0, $2::int - 1) g",
+        "parameters": {"1": content_prefix, "2": count}
+    }), headers=JSON_HEADERS)
+    assert response.status_code == 200
+    assert loads(response.content)["affected_rows"] == count
     
-    @pytest.mark.asyncio
-    async def test_database_metadata_workflow(self, client):
-        """Test complete database metadata exploration workflow"""
-        # Get database info
-        response = await client.get("/admin/db-info")
-        assert response.status_code == 200
-        db_info = response.json()
-        assert "version" in db_info
-        assert "database" in db_info
-        
-        # Get all databases
-        response = await client.get("/admin/databases")
-        assert response.status_code == 200
-        databases = response.json()
-        assert "databases" in databases
-        
-        # Get all schemas
-        response = await client.get("/admin/schemas")
-        assert response.status_code == 200
-        schemas = response.json()
-        assert "schemas" in schemas
-        
-        # Get all tables
-        response = await client.get("/admin/tables")
-        assert response.status_code == 200
-        tables = response.json()
-        assert "tables" in tables
-        
-        # Get tables by schema
-        response = await client.get("/admin/tables/public")
-        assert response.status_code == 200
-        schema_tables = response.json()
-        assert "tables" in schema_tables
+    # /raw/sql/write does not return RETURNING rows, so the ids are read back
+    return await find_documents(client, content_prefix, count)
+
+async def find_documents(client, content_prefix, count):
+    """Ids of the newest documents whose content starts with content_prefix, newest first
+
+    Matching on content rather than taking the newest rows keeps this correct while
+    another test worker inserts documents at the same time.
+    """
+    response = await client.post("/raw/sql", content=dumps({
+        "sql": "SELECT id FROM documents WHERE content LIKE $1 ORDER BY id DESC LIMIT $2",
+        "parameters": {"1": f"{content_prefix} %", "2": count}
+    }), headers=JSON_HEADERS)
+    assert response.status_code == 200
+    return [row["id"] for row in loads(response.content)["data"]]
+
+async def delete_documents(client, record_ids):
+    """Remove test documents with a single DELETE statement"""
+    response = await client.post("/raw/sql/write", content=dumps({
+        "sql": "DELETE FROM documents WHERE id = ANY($1)",
+        "parameters": {"1": record_ids}
+    }), headers=JSON_HEADERS)
+    assert response.status_code == 200
+    assert loads(response.content)["affected_rows"] == len(record_ids)
 
 class TestCRUDWorkflow:
     """Test complete CRUD workflow scenarios"""
     
-    @pytest.mark.asyncio
     async def test_complete_crud_workflow(self, client):
-        """Test complete CRUD workflow: Create -> Read -> Update -> Delete"""
+        """Test complete CRUD workflow: Create -> Update -> Delete"""
         # 1. Create a record
         create_data = {
             "data": {
@@ -98,65 +62,44 @@ class TestCRUDWorkflow:
             }
         }
         
-        response = await client.post("/crud/public/documents", json=create_data)
+        response = await client.post("/crud/public/documents", content=dumps(create_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        created_record = response.json()
+        created_record = loads(response.content)
         record_id = created_record["id"]
         assert created_record["data"]["content"] == "Integration test document"
         
-        # 2. Read the created record
-        response = await client.get(f"/crud/public/documents/{record_id}")
-        assert response.status_code == 200
-        read_record = response.json()
-        assert read_record["id"] == record_id
-        assert read_record["data"]["content"] == "Integration test document"
-        
-        # 3. Update the record
+        # 2. Update the record
         update_data = {
             "data": {
                 "content": "Updated integration test document"
             }
         }
         
-        response = await client.put(f"/crud/public/documents/{record_id}", json=update_data)
+        response = await client.put(f"/crud/public/documents/{record_id}", content=dumps(update_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        updated_record = response.json()
+        updated_record = loads(response.content)
+        assert updated_record["id"] == record_id
         assert updated_record["data"]["content"] == "Updated integration test document"
         
-        # 4. Verify the update
-        response = await client.get(f"/crud/public/documents/{record_id}")
-        assert response.status_code == 200
-        verify_record = response.json()
-        assert verify_record["data"]["content"] == "Updated integration test document"
-        
-        # 5. Delete the record
+        # 3. Delete the record
         response = await client.delete(f"/crud/public/documents/{record_id}")
         assert response.status_code == 200
-        delete_result = response.json()
+        delete_result = loads(response.content)
         assert "message" in delete_result
         assert "deleted_record" in delete_result
         
-        # 6. Verify deletion
+        # 4. Verify deletion
         response = await client.get(f"/crud/public/documents/{record_id}")
         assert response.status_code == 404
     
-    @pytest.mark.asyncio
     async def test_crud_pagination_and_ordering(self, client):
         """Test CRUD operations with pagination and ordering"""
-        # Create multiple test records
-        for i in range(3):
-            create_data = {
-                "data": {
-                    "content": f"Pagination test document {i}"
-                }
-            }
-            response = await client.post("/crud/public/documents", json=create_data)
-            assert response.status_code == 200
+        created_ids = await create_documents(client, "Pagination test document")
         
         # Test pagination
         response = await client.get("/crud/public/documents?limit=2&offset=0")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert len(data["records"]) <= 2
         assert "count" in data
         assert "total_count" in data
@@ -164,17 +107,52 @@ class TestCRUDWorkflow:
         # Test ordering
         response = await client.get("/crud/public/documents?limit=5&order_by=id DESC")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "records" in data
         
-        # Clean up test records
-        for record in data["records"]:
-            if "Pagination test document" in record["data"]["content"]:
-                response = await client.delete(f"/crud/public/documents/{record['id']}")
-                assert response.status_code == 200
+        await delete_documents(client, created_ids)
     
-    @pytest.mark.asyncio
-    async def test_upsert_workflow(self, client):
+    async def test_crud_cursor_pagination(self, client):
+        """Test keyset pagination with opaque cursors"""
+        created_ids = await create_documents(client, "Cursor test document")
+        
+        # Walk forward one record at a time from the newest record
+        response = await client.get("/crud/public/documents?limit=1&order_by=id DESC")
+        assert response.status_code == 200
+        first_page = loads(response.content)
+        assert first_page["next_cursor"] is not None
+        assert first_page["prev_cursor"] is None
+        
+        response = await client.get(f"/crud/public/documents?limit=1&cursor={first_page['next_cursor']}")
+        assert response.status_code == 200
+        second_page = loads(response.content)
+        assert second_page["records"][0]["id"] < first_page["records"][0]["id"]
+        
+        # Walking back returns the first page again
+        response = await client.get(f"/crud/public/documents?limit=1&cursor={second_page['prev_cursor']}")
+        assert response.status_code == 200
+        assert loads(response.content)["records"][0]["id"] == first_page["records"][0]["id"]
+        
+        # Tampered cursors are rejected
+        response = await client.get(f"/crud/public/documents?cursor={first_page['next_cursor']}x")
+        assert response.status_code == 400
+        
+        await delete_documents(client, created_ids)
+    
+    async def test_ordering_without_id_column(self, client):
+        """Test order_by on a table without an id column falls back to ORDER BY/OFFSET"""
+        response = await client.get("/crud/information_schema/tables?order_by=table_name&limit=2")
+        assert response.status_code == 200
+        data = loads(response.content)
+        assert data["count"] == 2
+        assert data["next_cursor"] is None
+        
+        response = await client.get("/crud/public/documents?limit=1&order_by=id")
+        cursor = loads(response.content)["next_cursor"]
+        response = await client.get(f"/crud/information_schema/tables?cursor={cursor}")
+        assert response.status_code == 400
+    
+    async def test_upsert_workflow(self, client, unique_doc_id):
         """Test upsert (create or update) workflow"""
         # Test upsert with new ID
         upsert_data = {
@@ -183,93 +161,245 @@ class TestCRUDWorkflow:
             }
         }
         
-        response = await client.patch("/crud/public/documents/8888", json=upsert_data)
+        response = await client.patch(f"/crud/public/documents/{unique_doc_id}", content=dumps(upsert_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        upsert_result = response.json()
+        upsert_result = loads(response.content)
         assert upsert_result["operation"] == "created"
         assert upsert_result["record"]["data"]["content"] == "Upsert test document"
         
         # Test upsert with existing ID (update)
         upsert_data["data"]["content"] = "Updated upsert test document"
-        response = await client.patch("/crud/public/documents/8888", json=upsert_data)
+        response = await client.patch(f"/crud/public/documents/{unique_doc_id}", content=dumps(upsert_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        upsert_result = response.json()
+        upsert_result = loads(response.content)
         assert upsert_result["operation"] == "updated"
         assert upsert_result["record"]["data"]["content"] == "Updated upsert test document"
         
         # Clean up
-        response = await client.delete("/crud/public/documents/8888")
+        response = await client.delete(f"/crud/public/documents/{unique_doc_id}")
+        assert response.status_code == 200
+    
+    async def test_batch_workflow(self, client):
+        """Test batch create and update workflow"""
+        batch = [{"data": {"content": f"Batch test document {i}"}} for i in range(3)]
+        response = await client.post("/crud/public/documents:batch", content=dumps(batch), headers=JSON_HEADERS)
         assert response.status_code == 200
+        result = loads(response.content)
+        assert result["operation"] == "created"
+        assert result["count"] == 3
+        
+        # Ids come back in request order
+        created_ids = result["ids"]
+        assert len(created_ids) == 3
+        for i, record_id in enumerate(created_ids):
+            response = await client.get(f"/crud/public/documents/{record_id}")
+            assert loads(response.content)["data"]["content"] == f"Batch test document {i}"
+        
+        updates = [{"id": record_id, "data": {"content": "Batch updated"}} for record_id in created_ids]
+        response = await client.put("/crud/public/documents:batch", content=dumps(updates), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        result = loads(response.content)
+        assert result["count"] == 3
+        assert result["ids"] == created_ids
+        
+        for record_id in created_ids:
+            response = await client.get(f"/crud/public/documents/{record_id}")
+            assert response.status_code == 200
+            assert loads(response.content)["data"]["content"] == "Batch updated"
+        
+        # A missing ID rolls back the whole batch
+        updates.append({"id": 999999, "data": {"content": "Missing"}})
+        response = await client.put("/crud/public/documents:batch", content=dumps(updates), headers=JSON_HEADERS)
+        assert response.status_code == 404
+        
+        # Ids that are neither integers nor strings are rejected before reaching the database
+        response = await client.put("/crud/public/documents:batch", content=dumps([{"id": 1.5, "data": {"content": "x"}}]), headers=JSON_HEADERS)
+        assert response.status_code == 422
+        
+        # Empty batches are rejected
+        response = await client.post("/crud/public/documents:batch", content=dumps([]), headers=JSON_HEADERS)
+        assert response.status_code == 400
+        
+        # Clean up
+        for record_id in created_ids:
+            response = await client.delete(f"/crud/public/documents/{record_id}")
+            assert response.status_code == 200
 
 class TestSQLOperationsWorkflow:
     """Test SQL operations workflow scenarios"""
     
-    @pytest.mark.asyncio
-    async def test_raw_sql_workflow(self, client):
+    async def test_raw_sql_workflow(self, client, dirty_db):
         """Test raw SQL operations workflow"""
         # Test read operation
-        sql_data = {
-            "sql": "SELECT COUNT(*) as total FROM documents",
-            "parameters": {}
-        }
-        
-        response = await client.post("/raw/sql", json=sql_data)
+        response = await client.post("/raw/sql", content=COUNT_SQL_BODY, headers=JSON_HEADERS)
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "success" in data
         assert "data" in data
         assert isinstance(data["data"], list)
         
+        # Test native parameter binding, bound by key position
+        sql_data = {
+            "sql": "SELECT $1::int + 1 AS next, $2::bool AS flag",
+            "parameters": {"2": True, "1": 41}
+        }
+        
+        response = await client.post("/raw/sql", content=dumps(sql_data), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        assert loads(response.content)["data"] == [{"next": 42, "flag": True}]
+        
+        # Test addressing a registered statement by statement_id
+        sql = "SELECT $1::int * 2 AS doubled"
+        statement_id = hashlib.sha1(sql.encode()).hexdigest()
+        
+        response = await client.post("/raw/sql", content=dumps({"statement_id": statement_id, "parameters": {"1": 1}}), headers=JSON_HEADERS)
+        assert response.status_code == 404
+        
+        response = await client.post("/raw/sql", content=dumps({"sql": sql, "statement_id": statement_id, "parameters": {"1": 2}}), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        assert loads(response.content)["data"] == [{"doubled": 4}]
+        
+        response = await client.post("/raw/sql", content=dumps({"statement_id": statement_id, "parameters": {"1": 3}}), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        assert loads(response.content)["data"] == [{"doubled": 6}]
+        
+        response = await client.post("/raw/sql", content=dumps({"sql": sql, "statement_id": "0" * 40}), headers=JSON_HEADERS)
+        assert response.status_code == 400
+        
+        # Test streamed read operation
+        sql_data = {
+            "sql": "SELECT g AS n FROM generate_series(1, 1200) g"
+        }
+        
+        response = await client.post("/raw/sql/stream", content=dumps(sql_data), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        data = loads(response.content)
+        assert len(data) == 1200
+        assert data[-1] == {"n": 1200}
+        
         # Test write operation
         sql_data = {
             "sql": "CREATE TEMP TABLE IF NOT EXISTS integration_test (id TEXT, name TEXT)",
             "parameters": {}
         }
         
-        response = await client.post("/raw/sql/write", json=sql_data)
+        response = await client.post("/raw/sql/write", content=dumps(sql_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "success" in data
     
-    @pytest.mark.asyncio
     async def test_prepared_sql_workflow(self, client):
         """Test prepared SQL operations workflow"""
         # Test validation
+        response = await client.post("/crud/prepared/validate", content=VALIDATE_SQL_BODY, headers=JSON_HEADERS)
+        assert response.status_code == 200
+        data = loads(response.content)
+        assert data["valid"] == True
+        
+        # Test select operation
+        response = await client.post("/crud/prepared/select", content=PREPARED_COUNT_BODY, headers=JSON_HEADERS)
+        assert response.status_code == 200
+        data = loads(response.content)
+        assert "success" in data
+        assert "data" in data
+        
+        # Test positional (list) parameters
         sql_data = {
-            "sql": "SELECT * FROM documents WHERE id = $1",
-            "parameters": {"1": "1"},
-            "operation_type": "read"
+            "sql": "SELECT $1::int + $2::int as total",
+            "parameters": [2, 3]
         }
         
-        response = await client.post("/crud/prepared/validate", json=sql_data)
+        response = await client.post("/crud/prepared/select", content=dumps(sql_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] == True
+        data = loads(response.content)
+        assert data["data"] == [{"total": 5}]
+        assert data["parameters"] == [2, 3]
         
-        # Test select operation
+        # Test batch execution
         sql_data = {
-            "sql": "SELECT COUNT(*) as total FROM documents",
-            "parameters": {},
-            "operation_type": "read"
+            "sql": "INSERT INTO documents (content) VALUES ($1)",
+            "parameter_sets": [["executemany test document"]] * 3
         }
         
-        response = await client.post("/crud/prepared/select", json=sql_data)
+        response = await client.post("/crud/prepared/executemany", content=dumps(sql_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        data = response.json()
-        assert "success" in data
-        assert "data" in data
+        assert loads(response.content)["affected_rows"] == 3
+        
+        sql_data = {
+            "sql": "DELETE FROM documents WHERE content = $1",
+            "parameters": ["executemany test document"]
+        }
+        
+        response = await client.post("/crud/prepared/delete", content=dumps(sql_data), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        assert loads(response.content)["affected_rows"] == 3
+        
+        # Test pipeline execution
+        pipeline_data = {
+            "statements": [
+                {"sql": "INSERT INTO documents (content) VALUES ($1)", "parameters": ["pipeline test document"]},
+                {"sql": "UPDATE documents SET content = $1 WHERE content = $2",
+                 "parameters": ["pipeline test document 2", "pipeline test document"]},
+                {"sql": "DELETE FROM documents WHERE content = $1", "parameters": ["pipeline test document 2"]}
+            ]
+        }
+        
+        response = await client.post("/crud/prepared/pipeline", content=dumps(pipeline_data), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        assert loads(response.content)["results"] == [{"affected_rows": 1}] * 3
+        
+        # Reads would lose their rows in a pipeline, so they are rejected
+        pipeline_data = {"statements": [{"sql": "SELECT 1", "operation_type": "read"}]}
+        response = await client.post("/crud/prepared/pipeline", content=dumps(pipeline_data), headers=JSON_HEADERS)
+        assert response.status_code == 400
+        
+        # Test batched requests
+        batch_data = {
+            "requests": [
+                {"endpoint": "validate", "body": {"sql": "SELECT $1::int AS n", "parameters": [1]}},
+                {"endpoint": "select", "body": {"sql": "SELECT $1::int AS n", "parameters": [2]}},
+                {"endpoint": "execute", "body": {"sql": "DROP TABLE documents", "operation_type": "write"}}
+            ]
+        }
+        
+        response = await client.post("/crud/prepared/batch", content=dumps(batch_data), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        results = loads(response.content)["results"]
+        assert [result["status_code"] for result in results] == [200, 200, 400]
+        assert results[0]["body"]["valid"] is True
+        assert results[1]["body"]["data"] == [{"n": 2}]
         
         # Test statements listing
         response = await client.get("/crud/prepared/statements")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "statements" in data
         assert isinstance(data["statements"], list)
+    
+    async def test_prepared_sql_parameter_keys(self, client):
+        """Test dictionary parameters bind by key, not by key order"""
+        sql_data = {
+            "sql": "SELECT $1::int - $2::int as difference",
+            "parameters": {"2": 1, "1": 5}
+        }
+        
+        response = await client.post("/crud/prepared/select", content=dumps(sql_data), headers=JSON_HEADERS)
+        assert response.status_code == 200
+        assert loads(response.content)["data"] == [{"difference": 4}]
+        
+        # Keys that are not "1".."N" are rejected before reaching the database
+        sql_data["parameters"] = {"1": 5, "3": 1}
+        response = await client.post("/crud/prepared/select", content=dumps(sql_data), headers=JSON_HEADERS)
+        assert response.status_code == 400
+    
+    async def test_prepared_sql_clear_missing_statement(self, client):
+        """Test clearing a statement that is not cached returns 404"""
+        response = await client.delete("/crud/prepared/statements/not_a_cached_statement")
+        assert response.status_code == 404
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
     
-    @pytest.mark.asyncio
     async def test_invalid_endpoints(self, client):
         """Test invalid endpoint handling"""
         # Test non-existent table
@@ -284,7 +414,6 @@ class TestErrorHandling:
         response = await client.get("/crud/public/documents/999999")
         assert response.status_code == 404
     
-    @pytest.mark.asyncio
     async def test_invalid_sql_operations(self, client):
         """Test invalid SQL operation handling"""
         # Test invalid SQL
@@ -293,7 +422,7 @@ class TestErrorHandling:
             "parameters": {}
         }
         
-        response = await client.post("/raw/sql", json=sql_data)
+        response = await client.post("/raw/sql", content=dumps(sql_data), headers=JSON_HEADERS)
         assert response.status_code == 400
         
         # Test SQL injection attempt
@@ -302,14 +431,13 @@ class TestErrorHandling:
             "parameters": {}
         }
         
-        response = await client.post("/raw/sql", json=sql_data)
+        response = await client.post("/raw/sql", content=dumps(sql_data), headers=JSON_HEADERS)
         assert response.status_code == 400
     
-    @pytest.mark.asyncio
     async def test_invalid_parameters(self, client):
         """Test invalid parameter handling"""
         # Test missing required fields
-        response = await client.post("/crud/public/documents", json={})
+        response = await client.post("/crud/public/documents", content=dumps({}), headers=JSON_HEADERS)
         assert response.status_code == 422
         
         # Test invalid JSON
@@ -321,30 +449,35 @@ class TestErrorHandling:
 class TestPerformanceAndConcurrency:
     """Test performance and concurrency scenarios"""
     
-    @pytest.mark.asyncio
     async def test_concurrent_requests(self, client):
-        """Test handling of concurrent requests"""
-        # Create multiple concurrent requests
-        tasks = []
-        for i in range(5):
-            task = client.get("/admin/health")
-            tasks.append(task)
+        """Test handling of concurrent requests and their latency under load"""
+        # Create many concurrent requests, with at most 50 in flight at once
+        semaphore = asyncio.Semaphore(50)
+        
+        async def get_health():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get("/admin/health")
+                return time.perf_counter() - started, response
         
-        responses = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*(get_health() for _ in range(200)))
         
         # All requests should succeed
-        for response in responses:
+        for _, response in results:
             assert response.status_code == 200
-            data = response.json()
+            data = loads(response.content)
             assert data["status"] == "healthy"
+        
+        latencies = sorted(latency for latency, _ in results)
+        p50, p95, p99 = (latencies[int(q * len(latencies))] for q in (0.50, 0.95, 0.99))
+        log.debug("/admin/health latency p50=%.4fs p95=%.4fs p99=%.4fs", p50, p95, p99)
+        assert p95 < 0.5
     
-    @pytest.mark.asyncio
     async def test_connection_pool_handling(self, client):
         """Test connection pool handling"""
-        # Make multiple requests to test connection pool
-        for i in range(10):
-            response = await client.get("/admin/health")
-            assert response.status_code == 200
+        # Issue the requests together so they acquire pool connections in parallel
+        responses = await asyncio.gather(*(client.get("/admin/health") for _ in range(10)))
+        assert all(response.status_code == 200 for response in responses)
         
         # Test pool stats
         stats = await get_pool_stats()
@@ -354,7 +487,6 @@ class TestPerformanceAndConcurrency:
 class TestSecurityFeatures:
     """Test security features and validation"""
     
-    @pytest.mark.asyncio
     async def test_sql_injection_protection(self, client):
         """Test SQL injection protection"""
         # Test various SQL injection attempts
@@ -365,35 +497,41 @@ class TestSecurityFeatures:
             "1' UNION SELECT * FROM documents --"
         ]
         
-        for injection in injection_attempts:
-            sql_data = {
+        # The attempts are sent together, which also checks concurrent rejections do not interfere
+        responses = await asyncio.gather(*(
+            client.post("/raw/sql", content=dumps({
                 "sql": f"SELECT * FROM documents WHERE content = '{injection}'",
                 "parameters": {}
-            }
-            
-            response = await client.post("/raw/sql", json=sql_data)
+            }), headers=JSON_HEADERS)
+            for injection in injection_attempts
+        ))
+        for response in responses:
             # Should either succeed safely (no results) or fail with validation error
             assert response.status_code in [200, 400]
     
-    @pytest.mark.asyncio
     async def test_parameter_validation(self, client):
         """Test parameter validation"""
         # Test with valid parameters
         sql_data = {
             "sql": "SELECT * FROM documents WHERE id = $1",
-            "parameters": {"1": "1"}
+            "parameters": {"1": 1}
         }
         
-        response = await client.post("/raw/sql", json=sql_data)
+        response = await client.post("/raw/sql", content=dumps(sql_data), headers=JSON_HEADERS)
         assert response.status_code == 200
         
+        # Values are bound natively, so a string for an integer column is rejected
+        sql_data["parameters"] = {"1": "1"}
+        response = await client.post("/raw/sql", content=dumps(sql_data), headers=JSON_HEADERS)
+        assert response.status_code == 400
+        
         # Test with missing parameters
         sql_data = {
             "sql": "SELECT * FROM documents WHERE id = $1",
             "parameters": {}
         }
         
-        response = await client.post("/raw/sql", json=sql_data)
+        response = await client.post("/raw/sql", content=dumps(sql_data), headers=JSON_HEADERS)
         assert response.status_code == 400
 
 if __name__ == "__main__":